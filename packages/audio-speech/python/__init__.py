@@ -1,21 +1,35 @@
 from .audio_speech import (
+    DEFAULT_SPEECH_COEFFICIENTS,
+    NUMPY_AVAILABLE,
+    SPEECH_FEATURES,
     AudioFeatureChunk,
     PcmChunk,
+    SpeechDurationModel,
     estimate_speech_seconds,
     extract_audio_features,
+    floats_to_s16_bytes,
     generate_silence_chunks,
     generate_tts_chunks,
+    s16_bytes_to_floats,
+    speech_features,
     trim_pcm_chunks,
     write_wav_file,
 )
 
 __all__ = [
+    "DEFAULT_SPEECH_COEFFICIENTS",
+    "NUMPY_AVAILABLE",
+    "SPEECH_FEATURES",
     "AudioFeatureChunk",
     "PcmChunk",
+    "SpeechDurationModel",
     "estimate_speech_seconds",
     "extract_audio_features",
+    "floats_to_s16_bytes",
     "generate_silence_chunks",
     "generate_tts_chunks",
+    "s16_bytes_to_floats",
+    "speech_features",
     "trim_pcm_chunks",
     "write_wav_file",
 ]
@@ -1,26 +1,120 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING, Union
 
 import base64
 import array
 import io
+import json
 import os
 from pathlib import Path
+import re
 import wave
 
+try:  # optional dependency
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
 if TYPE_CHECKING:
     from ai_kit_runtime import AiKitClient
 
 
-@dataclass
+_S16_SCALE = 1.0 / 32768.0
+
+
+def s16_bytes_to_floats(pcm: bytes) -> List[float]:
+    """Little-endian int16 PCM to floats in [-1, 1)."""
+    if len(pcm) % 2:
+        pcm = pcm[:-1]
+    if not pcm:
+        return []
+    if np is not None:
+        return (np.frombuffer(pcm, dtype="<i2").astype(np.float64) * _S16_SCALE).tolist()
+    data = array.array("h")
+    data.frombytes(pcm)
+    return [x * _S16_SCALE for x in data]
+
+
+def floats_to_s16_bytes(samples: Sequence[float]) -> bytes:
+    """Floats to little-endian int16 PCM, clamped to [-1, 1] and truncated like int(s * 32767)."""
+    if not len(samples):
+        return b""
+    if np is not None:
+        scaled = np.clip(np.asarray(samples, dtype=np.float64), -1.0, 1.0) * 32767
+        return scaled.astype("<i2").tobytes()
+    return array.array("h", [int(max(-1.0, min(1.0, s)) * 32767) for s in samples]).tobytes()
+
+
 class PcmChunk:
-    samples: List[float]
-    sample_rate_hz: int
-    seq: int
-    t0_ms: float
-    t1_ms: float
+    """Mono PCM window.
+
+    Decoded/TTS audio keeps its native int16 buffer (``pcm_s16``) and ``samples`` (floats) is only
+    materialized on first access, so the path from TTS to an s16 audio track never converts.
+    Chunks built from floats encode ``pcm_s16`` lazily the same way.
+    """
+
+    __slots__ = ("_samples", "_pcm_s16", "sample_rate_hz", "seq", "t0_ms", "t1_ms")
+
+    def __init__(
+        self,
+        samples: Optional[List[float]] = None,
+        sample_rate_hz: int = 16000,
+        seq: int = 0,
+        t0_ms: float = 0.0,
+        t1_ms: float = 0.0,
+        pcm_s16: Optional[bytes] = None,
+    ) -> None:
+        self._samples = samples if samples is not None or pcm_s16 is not None else []
+        self._pcm_s16 = pcm_s16
+        self.sample_rate_hz = sample_rate_hz
+        self.seq = seq
+        self.t0_ms = t0_ms
+        self.t1_ms = t1_ms
+
+    @property
+    def samples(self) -> List[float]:
+        if self._samples is None:
+            self._samples = s16_bytes_to_floats(self._pcm_s16 or b"")
+        return self._samples
+
+    @samples.setter
+    def samples(self, value: List[float]) -> None:
+        self._samples = value
+        self._pcm_s16 = None
+
+    @property
+    def pcm_s16(self) -> bytes:
+        if self._pcm_s16 is None:
+            self._pcm_s16 = floats_to_s16_bytes(self._samples or [])
+        return self._pcm_s16
+
+    @property
+    def sample_count(self) -> int:
+        if self._pcm_s16 is not None:
+            return len(self._pcm_s16) // 2
+        return len(self._samples or [])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PcmChunk):
+            return NotImplemented
+        return (
+            self.sample_rate_hz == other.sample_rate_hz
+            and self.seq == other.seq
+            and self.t0_ms == other.t0_ms
+            and self.t1_ms == other.t1_ms
+            and self.pcm_s16 == other.pcm_s16
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"PcmChunk(samples=<{self.sample_count}>, sample_rate_hz={self.sample_rate_hz}, "
+            f"seq={self.seq}, t0_ms={self.t0_ms}, t1_ms={self.t1_ms})"
+        )
 
 
 @dataclass
@@ -32,46 +126,311 @@ class AudioFeatureChunk:
     energy: float
 
 
-def estimate_speech_seconds(text: str, words_per_minute: int = 150) -> float:
+def estimate_speech_seconds(
+    text: str,
+    words_per_minute: int = 150,
+    model: Optional["SpeechDurationModel"] = None,
+    provider: str = "",
+    voice: Optional[str] = None,
+    speed: Optional[float] = None,
+) -> float:
+    if model is not None:
+        return model.estimate(text, provider=provider, voice=voice, speed=speed)
     words = len([w for w in (text or "").split() if w])
     if words == 0:
         return 0.0
     return words / max(1e-6, words_per_minute / 60)
 
 
+# Duration features: bias, words, syllables, digits, commas, sentence ends, newlines.
+SPEECH_FEATURES = ("bias", "words", "syllables", "digits", "commas", "sentences", "newlines")
+# Prior coefficients reproduce planning_control.estimate_speech_seconds (150 wpm plus pauses),
+# so an uncalibrated voice estimates exactly as before.
+DEFAULT_SPEECH_COEFFICIENTS = (0.0, 0.4, 0.0, 0.0, 0.18, 0.38, 0.5)
+
+_WORD_RE = re.compile(r"\S+")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s|$)")
+_NEWLINE_RE = re.compile(r"\n+")
+
+
+def _count_syllables(word: str) -> int:
+    count = 0
+    letters = []
+    for ch in word:
+        code = ord(ch)
+        if 0x3040 <= code <= 0x30FF or 0x4E00 <= code <= 0x9FFF or 0xAC00 <= code <= 0xD7AF:
+            count += 1  # kana, CJK ideographs and hangul are roughly one syllable each
+        elif ch.isalpha():
+            letters.append(ch.lower())
+    if letters:
+        latin = "".join(letters)
+        groups = len(_VOWEL_GROUP_RE.findall(latin))
+        if latin.endswith("e") and not latin.endswith(("le", "ee")) and groups > 1:
+            groups -= 1
+        count += max(1, groups)
+    return count
+
+
+def speech_features(text: str) -> List[float]:
+    cleaned = (text or "").strip()
+    if not cleaned:
+        return [0.0] * len(SPEECH_FEATURES)
+    words = _WORD_RE.findall(cleaned)
+    syllables = sum(_count_syllables(w) for w in words)
+    digits = sum(1 for ch in cleaned if ch.isdigit())
+    return [
+        1.0,
+        float(len(words)),
+        float(syllables),
+        float(digits),
+        float(cleaned.count(",")),
+        float(len(_SENTENCE_END_RE.findall(cleaned))),
+        float(len(_NEWLINE_RE.findall(cleaned))),
+    ]
+
+
+def _solve(matrix: List[List[float]], rhs: List[float]) -> Optional[List[float]]:
+    n = len(rhs)
+    aug = [row[:] + [rhs[i]] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(aug[r][col]))
+        if abs(aug[pivot][col]) < 1e-12:
+            return None
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        inv = 1.0 / aug[col][col]
+        for r in range(n):
+            if r != col and aug[r][col]:
+                factor = aug[r][col] * inv
+                row, src = aug[r], aug[col]
+                for c in range(col, n + 1):
+                    row[c] -= factor * src[c]
+    return [aug[i][n] / aug[i][i] for i in range(n)]
+
+
+def _pcm_duration_sec(audio: Union[float, Sequence[PcmChunk]]) -> float:
+    if isinstance(audio, (int, float)):
+        return float(audio)
+    total_ms = 0.0
+    for chunk in audio:
+        total_ms += chunk.t1_ms - chunk.t0_ms
+    return total_ms / 1000.0
+
+
+class _VoiceCalibration:
+    __slots__ = ("gram", "moment", "weights", "observations", "actual_sec", "baseline_abs_err", "model_abs_err", "baseline_overrun_sec", "model_overrun_sec")
+
+    def __init__(self, size: int) -> None:
+        self.gram = [[0.0] * size for _ in range(size)]
+        self.moment = [0.0] * size
+        self.weights: Optional[List[float]] = None
+        self.observations = 0
+        self.actual_sec = 0.0
+        self.baseline_abs_err = 0.0
+        self.model_abs_err = 0.0
+        self.baseline_overrun_sec = 0.0
+        self.model_overrun_sec = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "weights"}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], size: int) -> "_VoiceCalibration":
+        calib = cls(size)
+        for name in cls.__slots__:
+            if name in data and name != "weights":
+                setattr(calib, name, data[name])
+        return calib
+
+
+class SpeechDurationModel:
+    """Per (provider, voice, speed) linear speech-duration model calibrated from real TTS output.
+
+    Each voice keeps exponentially-forgotten normal equations over speech_features() and solves a
+    ridge regression pulled toward DEFAULT_SPEECH_COEFFICIENTS (scaled by 1/speed), so estimates
+    start at the fixed-rate heuristic and converge to the voice after a few utterances.
+    ``observe()`` also tracks how much synthesized audio ran past the estimate with the heuristic
+    versus the calibrated model; that overrun is what a budget-filled plan ends up trimming, and
+    report() exposes the difference as ``trimmed_audio_prevented_sec``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        prior_strength: float = 50.0,
+        forgetting: float = 0.995,
+        prior: Sequence[float] = DEFAULT_SPEECH_COEFFICIENTS,
+    ) -> None:
+        if path is None:
+            path = os.environ.get("SPEECH_DURATION_MODEL_PATH") or None
+        self.path = Path(path) if path else None
+        self.prior_strength = float(prior_strength)
+        self.forgetting = float(forgetting)
+        self.prior = tuple(float(w) for w in prior)
+        self._voices: Dict[str, _VoiceCalibration] = {}
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    @staticmethod
+    def voice_key(provider: str = "", voice: Optional[str] = None, speed: Optional[float] = None) -> str:
+        return f"{provider or ''}|{voice or ''}|{float(speed or 1.0):.2f}"
+
+    def _prior_for(self, key: str) -> List[float]:
+        speed = float(key.rsplit("|", 1)[1]) or 1.0
+        return [w / speed for w in self.prior]
+
+    def coefficients(self, provider: str = "", voice: Optional[str] = None, speed: Optional[float] = None) -> List[float]:
+        key = self.voice_key(provider, voice, speed)
+        calib = self._voices.get(key)
+        if calib is None or calib.observations == 0:
+            return self._prior_for(key)
+        if calib.weights is None:
+            prior = self._prior_for(key)
+            lam = self.prior_strength
+            matrix = [row[:] for row in calib.gram]
+            for i in range(len(matrix)):
+                matrix[i][i] += lam
+            rhs = [calib.moment[i] + lam * prior[i] for i in range(len(prior))]
+            calib.weights = _solve(matrix, rhs) or prior
+        return calib.weights
+
+    def estimate(self, text: str, provider: str = "", voice: Optional[str] = None, speed: Optional[float] = None) -> float:
+        features = speech_features(text)
+        if not features[1]:
+            return 0.0
+        weights = self.coefficients(provider, voice, speed)
+        return max(0.0, sum(w * x for w, x in zip(weights, features)))
+
+    def estimator(self, provider: str = "", voice: Optional[str] = None, speed: Optional[float] = None) -> Callable[[str], float]:
+        """Bound ``text -> seconds`` callable, e.g. for planning_control's ``speech_estimator``."""
+        return lambda text: self.estimate(text, provider=provider, voice=voice, speed=speed)
+
+    def observe(
+        self,
+        text: str,
+        audio: Union[float, Sequence[PcmChunk]],
+        provider: str = "",
+        voice: Optional[str] = None,
+        speed: Optional[float] = None,
+    ) -> float:
+        """Fold one synthesized utterance (PcmChunks or seconds) into the voice; returns the
+        pre-update estimate error in seconds (actual - estimate)."""
+        actual = _pcm_duration_sec(audio)
+        features = speech_features(text)
+        if actual <= 0 or not features[1]:
+            return 0.0
+        key = self.voice_key(provider, voice, speed)
+        predicted = self.estimate(text, provider, voice, speed)
+        baseline = max(0.0, sum(w * x for w, x in zip(self._prior_for(key), features)))
+        calib = self._voices.get(key)
+        if calib is None:
+            calib = self._voices[key] = _VoiceCalibration(len(features))
+        decay = self.forgetting
+        for i, xi in enumerate(features):
+            row = calib.gram[i]
+            for j, xj in enumerate(features):
+                row[j] = row[j] * decay + xi * xj
+            calib.moment[i] = calib.moment[i] * decay + xi * actual
+        calib.weights = None
+        calib.observations += 1
+        calib.actual_sec += actual
+        calib.baseline_abs_err += abs(actual - baseline)
+        calib.model_abs_err += abs(actual - predicted)
+        calib.baseline_overrun_sec += max(0.0, actual - baseline)
+        calib.model_overrun_sec += max(0.0, actual - predicted)
+        return actual - predicted
+
+    def report(self) -> Dict[str, Any]:
+        voices: Dict[str, Any] = {}
+        totals = {"observations": 0, "actual_sec": 0.0, "baseline_overrun_sec": 0.0, "model_overrun_sec": 0.0}
+        for key, calib in self._voices.items():
+            actual = calib.actual_sec or 1e-9
+            voices[key] = {
+                "observations": calib.observations,
+                "actual_sec": calib.actual_sec,
+                "baseline_error_pct": 100.0 * calib.baseline_abs_err / actual,
+                "model_error_pct": 100.0 * calib.model_abs_err / actual,
+                "trimmed_audio_prevented_sec": calib.baseline_overrun_sec - calib.model_overrun_sec,
+                "coefficients": dict(zip(SPEECH_FEATURES, self.coefficients(*key.split("|")[:2], float(key.rsplit("|", 1)[1])))),
+            }
+            totals["observations"] += calib.observations
+            totals["actual_sec"] += calib.actual_sec
+            totals["baseline_overrun_sec"] += calib.baseline_overrun_sec
+            totals["model_overrun_sec"] += calib.model_overrun_sec
+        totals["trimmed_audio_prevented_sec"] = totals["baseline_overrun_sec"] - totals["model_overrun_sec"]
+        return {"voices": voices, "totals": totals}
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> Optional[Path]:
+        dest = Path(path) if path else self.path
+        if dest is None:
+            return None
+        payload = {
+            "version": 1,
+            "features": list(SPEECH_FEATURES),
+            "voices": {key: calib.to_dict() for key, calib in self._voices.items()},
+        }
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, dest)
+        return dest
+
+    def load(self, path: Union[str, Path]) -> None:
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("features") != list(SPEECH_FEATURES):
+            return  # feature set changed; start from the prior again
+        size = len(SPEECH_FEATURES)
+        for key, data in (payload.get("voices") or {}).items():
+            self._voices[key] = _VoiceCalibration.from_dict(data, size)
+
+
 def generate_silence_chunks(duration_sec: float, sample_rate_hz: int = 16000, chunk_ms: int = 40) -> List[PcmChunk]:
     total_samples = int(duration_sec * sample_rate_hz)
     chunk_samples = max(1, int(sample_rate_hz * chunk_ms / 1000))
-    chunks: List[PcmChunk] = []
-    seq = 0
-    for start in range(0, total_samples, chunk_samples):
-        end = min(total_samples, start + chunk_samples)
-        samples = [0.0] * (end - start)
-        t0 = start / sample_rate_hz * 1000
-        t1 = end / sample_rate_hz * 1000
-        chunks.append(PcmChunk(samples=samples, sample_rate_hz=sample_rate_hz, seq=seq, t0_ms=t0, t1_ms=t1))
-        seq += 1
-    return chunks
+    return _chunks_from_s16(bytes(2 * max(0, total_samples)), sample_rate_hz, chunk_ms)
 
 
 def extract_audio_features(chunks: Iterable[PcmChunk], mel_bins: int = 80) -> List[AudioFeatureChunk]:
     features: List[AudioFeatureChunk] = []
     for chunk in chunks:
-        energy = 0.0 if not chunk.samples else sum(s * s for s in chunk.samples) / len(chunk.samples)
+        energy = _chunk_energy(chunk)
         mel = [min(1.0, energy)] * mel_bins
         features.append(AudioFeatureChunk(t0_ms=chunk.t0_ms, t1_ms=chunk.t1_ms, mel=mel, pitch_hz=0.0, energy=energy))
     return features
 
 
-def _chunks_from_samples(samples: List[float], sample_rate_hz: int, chunk_ms: int) -> List[PcmChunk]:
+def _chunk_energy(chunk: PcmChunk) -> float:
+    count = chunk.sample_count
+    if count == 0:
+        return 0.0
+    if np is not None and chunk._samples is None:
+        data = np.frombuffer(chunk.pcm_s16, dtype="<i2").astype(np.float64) * _S16_SCALE
+        return float(np.dot(data, data)) / count
+    return sum(s * s for s in chunk.samples) / count
+
+
+def _chunks_from_s16(pcm: bytes, sample_rate_hz: int, chunk_ms: int) -> List[PcmChunk]:
     chunk_samples = max(1, int(sample_rate_hz * chunk_ms / 1000))
+    total = len(pcm) // 2
+    view = memoryview(pcm)
     chunks: List[PcmChunk] = []
     seq = 0
-    for start in range(0, len(samples), chunk_samples):
-        end = min(len(samples), start + chunk_samples)
+    for start in range(0, total, chunk_samples):
+        end = min(total, start + chunk_samples)
         t0 = start / sample_rate_hz * 1000
         t1 = end / sample_rate_hz * 1000
-        chunks.append(PcmChunk(samples=samples[start:end], sample_rate_hz=sample_rate_hz, seq=seq, t0_ms=t0, t1_ms=t1))
+        chunks.append(
+            PcmChunk(
+                pcm_s16=view[start * 2 : end * 2].tobytes(),
+                sample_rate_hz=sample_rate_hz,
+                seq=seq,
+                t0_ms=t0,
+                t1_ms=t1,
+            )
+        )
         seq += 1
     return chunks
 
@@ -92,15 +451,12 @@ def trim_pcm_chunks(chunks: List[PcmChunk], max_duration_ms: float) -> List[PcmC
         keep_samples = int(remaining_ms / 1000.0 * chunk.sample_rate_hz)
         if keep_samples <= 0:
             break
-        trimmed.append(
-            PcmChunk(
-                samples=chunk.samples[:keep_samples],
-                sample_rate_hz=chunk.sample_rate_hz,
-                seq=chunk.seq,
-                t0_ms=chunk.t0_ms,
-                t1_ms=chunk.t0_ms + (keep_samples / chunk.sample_rate_hz * 1000.0),
-            )
-        )
+        t1_ms = chunk.t0_ms + (keep_samples / chunk.sample_rate_hz * 1000.0)
+        if chunk._samples is None:
+            samples, pcm_s16 = None, chunk.pcm_s16[: keep_samples * 2]
+        else:
+            samples, pcm_s16 = chunk._samples[:keep_samples], None
+        trimmed.append(PcmChunk(samples, chunk.sample_rate_hz, chunk.seq, chunk.t0_ms, t1_ms, pcm_s16=pcm_s16))
         break
     return trimmed
 
@@ -112,21 +468,26 @@ def _wav_bytes_to_chunks(wav_bytes: bytes, chunk_ms: int) -> List[PcmChunk]:
         width = wav.getsampwidth()
         frames = wav.readframes(wav.getnframes())
 
+    # Keep the first channel as int16; 32-bit input is narrowed to its high 16 bits.
     if width == 2:
-        data = array.array("h")
-        data.frombytes(frames)
-        samples = [x / 32768.0 for x in data]
+        if channels > 1:
+            if np is not None:
+                frames = np.frombuffer(frames, dtype="<i2")[::channels].tobytes()
+            else:
+                data = array.array("h")
+                data.frombytes(frames)
+                frames = data[::channels].tobytes()
     elif width == 4:
-        data = array.array("i")
-        data.frombytes(frames)
-        samples = [x / 2147483648.0 for x in data]
+        if np is not None:
+            frames = (np.frombuffer(frames, dtype="<i4")[::channels] >> 16).astype("<i2").tobytes()
+        else:
+            data = array.array("i")
+            data.frombytes(frames)
+            frames = array.array("h", [x >> 16 for x in data[::channels]]).tobytes()
     else:
         return []
 
-    if channels > 1:
-        samples = [samples[i] for i in range(0, len(samples), channels)]
-
-    return _chunks_from_samples(samples, sample_rate, chunk_ms)
+    return _chunks_from_s16(frames, sample_rate, chunk_ms)
 
 
 def _pcm_bytes_to_chunks(pcm_bytes: bytes, sample_rate_hz: int, chunk_ms: int) -> List[PcmChunk]:
@@ -134,10 +495,7 @@ def _pcm_bytes_to_chunks(pcm_bytes: bytes, sample_rate_hz: int, chunk_ms: int) -
         return []
     if len(pcm_bytes) % 2:
         pcm_bytes = pcm_bytes[:-1]
-    data = array.array("h")
-    data.frombytes(pcm_bytes)
-    samples = [x / 32768.0 for x in data]
-    return _chunks_from_samples(samples, sample_rate_hz, chunk_ms)
+    return _chunks_from_s16(pcm_bytes, sample_rate_hz, chunk_ms)
 
 
 def write_wav_file(chunks: Iterable[PcmChunk], dest: Path, sample_rate_hz: int = 16000) -> bool:
@@ -151,8 +509,7 @@ def write_wav_file(chunks: Iterable[PcmChunk], dest: Path, sample_rate_hz: int =
         wav_file.setsampwidth(2)
         wav_file.setframerate(sample_rate)
         for chunk in chunk_list:
-            pcm = array.array("h", [int(max(-1.0, min(1.0, s)) * 32767) for s in chunk.samples])
-            wav_file.writeframes(pcm.tobytes())
+            wav_file.writeframes(chunk.pcm_s16)
     return True
 
 
@@ -219,6 +576,7 @@ def generate_tts_chunks(
     speed: Optional[float] = None,
     instructions: Optional[str] = None,
     ai_kit_client: AiKitClient | None = None,
+    duration_model: Optional[SpeechDurationModel] = None,
 ) -> List[PcmChunk]:
     response_format = os.environ.get("TTS_RESPONSE_FORMAT", "").strip().lower() or "wav"
     parameters: dict[str, object] = {}
@@ -245,4 +603,6 @@ def generate_tts_chunks(
         chunk_ms=chunk_ms,
         ai_kit_client=ai_kit_client,
     )
+    if duration_model is not None and chunks:
+        duration_model.observe(text, chunks, provider=ai_kit_client.provider or "", voice=voice, speed=speed)
     return chunks
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""CPU per session-second of TTS audio on its way to an s16 audio track.
+
+``float`` replays the old route (decode to floats, features from floats, floats back to s16 bytes
+per chunk); ``s16`` keeps the decoded int16 buffer end to end (features vectorized from it, bytes
+passed straight through). Uses a synthetic 24 kHz WAV response.
+"""
+
+import argparse
+import io
+import math
+import sys
+import time
+import wave
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(root / "audio-speech" / "python"))
+
+from audio_speech import (  # noqa: E402
+    NUMPY_AVAILABLE,
+    _wav_bytes_to_chunks,
+    extract_audio_features,
+    floats_to_s16_bytes,
+)
+
+
+def synthetic_wav(seconds: float, sample_rate_hz: int) -> bytes:
+    count = int(seconds * sample_rate_hz)
+    frames = bytearray()
+    for i in range(count):
+        value = int(12000 * math.sin(2 * math.pi * 180 * i / sample_rate_hz) * (0.6 + 0.4 * math.sin(i / 4000)))
+        frames += value.to_bytes(2, "little", signed=True)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate_hz)
+        wav.writeframes(bytes(frames))
+    return buf.getvalue()
+
+
+def run_float(wav_bytes: bytes, chunk_ms: int) -> int:
+    total = 0
+    for chunk in _wav_bytes_to_chunks(wav_bytes, chunk_ms):
+        samples = chunk.samples
+        energy = sum(s * s for s in samples) / max(1, len(samples))
+        total += len(floats_to_s16_bytes(samples)) + int(energy)
+    return total
+
+
+def run_s16(wav_bytes: bytes, chunk_ms: int) -> int:
+    total = 0
+    for chunk in _wav_bytes_to_chunks(wav_bytes, chunk_ms):
+        extract_audio_features([chunk])
+        total += len(chunk.pcm_s16)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--chunk-ms", type=int, default=40)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    wav_bytes = synthetic_wav(args.seconds, args.sample_rate)
+    print(f"numpy: {NUMPY_AVAILABLE}")
+    for label, fn in (("float", run_float), ("s16", run_s16)):
+        best = float("inf")
+        for _ in range(args.repeats):
+            start = time.process_time()
+            fn(wav_bytes, args.chunk_ms)
+            best = min(best, time.process_time() - start)
+        print(f"{label:>6}: {best * 1000 / args.seconds:7.3f} ms CPU per session-second")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,13 +21,13 @@ class BackendCapabilities:
     supports_failover: bool
     provides_webRTC_stream: bool
 
-@dataclass
+@dataclass(slots=True)
 class ROITransform:
     crop_xywh: Tuple[float, float, float, float]
     affine_2x3: Optional[Tuple[float, float, float, float, float, float]] = None
     normalized_size: Optional[Tuple[int, int]] = None
 
-@dataclass
+@dataclass(slots=True)
 class FaceObservation:
     track_id: str
     bbox_xywh: Tuple[float, float, float, float]
@@ -36,8 +36,9 @@ class FaceObservation:
     mouth_roi: Optional[ROITransform] = None
     face_roi: Optional[ROITransform] = None
     occlusion_flags: List[str] = field(default_factory=list)
+    mouth_open: Optional[float] = None  # inner-lip gap / mouth width; None => occluded/unknown
 
-@dataclass
+@dataclass(slots=True)
 class FaceTrackResult:
     frame_id: str
     timestamp_ms: int
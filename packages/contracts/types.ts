@@ -35,6 +35,7 @@ export interface FaceObservation {
   mouth_roi?: ROITransform;
   face_roi?: ROITransform;
   occlusion_flags?: string[];
+  mouth_open?: number | null; // inner-lip gap / mouth width; null => occluded/unknown
 }
 
 export interface FaceTrackResult {
@@ -1,8 +1,11 @@
 from .delivery_playback import (
     AIORTC_MEDIA_AVAILABLE,
     MediaStreamController,
+    PacingScheduler,
+    PacingStream,
     QueueAudioTrack,
     QueueVideoTrack,
+    VideoFramePool,
     build_image_frame,
     build_solid_frame,
     load_image_planes,
@@ -15,8 +18,11 @@ from .delivery_playback import (
 __all__ = [
     "AIORTC_MEDIA_AVAILABLE",
     "MediaStreamController",
+    "PacingScheduler",
+    "PacingStream",
     "QueueAudioTrack",
     "QueueVideoTrack",
+    "VideoFramePool",
     "build_image_frame",
     "build_solid_frame",
     "load_image_planes",
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import array
 import asyncio
+import heapq
+import itertools
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from fractions import Fraction
 from pathlib import Path
+import sys
+import threading
 import time
-from typing import Callable, Iterable, Optional, Tuple
+import weakref
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Sequence, Tuple, Union
 
-from audio_speech import AudioFeatureChunk, PcmChunk, extract_audio_features
+from audio_speech import AudioFeatureChunk, PcmChunk, extract_audio_features, floats_to_s16_bytes
 
 try:  # optional dependency
     from aiortc import MediaStreamTrack
@@ -24,8 +30,7 @@ except Exception:
 
 
 def pcm_floats_to_s16_bytes(samples: list[float]) -> bytes:
-    pcm = array.array("h", [int(max(-1.0, min(1.0, s)) * 32767) for s in samples])
-    return pcm.tobytes()
+    return floats_to_s16_bytes(samples)
 
 
 def _silence_bytes(sample_count: int) -> bytes:
@@ -60,6 +65,82 @@ def build_image_frame(width: int, height: int, planes: Tuple[bytes, bytes, bytes
     return frame
 
 
+class VideoFramePool:
+    """Bounded LRU of prebuilt frames reused across video ticks.
+
+    Solid frames are keyed by (size, quantized luma) and anchor frames by (size, anchor planes), so
+    building a 720x1280 frame happens once per key instead of once per tick; QueueVideoTrack
+    rewrites the pts of pooled frames on every recv(). Pooled frames must be treated as read-only.
+    Keep one pool per track: an RTP sender encodes one frame at a time, but two senders sharing a
+    frame would race on its pts.
+
+    Each entry is a full yuv420p frame (width * height * 3 / 2 bytes), so a pool holds at most
+    ``max_frames`` of them: about 16.6 MB per session at 720x1280 with the defaults. The default
+    ``luma_step`` maps _luma_from_energy()'s 16..196 range onto 10 levels, which leaves room for
+    anchor frames without the LRU evicting solid frames during speech.
+    """
+
+    def __init__(self, max_frames: int = 12, luma_step: int = 20) -> None:
+        self.max_frames = max(1, max_frames)
+        self.luma_step = max(1, luma_step)
+        self._frames: "OrderedDict[Hashable, Tuple[VideoFrame, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def quantize_luma(self, luma: int) -> int:
+        step = self.luma_step
+        return max(16, min(235, 16 + int(round((luma - 16) / step)) * step))
+
+    def _get(self, key: Hashable) -> Optional["VideoFrame"]:
+        entry = self._frames.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._frames.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _put(self, key: Hashable, frame: "VideoFrame", keepalive: Any = None) -> "VideoFrame":
+        self._frames[key] = (frame, keepalive)
+        self.bytes += frame.width * frame.height * 3 // 2
+        while len(self._frames) > self.max_frames:
+            _, (old, _) = self._frames.popitem(last=False)
+            self.bytes -= old.width * old.height * 3 // 2
+            self.evictions += 1
+        return frame
+
+    def solid(self, width: int, height: int, luma: int = 16, chroma: int = 128) -> "VideoFrame":
+        luma = self.quantize_luma(luma)
+        key = ("solid", width, height, luma, chroma)
+        frame = self._get(key)
+        if frame is None:
+            frame = self._put(key, build_solid_frame(width, height, luma=luma, chroma=chroma))
+        return frame
+
+    def image(self, width: int, height: int, planes: Tuple[bytes, bytes, bytes]) -> "VideoFrame":
+        # Keyed by identity; the entry holds the planes so the id cannot be recycled while cached.
+        key = ("image", width, height, id(planes))
+        frame = self._get(key)
+        if frame is None:
+            frame = self._put(key, build_image_frame(width, height, planes), planes)
+        return frame
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "frames": len(self._frames),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        self._frames.clear()
+        self.bytes = 0
+
+
 def load_image_planes(image_path: Path, width: int, height: int) -> Optional[Tuple[bytes, bytes, bytes]]:
     if not AIORTC_MEDIA_AVAILABLE or VideoFrame is None:
         return None
@@ -92,6 +173,214 @@ def load_image_planes(image_path: Path, width: int, height: int) -> Optional[Tup
                 pass
 
 
+class PacingStream:
+    """One registered stream on a PacingScheduler; tracks how late its releases were."""
+
+    __slots__ = ("scheduler", "name", "releases", "late", "lateness_sum_ms", "max_lateness_ms", "__weakref__")
+
+    def __init__(self, scheduler: "PacingScheduler", name: str) -> None:
+        self.scheduler = scheduler
+        self.name = name
+        self.releases = 0
+        self.late = 0
+        self.lateness_sum_ms = 0.0
+        self.max_lateness_ms = 0.0
+
+    def now(self) -> float:
+        return self.scheduler.now()
+
+    def _record(self, lateness_s: float) -> None:
+        lateness_ms = max(0.0, lateness_s * 1000.0)
+        self.releases += 1
+        self.lateness_sum_ms += lateness_ms
+        if lateness_ms > self.max_lateness_ms:
+            self.max_lateness_ms = lateness_ms
+        if lateness_ms > self.scheduler.late_threshold_ms:
+            self.late += 1
+
+    async def sleep_until(self, deadline: float) -> None:
+        await self.scheduler.sleep_until(deadline, stream=self)
+
+    def close(self) -> None:
+        self.scheduler.unregister(self)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "releases": self.releases,
+            "late": self.late,
+            "mean_lateness_ms": self.lateness_sum_ms / self.releases if self.releases else 0.0,
+            "max_lateness_ms": self.max_lateness_ms,
+        }
+
+
+class PacingScheduler:
+    """Single deadline heap per event loop for pacing many media streams.
+
+    Instead of one ``asyncio.sleep`` timer per stream per frame, streams register deadlines here
+    and one loop timer releases every entry due within ``batch_ms`` of the head in a batch.
+    Deadlines use ``loop.time()``. Each wake-up's delay past its deadline is kept as a loop-lag
+    sample (last ``lag_samples``), and per-stream lateness is tracked on PacingStream.
+    """
+
+    # Normally kept as an attribute on the loop, so scheduler and loop are collected together; the
+    # weak map only serves loops that reject attributes (e.g. uvloop).
+    _LOOP_ATTR = "_delivery_pacing_scheduler"
+    _by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PacingScheduler]" = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        batch_ms: float = 2.0,
+        late_threshold_ms: float = 10.0,
+        lag_samples: int = 1024,
+    ) -> None:
+        self._loop_ref = weakref.ref(loop or asyncio.get_running_loop())
+        self.batch_s = batch_ms / 1000.0
+        self.late_threshold_ms = late_threshold_ms
+        # Held weakly: a stream goes away with the controller or track that registered it.
+        self.streams: "weakref.WeakValueDictionary[int, PacingStream]" = weakref.WeakValueDictionary()
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._armed_at = math.inf
+        self._lag = array.array("d", bytes(8 * max(1, lag_samples)))
+        self._lag_count = 0
+        self.batches = 0
+        self.released = 0
+        self.max_batch = 0
+
+    @classmethod
+    def for_loop(cls, loop: Optional[asyncio.AbstractEventLoop] = None) -> "PacingScheduler":
+        loop = loop or asyncio.get_running_loop()
+        scheduler = getattr(loop, cls._LOOP_ATTR, None) or cls._by_loop.get(loop)
+        if scheduler is None:
+            scheduler = cls(loop)
+            try:
+                setattr(loop, cls._LOOP_ATTR, scheduler)
+            except AttributeError:
+                cls._by_loop[loop] = scheduler
+        return scheduler
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop_ref()
+        if loop is None:
+            raise RuntimeError("PacingScheduler's event loop is gone")
+        return loop
+
+    def now(self) -> float:
+        return self.loop.time()
+
+    def register(self, name: str = "") -> PacingStream:
+        stream = PacingStream(self, name or f"stream-{len(self.streams)}")
+        self.streams[id(stream)] = stream
+        return stream
+
+    def unregister(self, stream: PacingStream) -> None:
+        self.streams.pop(id(stream), None)
+
+    def call_at(self, deadline: float, callback: Callable[..., Any], *args: Any, stream: Optional[PacingStream] = None) -> None:
+        heapq.heappush(self._heap, (deadline, next(self._seq), callback, args, stream))
+        if deadline < self._armed_at:
+            self._arm(deadline)
+
+    async def sleep_until(self, deadline: float, stream: Optional[PacingStream] = None) -> None:
+        lateness = self.loop.time() - deadline
+        if lateness >= 0:
+            # Already due (the producer is behind): no timer, just account for it.
+            if stream is not None:
+                stream._record(lateness)
+            return
+        future = self.loop.create_future()
+        self.call_at(deadline, _resolve_future, future, stream=stream)
+        await future
+
+    def _arm(self, deadline: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._armed_at = deadline
+        self._timer = self.loop.call_at(deadline, self._fire)
+
+    def _fire(self) -> None:
+        now = self.loop.time()
+        lag = self._lag
+        lag[self._lag_count % len(lag)] = max(0.0, now - self._armed_at)
+        self._lag_count += 1
+        self._timer = None
+        self._armed_at = math.inf
+        heap = self._heap
+        horizon = now + self.batch_s
+        released = 0
+        while heap and heap[0][0] <= horizon:
+            deadline, _, callback, args, stream = heapq.heappop(heap)
+            if stream is not None:
+                stream._record(now - deadline)
+            released += 1
+            try:
+                callback(*args)
+            except Exception:
+                self.loop.call_exception_handler({"message": "pacing callback failed", "exception": sys.exc_info()[1]})
+        if released:
+            self.batches += 1
+            self.released += released
+            if released > self.max_batch:
+                self.max_batch = released
+        if heap:
+            self._arm(heap[0][0])
+
+    def loop_lag_ms(self) -> Dict[str, float]:
+        count = min(self._lag_count, len(self._lag))
+        if not count:
+            return {"samples": 0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+        samples = sorted(self._lag[:count])
+        return {
+            "samples": count,
+            "p50": samples[count // 2] * 1000.0,
+            "p99": samples[min(count - 1, int(count * 0.99))] * 1000.0,
+            "max": samples[-1] * 1000.0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "streams": len(self.streams),
+            "pending": len(self._heap),
+            "batches": self.batches,
+            "released": self.released,
+            "mean_batch": self.released / self.batches if self.batches else 0.0,
+            "max_batch": self.max_batch,
+            "loop_lag_ms": self.loop_lag_ms(),
+            "late_streams": sum(1 for stream in list(self.streams.values()) if stream.late),
+        }
+
+
+def _resolve_future(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_ANCHOR_PLANES: "OrderedDict[Tuple[str, int, int, int], Tuple[bytes, bytes, bytes]]" = OrderedDict()
+_ANCHOR_PLANES_MAX = 8
+
+
+def _cached_image_planes(image_path: Path, width: int, height: int) -> Optional[Tuple[bytes, bytes, bytes]]:
+    # Same tuple object per (file version, size), so VideoFramePool.image() hits across turns.
+    try:
+        key = (str(image_path), image_path.stat().st_mtime_ns, width, height)
+    except OSError:
+        return None
+    planes = _ANCHOR_PLANES.get(key)
+    if planes is None:
+        planes = load_image_planes(image_path, width, height)
+        if planes is None:
+            return None
+        _ANCHOR_PLANES[key] = planes
+        while len(_ANCHOR_PLANES) > _ANCHOR_PLANES_MAX:
+            _ANCHOR_PLANES.popitem(last=False)
+    else:
+        _ANCHOR_PLANES.move_to_end(key)
+    return planes
+
+
 async def stream_pcm_chunks(
     media: "MediaStreamController",
     chunks: list["PcmChunk"],
@@ -100,16 +389,102 @@ async def stream_pcm_chunks(
 ) -> None:
     if not media or not media.available:
         return
-    start = time.monotonic()
+    pacer = media.pacing_stream()
+    start = pacer.now()
     for chunk in chunks:
-        media.enqueue_audio_samples(chunk.samples, chunk.sample_rate_hz)
+        await media.write_audio_samples(chunk.pcm_s16, chunk.sample_rate_hz)
         if not pacing:
             continue
-        target = chunk.t1_ms / 1000.0
-        elapsed = time.monotonic() - start
-        sleep_for = max(0.0, target - elapsed)
-        if sleep_for > 0:
-            await asyncio.sleep(min(sleep_for, 0.2))
+        await pacer.sleep_until(min(start + chunk.t1_ms / 1000.0, pacer.now() + 0.2))
+    media.end_audio()
+
+
+def _frame_seconds(frame, index: int, rate: float) -> float:
+    if frame.pts is not None and frame.time_base is not None:
+        return float(frame.pts * frame.time_base)
+    if frame.time is not None:
+        return float(frame.time)
+    return index / rate
+
+
+class _VideoFilePrefetcher:
+    """Decodes a video file on a worker thread into a bounded asyncio queue.
+
+    The thread blocks on the queue when ``prefetch`` frames are waiting, so decode runs at most
+    that far ahead of the consumer; ``close()`` stops it and unblocks a pending put.
+    """
+
+    _DONE = object()
+
+    def __init__(self, video_path: Path, prefetch: int, start_sec: float) -> None:
+        self.video_path = video_path
+        self.start_sec = max(0.0, start_sec)
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+        self._stop = threading.Event()
+        self._pending = None
+        self._thread = threading.Thread(target=self._run, name=f"video-decode:{video_path.name}", daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        if self._stop.is_set():
+            return False
+        try:
+            self._pending = asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop)
+            self._pending.result()
+        except Exception:
+            return False  # cancelled by close(), or the loop is gone
+        return not self._stop.is_set()
+
+    def _run(self) -> None:
+        import av  # type: ignore[import-not-found]
+
+        container = None
+        try:
+            container = av.open(str(self.video_path))
+            stream = next((s for s in container.streams if s.type == "video"), None)
+            if stream is None:
+                return
+            stream.thread_type = "AUTO"
+            rate = max(1.0, float(stream.average_rate or 30))
+            if self.start_sec > 0 and stream.time_base:
+                # Lands on the keyframe at or before start_sec; earlier frames are skipped below.
+                container.seek(int(self.start_sec / stream.time_base), stream=stream, backward=True)
+            index = 0
+            for frame in container.decode(stream):
+                ts = _frame_seconds(frame, index, rate)
+                index += 1
+                if ts + 1e-6 < self.start_sec:
+                    continue
+                if not self._put((frame, ts)):
+                    return
+        except Exception as exc:
+            self._put(exc)
+        finally:
+            if container is not None:
+                try:
+                    container.close()
+                except Exception:
+                    pass
+            # Every exit path (no video stream included) must end frames(); a no-op after close().
+            self._put(self._DONE)
+
+    async def frames(self):
+        while True:
+            item = await self._queue.get()
+            if item is self._DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def close(self) -> None:
+        self._stop.set()
+        pending = self._pending
+        if pending is not None:
+            pending.cancel()
+        while not self._queue.empty():
+            self._queue.get_nowait()
 
 
 async def stream_video_file(
@@ -117,7 +492,15 @@ async def stream_video_file(
     video_path: Path,
     *,
     pacing: bool = True,
+    start_sec: float = 0.0,
+    prefetch: int = 8,
 ) -> int:
+    """Decode ``video_path`` and enqueue its frames on ``media``, paced to their timestamps.
+
+    Decoding runs on a worker thread that keeps up to ``prefetch`` frames ready, so the event loop
+    only paces and enqueues; ``prefetch=0`` decodes inline on the loop. ``start_sec`` seeks before
+    streaming. Cancelling the task stops the decoder.
+    """
     if not media or not media.available:
         return 0
     if not video_path.exists():
@@ -127,31 +510,54 @@ async def stream_video_file(
     except Exception:
         return 0
 
+    if prefetch <= 0:
+        return await _stream_video_file_inline(media, video_path, av, pacing=pacing, start_sec=start_sec)
+
+    prefetcher = _VideoFilePrefetcher(video_path, prefetch, start_sec)
+    try:
+        pacer = media.pacing_stream()
+        start = pacer.now()
+        first_ts: Optional[float] = None
+        frame_count = 0
+        async for frame, ts in prefetcher.frames():
+            if not media.available:
+                break
+            if pacing:
+                if first_ts is None:
+                    first_ts = ts
+                await pacer.sleep_until(min(start + ts - first_ts, pacer.now() + 0.2))
+            media.enqueue_video_frame(frame)
+            frame_count += 1
+        return frame_count
+    finally:
+        prefetcher.close()
+
+
+async def _stream_video_file_inline(media: "MediaStreamController", video_path: Path, av, *, pacing: bool, start_sec: float) -> int:
     container = av.open(str(video_path))
     try:
         stream = next((s for s in container.streams if s.type == "video"), None)
         if not stream:
             return 0
-        start = time.monotonic()
+        rate = max(1.0, float(stream.average_rate or 30))
+        if start_sec > 0 and stream.time_base:
+            container.seek(int(start_sec / stream.time_base), stream=stream, backward=True)
+        pacer = media.pacing_stream()
+        start = pacer.now()
         first_ts: Optional[float] = None
         frame_count = 0
+        index = 0
         for frame in container.decode(stream):
             if not media.available:
                 break
+            ts = _frame_seconds(frame, index, rate)
+            index += 1
+            if ts + 1e-6 < start_sec:
+                continue
             if pacing:
-                if frame.pts is not None and frame.time_base is not None:
-                    ts = float(frame.pts * frame.time_base)
-                elif frame.time is not None:
-                    ts = float(frame.time)
-                else:
-                    ts = frame_count / max(1.0, float(stream.average_rate or 30))
                 if first_ts is None:
                     first_ts = ts
-                target = (ts - (first_ts or 0.0))
-                elapsed = time.monotonic() - start
-                sleep_for = max(0.0, target - elapsed)
-                if sleep_for > 0:
-                    await asyncio.sleep(min(sleep_for, 0.2))
+                await pacer.sleep_until(min(start + ts - first_ts, pacer.now() + 0.2))
             media.enqueue_video_frame(frame)
             frame_count += 1
         return frame_count
@@ -160,48 +566,198 @@ async def stream_video_file(
 
 
 class QueueAudioTrack(MediaStreamTrack):
+    """Mono s16 audio track that reframes arbitrary writes into fixed ``frame_ms`` frames.
+
+    Audio lands in a preallocated ring of ``queue_max`` frames. ``recv()`` paces itself to the
+    sample clock and always returns exactly ``frame_samples`` samples, padding with silence when
+    the ring runs short. ``await write()`` applies backpressure to producers until space frees up
+    (or ``write_timeout_s`` passes) while a consumer is draining the ring, i.e. ``recv()`` ran within
+    ``idle_timeout_s``; with no consumer it drops what does not fit right away, like the
+    synchronous ``enqueue()``. ``stats()`` reports underruns (short frames while a producer is mid-utterance, i.e.
+    wrote within ``idle_timeout_s`` and has not called ``mark_end()``) and overruns (dropped writes).
+    """
+
     kind = "audio"
 
     def __init__(
         self,
         sample_rate_hz: int = 16000,
-        frame_samples: int = 640,
+        frame_samples: Optional[int] = None,
         queue_max: int = 120,
         idle_timeout_s: float = 0.5,
+        frame_ms: int = 20,
+        write_timeout_s: float = 1.0,
     ) -> None:
         super().__init__()
-        self.sample_rate_hz = sample_rate_hz
-        self.frame_samples = frame_samples
         self.idle_timeout_s = idle_timeout_s
-        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=queue_max)
+        self.write_timeout_s = write_timeout_s
+        self.frame_ms = frame_ms
+        self.queue_max = max(2, queue_max)
+        self._fixed_frame_samples = frame_samples
+        self._space = asyncio.Event()
+        self._start: Optional[float] = None
+        self._pacer: Optional[PacingStream] = None
+        self._last_write = -math.inf
+        self._last_recv = -math.inf
+        self._open = False
         self._pts = 0
+        self.frames = 0
+        self.underruns = 0
+        self.silence_frames = 0
+        self.overruns = 0
+        self.dropped_samples = 0
+        self.write_waits = 0
+        self.max_buffered_samples = 0
+        self._allocate(sample_rate_hz)
+
+    def _allocate(self, sample_rate_hz: int) -> None:
+        self.sample_rate_hz = sample_rate_hz
+        self.frame_samples = self._fixed_frame_samples or max(1, sample_rate_hz * self.frame_ms // 1000)
+        self._frame_bytes = self.frame_samples * 2
+        self._capacity = self._frame_bytes * self.queue_max
+        self._ring = memoryview(bytearray(self._capacity))
+        self._scratch = memoryview(bytearray(self._frame_bytes))
+        self._read_pos = 0
+        self._size = 0
+
+    def _adopt_rate(self, sample_rate_hz: Optional[int]) -> None:
+        if sample_rate_hz and self._pts == 0 and self._size == 0 and sample_rate_hz != self.sample_rate_hz:
+            self._allocate(sample_rate_hz)
+
+    def _write_some(self, data: memoryview) -> int:
+        count = min(len(data), self._capacity - self._size)
+        if count <= 0:
+            return 0
+        pos = (self._read_pos + self._size) % self._capacity
+        first = min(count, self._capacity - pos)
+        self._ring[pos : pos + first] = data[:first]
+        if count > first:
+            self._ring[: count - first] = data[first:count]
+        self._size += count
+        self._last_write = time.monotonic()
+        self._open = True
+        buffered = self._size // 2
+        if buffered > self.max_buffered_samples:
+            self.max_buffered_samples = buffered
+        return count
+
+    def _drop(self, remaining: int) -> None:
+        self.overruns += 1
+        self.dropped_samples += remaining // 2
+
+    @staticmethod
+    def _even_view(pcm_bytes: bytes) -> memoryview:
+        view = memoryview(pcm_bytes).cast("B")
+        return view[: len(view) - len(view) % 2]
 
     def enqueue(self, pcm_bytes: bytes, sample_rate_hz: Optional[int] = None) -> None:
-        if sample_rate_hz and self._pts == 0 and sample_rate_hz != self.sample_rate_hz:
-            self.sample_rate_hz = sample_rate_hz
-        try:
-            self._queue.put_nowait(pcm_bytes)
-        except asyncio.QueueFull:
-            return
+        self._adopt_rate(sample_rate_hz)
+        data = self._even_view(pcm_bytes)
+        written = self._write_some(data)
+        if written < len(data):
+            self._drop(len(data) - written)
+
+    async def write(
+        self,
+        pcm_bytes: bytes,
+        sample_rate_hz: Optional[int] = None,
+        timeout_s: Optional[float] = None,
+    ) -> int:
+        """Write s16 audio, waiting for ring space; returns the samples accepted."""
+        self._adopt_rate(sample_rate_hz)
+        data = self._even_view(pcm_bytes)
+        total = len(data)
+        timeout = self.write_timeout_s if timeout_s is None else timeout_s
+        deadline = time.monotonic() + timeout
+        while True:
+            data = data[self._write_some(data) :]
+            if not data:
+                return total // 2
+            remaining = deadline - time.monotonic()
+            # Space only frees up while recv() drains the ring; without a consumer, fail fast.
+            if remaining <= 0 or not self._consumer_active():
+                self._drop(len(data))
+                return (total - len(data)) // 2
+            self.write_waits += 1
+            self._space.clear()
+            try:
+                await asyncio.wait_for(self._space.wait(), timeout=min(remaining, self.idle_timeout_s))
+            except asyncio.TimeoutError:
+                pass
+
+    def _consumer_active(self) -> bool:
+        return time.monotonic() - self._last_recv <= self.idle_timeout_s
+
+    def mark_end(self) -> None:
+        """Producer finished the utterance; the silence that follows is not an underrun."""
+        self._open = False
+
+    def clear(self) -> None:
+        """Drop buffered audio (e.g. on barge-in)."""
+        self._read_pos = 0
+        self._size = 0
+        self._space.set()
+
+    def _next_payload(self) -> memoryview:
+        frame_bytes = self._frame_bytes
+        count = min(self._size, frame_bytes)
+        pos = self._read_pos
+        if count == frame_bytes and pos + count <= self._capacity:
+            payload = self._ring[pos : pos + count]
+        else:
+            scratch = self._scratch
+            first = min(count, self._capacity - pos)
+            scratch[:first] = self._ring[pos : pos + first]
+            if count > first:
+                scratch[first:count] = self._ring[: count - first]
+            if count < frame_bytes:
+                scratch[count:] = _silence_bytes((frame_bytes - count) // 2)
+                if self._open and time.monotonic() - self._last_write <= self.idle_timeout_s:
+                    self.underruns += 1
+                if not count:
+                    self.silence_frames += 1
+            payload = scratch
+        self._read_pos = (pos + count) % self._capacity
+        self._size -= count
+        if count:
+            self._space.set()
+        return payload
+
+    def stats(self) -> Dict[str, float]:
+        rate = max(1, self.sample_rate_hz)
+        return {
+            "frames": self.frames,
+            "frame_samples": self.frame_samples,
+            "underruns": self.underruns,
+            "silence_frames": self.silence_frames,
+            "overruns": self.overruns,
+            "dropped_samples": self.dropped_samples,
+            "write_waits": self.write_waits,
+            "buffered_ms": self._size / 2 / rate * 1000.0,
+            "max_buffered_ms": self.max_buffered_samples / rate * 1000.0,
+        }
 
     async def recv(self) -> "AudioFrame":
         if not AIORTC_MEDIA_AVAILABLE or AudioFrame is None:
             raise RuntimeError("AudioFrame not available")
-        try:
-            pcm_bytes = await asyncio.wait_for(self._queue.get(), timeout=self.idle_timeout_s)
-        except asyncio.TimeoutError:
-            pcm_bytes = None
-
-        if pcm_bytes is None or len(pcm_bytes) < 2:
-            pcm_bytes = _silence_bytes(self.frame_samples)
-
-        sample_count = max(1, len(pcm_bytes) // 2)
-        frame = AudioFrame(format="s16", layout="mono", samples=sample_count)
+        scheduler = PacingScheduler.for_loop()
+        if self._pacer is None or self._pacer.scheduler is not scheduler:
+            self._pacer = scheduler.register(f"audio-track-{id(self):x}")
+            self._start = None
+        if self._start is None:
+            self._start = scheduler.now()
+        else:
+            await self._pacer.sleep_until(self._start + self._pts / self.sample_rate_hz)
+
+        self._last_recv = time.monotonic()
+        payload = self._next_payload()
+        frame = AudioFrame(format="s16", layout="mono", samples=self.frame_samples)
         frame.sample_rate = self.sample_rate_hz
         frame.pts = self._pts
         frame.time_base = Fraction(1, self.sample_rate_hz)
-        frame.planes[0].update(pcm_bytes)
-        self._pts += sample_count
+        frame.planes[0].update(payload)
+        self._pts += self.frame_samples
+        self.frames += 1
         return frame
 
 
@@ -215,18 +771,21 @@ class QueueVideoTrack(MediaStreamTrack):
         height: int = 1280,
         queue_max: int = 120,
         idle_timeout_s: float = 0.2,
+        frame_pool: Optional[VideoFramePool] = None,
     ) -> None:
         super().__init__()
         self.fps = fps
         self.width = width
         self.height = height
         self.idle_timeout_s = idle_timeout_s
-        self._queue: asyncio.Queue[Optional["VideoFrame"]] = asyncio.Queue(maxsize=queue_max)
+        self.frame_pool = frame_pool if frame_pool is not None else VideoFramePool()
+        self._queue: asyncio.Queue[Tuple["VideoFrame", bool]] = asyncio.Queue(maxsize=queue_max)
         self._pts = 0
 
-    def enqueue(self, frame: "VideoFrame") -> None:
+    def enqueue(self, frame: "VideoFrame", shared: bool = False) -> None:
+        """Queue a frame; ``shared`` frames (from the pool) get a fresh pts each time they go out."""
         try:
-            self._queue.put_nowait(frame)
+            self._queue.put_nowait((frame, shared))
         except asyncio.QueueFull:
             return
 
@@ -234,13 +793,11 @@ class QueueVideoTrack(MediaStreamTrack):
         if not AIORTC_MEDIA_AVAILABLE or VideoFrame is None:
             raise RuntimeError("VideoFrame not available")
         try:
-            frame = await asyncio.wait_for(self._queue.get(), timeout=self.idle_timeout_s)
+            frame, shared = await asyncio.wait_for(self._queue.get(), timeout=self.idle_timeout_s)
         except asyncio.TimeoutError:
-            frame = None
+            frame, shared = self.frame_pool.solid(self.width, self.height), True
 
-        if frame is None:
-            frame = build_solid_frame(self.width, self.height)
-        if frame.pts is None:
+        if shared or frame.pts is None:
             frame.pts = self._pts
         frame.time_base = Fraction(1, max(1, self.fps))
         self._pts += 1
@@ -255,25 +812,61 @@ class MediaStreamController:
     fps: int = 15
     width: int = 720
     height: int = 1280
+    frame_pool: Optional[VideoFramePool] = None
+    pacer: Optional[PacingStream] = None
 
     @classmethod
     def create(cls, fps: int = 15, width: int = 720, height: int = 1280) -> "MediaStreamController":
         if not AIORTC_MEDIA_AVAILABLE:
             return cls(audio_track=None, video_track=None, available=False, fps=fps, width=width, height=height)
         audio = QueueAudioTrack()
-        video = QueueVideoTrack(fps=fps, width=width, height=height)
-        return cls(audio_track=audio, video_track=video, available=True, fps=fps, width=width, height=height)
+        pool = VideoFramePool()
+        video = QueueVideoTrack(fps=fps, width=width, height=height, frame_pool=pool)
+        return cls(
+            audio_track=audio,
+            video_track=video,
+            available=True,
+            fps=fps,
+            width=width,
+            height=height,
+            frame_pool=pool,
+        )
 
-    def enqueue_audio_samples(self, samples: list[float], sample_rate_hz: int) -> None:
+    def enqueue_audio_samples(self, samples: Union[bytes, Sequence[float]], sample_rate_hz: int) -> None:
+        """Queue mono audio: s16 bytes (e.g. ``PcmChunk.pcm_s16``) pass straight through; floats are converted."""
         if not self.available or not self.audio_track:
             return
-        pcm_bytes = pcm_floats_to_s16_bytes(samples)
+        if isinstance(samples, (bytes, bytearray, memoryview)):
+            pcm_bytes = bytes(samples)
+        else:
+            pcm_bytes = pcm_floats_to_s16_bytes(samples)
         self.audio_track.enqueue(pcm_bytes, sample_rate_hz=sample_rate_hz)
 
-    def enqueue_video_frame(self, frame: "VideoFrame") -> None:
+    async def write_audio_samples(self, samples: Union[bytes, Sequence[float]], sample_rate_hz: int) -> None:
+        """Like enqueue_audio_samples(), but waits for audio-track buffer space instead of dropping."""
+        if not self.available or not self.audio_track:
+            return
+        if isinstance(samples, (bytes, bytearray, memoryview)):
+            pcm_bytes = bytes(samples)
+        else:
+            pcm_bytes = pcm_floats_to_s16_bytes(samples)
+        await self.audio_track.write(pcm_bytes, sample_rate_hz=sample_rate_hz)
+
+    def pacing_stream(self) -> PacingStream:
+        """This controller's stream on the running loop's shared PacingScheduler."""
+        scheduler = PacingScheduler.for_loop()
+        if self.pacer is None or self.pacer.scheduler is not scheduler:
+            self.pacer = scheduler.register(f"media-{id(self):x}")
+        return self.pacer
+
+    def end_audio(self) -> None:
+        if self.available and self.audio_track:
+            self.audio_track.mark_end()
+
+    def enqueue_video_frame(self, frame: "VideoFrame", shared: bool = False) -> None:
         if not self.available or not self.video_track:
             return
-        self.video_track.enqueue(frame)
+        self.video_track.enqueue(frame, shared=shared)
 
 
 def _luma_from_energy(energy: float) -> int:
@@ -299,11 +892,13 @@ async def stream_audio_video(
     frame_interval_ms = 1000.0 / max(1, fps)
     frame_count = 0
     features: list[AudioFeatureChunk] = []
-    start = time.monotonic()
+    pacer = media.pacing_stream() if media and media.available else None
+    scheduler = pacer.scheduler if pacer is not None else PacingScheduler.for_loop()
+    start = scheduler.now()
 
     anchor_planes = None
     if image_path:
-        anchor_planes = load_image_planes(Path(image_path), width, height)
+        anchor_planes = _cached_image_planes(Path(image_path), width, height)
 
     for chunk in chunks:
         feature_chunk = extract_audio_features([chunk])
@@ -311,7 +906,7 @@ async def stream_audio_video(
             features.extend(feature_chunk)
 
         if media and media.available:
-            media.enqueue_audio_samples(chunk.samples, chunk.sample_rate_hz)
+            await media.write_audio_samples(chunk.pcm_s16, chunk.sample_rate_hz)
 
         elapsed_ms = chunk.t1_ms
         target_frame_count = int(math.floor(elapsed_ms / frame_interval_ms))
@@ -319,12 +914,14 @@ async def stream_audio_video(
         energy = feature_chunk[0].energy if feature_chunk else 0.0
         for _ in range(new_frames):
             if media and media.available:
+                pool = media.frame_pool
+                if pool is None:
+                    pool = media.frame_pool = VideoFramePool()
                 if anchor_planes:
-                    frame = build_image_frame(width, height, anchor_planes)
+                    frame = pool.image(width, height, anchor_planes)
                 else:
-                    luma = _luma_from_energy(energy)
-                    frame = build_solid_frame(width, height, luma=luma)
-                media.enqueue_video_frame(frame)
+                    frame = pool.solid(width, height, luma=_luma_from_energy(energy))
+                media.enqueue_video_frame(frame, shared=True)
             frame_count += 1
 
         if progress_cb and total_ms > 0:
@@ -334,10 +931,9 @@ async def stream_audio_video(
 
         if pacing:
             chunk_duration = max(0.0, (chunk.t1_ms - chunk.t0_ms) / 1000.0)
-            elapsed = time.monotonic() - start
-            target = elapsed_ms / 1000.0
-            sleep_for = max(0.0, target - elapsed)
-            if sleep_for > 0:
-                await asyncio.sleep(min(sleep_for, chunk_duration))
+            deadline = min(start + elapsed_ms / 1000.0, scheduler.now() + chunk_duration)
+            await scheduler.sleep_until(deadline, stream=pacer)
 
+    if media and media.available:
+        media.end_audio()
     return features, frame_count
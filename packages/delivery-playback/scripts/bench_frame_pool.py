@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-tick VideoFrame construction vs VideoFramePool reuse.
+
+Simulates ``--sessions`` streams producing ``--fps`` frames for ``--seconds`` (energy-driven solid
+frames, or an anchor image with ``--anchor``) and reports CPU time per session-second for both
+paths. Requires PyAV.
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(root / "delivery-playback" / "python"))
+sys.path.insert(0, str(root / "audio-speech" / "python"))
+
+from delivery_playback import (  # noqa: E402
+    AIORTC_MEDIA_AVAILABLE,
+    VideoFramePool,
+    _luma_from_energy,
+    build_image_frame,
+    build_solid_frame,
+)
+
+
+def energy_at(session: int, tick: int) -> float:
+    return 0.05 * (1.0 + math.sin((tick + 7 * session) / 3.0))
+
+
+def run(sessions: int, frames: int, width: int, height: int, anchor, pooled: bool) -> float:
+    pools = [VideoFramePool() for _ in range(sessions)]
+    sink = None
+    start = time.process_time()
+    for tick in range(frames):
+        for session in range(sessions):
+            if anchor is not None:
+                sink = pools[session].image(width, height, anchor) if pooled else build_image_frame(width, height, anchor)
+            else:
+                luma = _luma_from_energy(energy_at(session, tick))
+                sink = pools[session].solid(width, height, luma=luma) if pooled else build_solid_frame(width, height, luma=luma)
+            sink.pts = tick
+    elapsed = time.process_time() - start
+    if pooled:
+        stats = pools[0].stats()
+        print(f"  pool[0]: frames={stats['frames']} bytes={stats['bytes']} hits={stats['hits']} misses={stats['misses']}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--width", type=int, default=720)
+    parser.add_argument("--height", type=int, default=1280)
+    parser.add_argument("--anchor", action="store_true", help="use an anchor image instead of solid frames")
+    args = parser.parse_args()
+    if not AIORTC_MEDIA_AVAILABLE:
+        sys.exit("PyAV/aiortc not installed")
+
+    anchor = None
+    if args.anchor:
+        y = bytes(range(256)) * (args.width * args.height // 256 + 1)
+        c = bytes([128]) * (args.width * args.height // 4)
+        anchor = (y[: args.width * args.height], c, c)
+    frames = int(args.fps * args.seconds)
+    session_seconds = args.sessions * args.seconds
+    for label, pooled in (("per-tick build", False), ("pooled", True)):
+        elapsed = run(args.sessions, frames, args.width, args.height, anchor, pooled)
+        print(f"{label:>15}: {elapsed * 1000 / session_seconds:8.2f} ms CPU per session-second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Pacing accuracy at session density: per-session asyncio.sleep vs the shared PacingScheduler.
+
+Runs ``--sessions`` concurrent streams of ``--frame-ms`` audio chunks for ``--seconds`` while a
+load task blocks the loop for ``--load-ms`` every ``--load-every-ms``. Reports release lateness
+(p50/p99/max), CPU time and, for the scheduler, its batch and loop-lag stats.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(root / "delivery-playback" / "python"))
+sys.path.insert(0, str(root / "audio-speech" / "python"))
+
+from delivery_playback import PacingScheduler  # noqa: E402
+
+
+async def per_session_sleep(frames: int, frame_s: float, lateness: list) -> None:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(1, frames + 1):
+        target = start + i * frame_s
+        sleep_for = target - loop.time()
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+        lateness.append(loop.time() - target)
+
+
+async def shared_scheduler(frames: int, frame_s: float, lateness: list) -> None:
+    pacer = PacingScheduler.for_loop().register()
+    start = pacer.now()
+    for i in range(1, frames + 1):
+        target = start + i * frame_s
+        await pacer.sleep_until(target)
+        lateness.append(pacer.now() - target)
+    pacer.close()
+
+
+async def load(stop: asyncio.Event, busy_s: float, every_s: float) -> None:
+    while not stop.is_set():
+        end = time.perf_counter() + busy_s
+        while time.perf_counter() < end:
+            pass
+        await asyncio.sleep(every_s)
+
+
+async def run(mode, sessions: int, frames: int, frame_s: float, busy_s: float, every_s: float) -> list:
+    stop = asyncio.Event()
+    load_task = asyncio.create_task(load(stop, busy_s, every_s)) if busy_s > 0 else None
+    lateness: list = []
+    await asyncio.gather(*(mode(frames, frame_s, lateness) for _ in range(sessions)))
+    stop.set()
+    if load_task is not None:
+        await load_task
+    if mode is shared_scheduler:
+        stats = PacingScheduler.for_loop().stats()
+        lag = stats["loop_lag_ms"]
+        print(
+            f"  scheduler: batches={stats['batches']} mean_batch={stats['mean_batch']:.1f} "
+            f"max_batch={stats['max_batch']} loop_lag p50={lag['p50']:.2f}ms p99={lag['p99']:.2f}ms"
+        )
+    return sorted(lateness)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--frame-ms", type=float, default=20.0)
+    parser.add_argument("--load-ms", type=float, default=2.0)
+    parser.add_argument("--load-every-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    frame_s = args.frame_ms / 1000.0
+    frames = int(args.seconds / frame_s)
+    for label, mode in (("per-session sleep", per_session_sleep), ("shared scheduler", shared_scheduler)):
+        cpu = time.process_time()
+        lateness = asyncio.run(run(mode, args.sessions, frames, frame_s, args.load_ms / 1000.0, args.load_every_ms / 1000.0))
+        cpu = time.process_time() - cpu
+        n = len(lateness)
+        pct = lambda q: lateness[min(n - 1, int(q * n))] * 1000.0  # noqa: E731
+        print(
+            f"{label:>18}: lateness p50={pct(0.5):.2f}ms p99={pct(0.99):.2f}ms max={lateness[-1] * 1000:.2f}ms "
+            f"cpu={cpu:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Event-loop lag while many sessions stream a video file, inline decode vs prefetching thread.
+
+Encodes a synthetic clip (or uses ``--clip``), runs ``--streams`` concurrent stream_video_file()
+calls with ``prefetch=0`` (decode on the loop) and with ``--prefetch`` frames decoded on worker
+threads, and prints a histogram of how late a 5 ms probe timer fires. Requires PyAV.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(root / "delivery-playback" / "python"))
+sys.path.insert(0, str(root / "audio-speech" / "python"))
+
+from delivery_playback import MediaStreamController, stream_video_file  # noqa: E402
+
+PROBE_S = 0.005
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+
+def write_clip(path: Path, seconds: float, width: int, height: int, fps: int) -> None:
+    import av
+    import numpy as np
+
+    container = av.open(str(path), mode="w")
+    stream = container.add_stream("libx264" if "libx264" in av.codecs_available else "mpeg4", rate=fps)
+    stream.width = width
+    stream.height = height
+    stream.pix_fmt = "yuv420p"
+    ys, xs = np.mgrid[0:height, 0:width]
+    for i in range(int(seconds * fps)):
+        img = np.stack([(xs + 4 * i) % 256, (ys + 2 * i) % 256, (xs + ys + i) % 256], axis=-1).astype(np.uint8)
+        for packet in stream.encode(av.VideoFrame.from_ndarray(img, format="rgb24")):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+
+
+async def probe(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_S)
+        lags.append((time.perf_counter() - start - PROBE_S) * 1000.0)
+
+
+async def run(clip: Path, streams: int, prefetch: int) -> list:
+    stop = asyncio.Event()
+    lags: list = []
+    probe_task = asyncio.create_task(probe(stop, lags))
+    media = [MediaStreamController(audio_track=None, video_track=None, available=True) for _ in range(streams)]
+    await asyncio.gather(*(stream_video_file(m, clip, prefetch=prefetch) for m in media))
+    stop.set()
+    await probe_task
+    return sorted(lags)
+
+
+def report(label: str, lags: list) -> None:
+    pct = lambda q: lags[min(len(lags) - 1, int(q * len(lags)))]  # noqa: E731
+    print(f"{label}: samples={len(lags)} p50={pct(0.5):.1f}ms p99={pct(0.99):.1f}ms max={lags[-1]:.1f}ms")
+    lower = 0.0
+    for upper in BUCKETS_MS + (float("inf"),):
+        count = sum(1 for lag in lags if lower <= lag < upper)
+        print(f"  {lower:>5.0f}-{upper:<5.0f}ms {'#' * min(60, count * 60 // max(1, len(lags)))} {count}")
+        lower = upper
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clip", type=Path)
+    parser.add_argument("--streams", type=int, default=20)
+    parser.add_argument("--prefetch", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    try:
+        import av  # noqa: F401
+    except Exception:
+        sys.exit("PyAV not installed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = args.clip
+        if clip is None:
+            clip = Path(tmp) / "clip.mp4"
+            write_clip(clip, args.seconds, 720, 1280, 30)
+        report("inline decode", asyncio.run(run(clip, args.streams, 0)))
+        report(f"prefetch={args.prefetch}", asyncio.run(run(clip, args.streams, args.prefetch)))
+
+
+if __name__ == "__main__":
+    main()
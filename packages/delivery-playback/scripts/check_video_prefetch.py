@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Behaviour check for stream_video_file's decode paths against a stand-in ``av`` module.
+
+Runs inline (``prefetch=0``) and prefetched decode over a synthetic clip and checks they agree on
+frame counts, seeking, files without a video stream, decode errors and cancellation (the worker
+thread must exit). Needs no PyAV: the stand-in replaces it for this process.
+"""
+
+import asyncio
+import sys
+import threading
+import types
+from fractions import Fraction
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(root / "delivery-playback" / "python"))
+sys.path.insert(0, str(root / "audio-speech" / "python"))
+
+FPS = 30
+CLIP_FRAMES = 90
+TIMEOUT_S = 5.0
+
+
+class _Frame:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.time_base = Fraction(1, FPS)
+        self.pts = index
+        self.time = None
+
+
+class _Stream:
+    average_rate = FPS
+    time_base = Fraction(1, FPS)
+    thread_type = None
+
+    def __init__(self, kind: str) -> None:
+        self.type = kind
+
+
+class _Container:
+    def __init__(self, path: str) -> None:
+        name = Path(path).name
+        self.streams = [_Stream("audio")] if name == "audio_only.mp4" else [_Stream("video")]
+        self.fail_at = 10 if name == "corrupt.mp4" else None
+        self.start = 0
+
+    def seek(self, offset: int, stream=None, backward: bool = True) -> None:
+        self.start = offset // FPS * FPS  # keyframe every second
+
+    def decode(self, stream):
+        for index in range(self.start, CLIP_FRAMES):
+            if index == self.fail_at:
+                raise RuntimeError("corrupt packet")
+            yield _Frame(index)
+
+    def close(self) -> None:
+        pass
+
+
+av = types.ModuleType("av")
+av.open = _Container
+sys.modules["av"] = av
+
+from delivery_playback import MediaStreamController, stream_video_file  # noqa: E402
+
+
+class _Collector(MediaStreamController):
+    def __init__(self) -> None:
+        super().__init__(audio_track=None, video_track=None, available=True)
+        self.indices: list = []
+
+    def enqueue_video_frame(self, frame, shared: bool = False) -> None:
+        self.indices.append(frame.index)
+
+
+async def _stream(name: str, prefetch: int, **kwargs):
+    media = _Collector()
+    try:
+        count = await asyncio.wait_for(
+            stream_video_file(media, Path(__file__).with_name(name), pacing=False, prefetch=prefetch, **kwargs),
+            TIMEOUT_S,
+        )
+    except asyncio.TimeoutError:
+        return "timeout", media.indices
+    except RuntimeError as exc:
+        return f"error: {exc}", media.indices
+    return count, media.indices
+
+
+def _decoder_threads() -> list:
+    return [thread.name for thread in threading.enumerate() if thread.name.startswith("video-decode")]
+
+
+async def _cancelled_threads() -> list:
+    task = asyncio.create_task(stream_video_file(_Collector(), Path(__file__)))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    await asyncio.sleep(0.1)
+    return _decoder_threads()
+
+
+def main() -> int:
+    # The stand-in keys off the file name only, but stream_video_file needs the path to exist.
+    cases = {
+        "full clip": dict(name=Path(__file__).name),
+        "seek to 1.5s": dict(name=Path(__file__).name, start_sec=1.5),
+        "no video stream": dict(name="audio_only.mp4"),
+        "decode error": dict(name="corrupt.mp4"),
+    }
+    failed = False
+    for label, kwargs in cases.items():
+        name = kwargs.pop("name")
+        path = Path(__file__).with_name(name)
+        created = not path.exists()
+        if created:
+            path.touch()
+        try:
+            inline = asyncio.run(_stream(name, 0, **kwargs))
+            prefetched = asyncio.run(_stream(name, 8, **kwargs))
+        finally:
+            if created:
+                path.unlink()
+        ok = inline == prefetched and "timeout" not in (inline[0], prefetched[0])
+        failed |= not ok
+        print(f"{label:>16}: inline={inline[0]} prefetch={prefetched[0]}  {'ok' if ok else 'FAIL'}")
+    leftover = asyncio.run(_cancelled_threads())
+    failed |= bool(leftover)
+    print(f"{'cancel':>16}: decoder threads left={len(leftover)}  {'FAIL' if leftover else 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
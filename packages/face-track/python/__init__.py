@@ -2,18 +2,40 @@ from .face_track import (
     FaceObservation,
     FaceTrackResult,
     HeuristicFaceTrackBackend,
+    INNER_LIP_PAIRS,
+    KalmanAxis,
+    MOUTH_CORNER_INDICES,
+    MOUTH_OCCLUSION_FLAGS,
+    MouthOpennessBuffer,
+    NUMPY_AVAILABLE,
     NoopFaceTrackBackend,
+    PredictiveROITracker,
+    ROICropEngine,
     ROITransform,
+    bbox_iou,
+    mouth_openness,
     roi_from_landmarks,
     smooth_roi,
+    solve_assignment,
 )
 
 __all__ = [
     "FaceObservation",
     "FaceTrackResult",
     "HeuristicFaceTrackBackend",
+    "INNER_LIP_PAIRS",
+    "KalmanAxis",
+    "MOUTH_CORNER_INDICES",
+    "MOUTH_OCCLUSION_FLAGS",
+    "MouthOpennessBuffer",
+    "NUMPY_AVAILABLE",
     "NoopFaceTrackBackend",
+    "PredictiveROITracker",
+    "ROICropEngine",
     "ROITransform",
+    "bbox_iou",
+    "mouth_openness",
     "roi_from_landmarks",
     "smooth_roi",
+    "solve_assignment",
 ]
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import array
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+try:  # optional dependency
+    import numpy as np
 
-@dataclass
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+
+@dataclass(slots=True)
 class ROITransform:
     crop_xywh: Tuple[float, float, float, float]
     affine_2x3: Optional[Tuple[float, float, float, float, float, float]] = None
@@ -39,7 +50,18 @@ def roi_from_landmarks(
     clamp_to: Optional[Dict[str, int]] = None,
 ) -> ROITransform:
     selected = [landmarks[i] for i in indices if i < len(landmarks)]
-    min_x, min_y, max_x, max_y = _bounds(selected)
+    x, y, w, h = _padded_xywh(*_bounds(selected), padding_ratio, clamp_to)
+    return _roi_from_xywh(x, y, w, h, normalized_size)
+
+
+def _padded_xywh(
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+    padding_ratio: float,
+    clamp_to: Optional[Dict[str, int]],
+) -> Tuple[float, float, float, float]:
     w0 = max(1.0, max_x - min_x)
     h0 = max(1.0, max_y - min_y)
     pad_x = w0 * padding_ratio
@@ -54,14 +76,46 @@ def roi_from_landmarks(
         y = max(0.0, min(y, clamp_to["height"] - 1))
         w = max(1.0, min(w, clamp_to["width"] - x))
         h = max(1.0, min(h, clamp_to["height"] - y))
+    return x, y, w, h
+
+
+def _flat_selector(indices: Sequence[int]) -> Any:
+    # Contiguous index runs (the default mouth/face sets) become strided slices of the flat array.
+    idx = list(indices)
+    if idx and idx == list(range(idx[0], idx[0] + len(idx))):
+        return slice(2 * idx[0], 2 * (idx[0] + len(idx)), 2)
+    return tuple(idx)
+
+
+def _flat_bounds(flat: Sequence[float], selector: Any) -> Tuple[float, float, float, float]:
+    if isinstance(selector, slice):
+        xs = flat[selector]
+        ys = flat[selector.start + 1 : selector.stop : 2]
+    else:
+        n = len(flat) // 2
+        xs = [flat[2 * i] for i in selector if i < n]
+        ys = [flat[2 * i + 1] for i in selector if i < n]
+    if not len(xs):
+        return 0.0, 0.0, 0.0, 0.0
+    return min(xs), min(ys), max(xs), max(ys)
 
+
+def _roi_from_xywh(x: float, y: float, w: float, h: float, normalized_size: Tuple[int, int]) -> ROITransform:
     W, H = normalized_size
-    scale_x = W / w
-    scale_y = H / h
+    scale_x = W / max(1e-6, w)
+    scale_y = H / max(1e-6, h)
     affine = (scale_x, 0.0, -x * scale_x, 0.0, scale_y, -y * scale_y)
     return ROITransform(crop_xywh=(x, y, w, h), affine_2x3=affine, normalized_size=normalized_size)
 
 
+def _ema_xywh(
+    prev: Tuple[float, float, float, float], nxt: Tuple[float, float, float, float], alpha: float
+) -> Tuple[float, float, float, float]:
+    a = max(0.0, min(1.0, alpha))
+    b = 1.0 - a
+    return (prev[0] * a + nxt[0] * b, prev[1] * a + nxt[1] * b, prev[2] * a + nxt[2] * b, prev[3] * a + nxt[3] * b)
+
+
 def smooth_roi(prev: ROITransform, nxt: ROITransform, alpha: float = 0.8) -> ROITransform:
     a = max(0.0, min(1.0, alpha))
     b = 1.0 - a
@@ -72,14 +126,297 @@ def smooth_roi(prev: ROITransform, nxt: ROITransform, alpha: float = 0.8) -> ROI
     w = w0 * a + w1 * b
     h = h0 * a + h1 * b
     normalized_size = nxt.normalized_size or prev.normalized_size or (96, 96)
-    W, H = normalized_size
-    scale_x = W / max(1e-6, w)
-    scale_y = H / max(1e-6, h)
-    affine = (scale_x, 0.0, -x * scale_x, 0.0, scale_y, -y * scale_y)
-    return ROITransform(crop_xywh=(x, y, w, h), affine_2x3=affine, normalized_size=normalized_size)
+    return _roi_from_xywh(x, y, w, h, normalized_size)
+
+
+# iBUG 68-point layout: outer mouth corners and the three inner-lip (upper, lower) pairs.
+MOUTH_CORNER_INDICES = (48, 54)
+INNER_LIP_PAIRS = ((61, 67), (62, 66), (63, 65))
+MOUTH_OCCLUSION_FLAGS = frozenset({"mouth_occluded", "lower_face_occluded", "face_occluded"})
+
+
+def mouth_openness(
+    landmarks: Sequence[Any],
+    corner_indices: Tuple[int, int] = MOUTH_CORNER_INDICES,
+    inner_lip_pairs: Sequence[Tuple[int, int]] = INNER_LIP_PAIRS,
+) -> Optional[float]:
+    needed = max(max(corner_indices), max(i for pair in inner_lip_pairs for i in pair))
+    if len(landmarks) <= needed:
+        return None
+    lx, ly = _to_xy(landmarks[corner_indices[0]])
+    rx, ry = _to_xy(landmarks[corner_indices[1]])
+    width = math.hypot(rx - lx, ry - ly)
+    if width < 1e-6:
+        return None
+    gap = 0.0
+    for upper, lower in inner_lip_pairs:
+        ux, uy = _to_xy(landmarks[upper])
+        bx, by = _to_xy(landmarks[lower])
+        gap += math.hypot(bx - ux, by - uy)
+    return gap / len(inner_lip_pairs) / width
+
+
+def _flat_mouth_openness(flat: Sequence[float]) -> Optional[float]:
+    if len(flat) < 2 * 68:
+        return None
+    l, r = MOUTH_CORNER_INDICES
+    width = math.hypot(flat[2 * r] - flat[2 * l], flat[2 * r + 1] - flat[2 * l + 1])
+    if width < 1e-6:
+        return None
+    gap = 0.0
+    for upper, lower in INNER_LIP_PAIRS:
+        gap += math.hypot(flat[2 * lower] - flat[2 * upper], flat[2 * lower + 1] - flat[2 * upper + 1])
+    return gap / len(INNER_LIP_PAIRS) / width
+
+
+def _face_mouth_openness(face: Dict[str, Any]) -> Optional[float]:
+    flags = face.get("occlusion_flags")
+    if flags and MOUTH_OCCLUSION_FLAGS.intersection(flags):
+        return None
+    mouth = face.get("mouth_landmarks")
+    if mouth:
+        # mouth_landmarks are the 20 mouth points (48..67) re-indexed from 0.
+        return mouth_openness(
+            mouth,
+            (MOUTH_CORNER_INDICES[0] - 48, MOUTH_CORNER_INDICES[1] - 48),
+            tuple((u - 48, b - 48) for u, b in INNER_LIP_PAIRS),
+        )
+    landmarks = face.get("landmarks")
+    return mouth_openness(landmarks) if landmarks else None
+
+
+class MouthOpennessBuffer:
+    """Fixed-capacity ring buffer of per-frame mouth openness, resampled onto a uniform grid.
+
+    Occluded frames (``None`` values) are stored but skipped when resampling, so the output
+    interpolates across an occlusion; ``resample`` returns an ``array('d')`` that
+    ``score_heuristic_window`` accepts as ``mouth_open`` plus the occluded fraction of the grid.
+    """
+
+    def __init__(self, capacity: int = 256, step_ms: float = 20.0) -> None:
+        if capacity < 2:
+            raise ValueError("capacity must be >= 2")
+        self.capacity = int(capacity)
+        self.step_ms = float(step_ms)
+        self._t = array.array("d", [0.0]) * self.capacity
+        self._v = array.array("d", [0.0]) * self.capacity
+        self._occluded = array.array("b", [0]) * self.capacity
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, timestamp_ms: float, value: Optional[float], occluded: bool = False) -> None:
+        i = self._head
+        self._t[i] = float(timestamp_ms)
+        self._v[i] = float(value) if value is not None else 0.0
+        self._occluded[i] = 1 if occluded or value is None else 0
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
 
+    def push_result(self, result: FaceTrackResult, track_id: Optional[str] = None) -> None:
+        face = None
+        for obs in result.faces:
+            if track_id is None or obs.track_id == track_id:
+                face = obs
+                break
+        value = face.mouth_open if face else None
+        self.push(result.timestamp_ms, value, occluded=value is None)
 
-@dataclass
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def _ordered(self, values: array.array) -> array.array:
+        if self._count < self.capacity:
+            return values[: self._count]
+        return values[self._head :] + values[: self._head]
+
+    def resample(
+        self, start_ms: float, count: int, step_ms: Optional[float] = None
+    ) -> Tuple[array.array, float]:
+        step = float(step_ms or self.step_ms)
+        count = max(0, int(count))
+        ts = self._ordered(self._t)
+        vs = self._ordered(self._v)
+        occ = self._ordered(self._occluded)
+        if NUMPY_AVAILABLE:
+            grid = start_ms + step * np.arange(count, dtype=np.float64)
+            t = np.frombuffer(ts, dtype=np.float64)
+            v = np.frombuffer(vs, dtype=np.float64)
+            mask = np.frombuffer(occ, dtype=np.int8)
+            valid = mask == 0
+            out = array.array("d", [0.0]) * count
+            if count == 0 or not valid.any():
+                return out, 1.0 if count else 0.0
+            np.frombuffer(out, dtype=np.float64)[:] = np.interp(grid, t[valid], v[valid])
+            nearest = np.clip(np.searchsorted(t, grid, side="right") - 1, 0, len(t) - 1)
+            return out, float(mask[nearest].mean())
+
+        out = array.array("d", [0.0]) * count
+        valid_idx = [i for i in range(len(ts)) if not occ[i]]
+        if count == 0 or not valid_idx:
+            return out, 1.0 if count else 0.0
+        occluded_points = 0
+        j = 0
+        k = 0
+        n = len(ts)
+        m = len(valid_idx)
+        for g in range(count):
+            tg = start_ms + step * g
+            while k + 1 < n and ts[k + 1] <= tg:
+                k += 1
+            occluded_points += occ[k]
+            while j + 1 < m and ts[valid_idx[j + 1]] <= tg:
+                j += 1
+            left = valid_idx[j]
+            if tg <= ts[left] or j + 1 >= m:
+                out[g] = vs[left]
+                continue
+            right = valid_idx[j + 1]
+            span = ts[right] - ts[left]
+            w = (tg - ts[left]) / span if span > 0 else 0.0
+            out[g] = vs[left] + (vs[right] - vs[left]) * w
+        return out, occluded_points / count
+
+
+class KalmanAxis:
+    __slots__ = ("pos", "vel", "p00", "p01", "p11", "process_noise", "measurement_noise")
+
+    def __init__(self, pos: float, process_noise: float, measurement_noise: float) -> None:
+        self.pos = pos
+        self.vel = 0.0
+        self.p00 = measurement_noise
+        self.p01 = 0.0
+        self.p11 = process_noise
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+
+    def predict(self, dt: float) -> float:
+        q = self.process_noise
+        dt2 = dt * dt
+        self.pos += self.vel * dt
+        p00 = self.p00 + dt * (2.0 * self.p01 + dt * self.p11) + q * dt2 * dt2 * 0.25
+        p01 = self.p01 + dt * self.p11 + q * dt2 * dt * 0.5
+        self.p11 += q * dt2
+        self.p00 = p00
+        self.p01 = p01
+        return self.pos
+
+    def correct(self, z: float) -> float:
+        innovation = z - self.pos
+        s = self.p00 + self.measurement_noise
+        k0 = self.p00 / s
+        k1 = self.p01 / s
+        self.pos += k0 * innovation
+        self.vel += k1 * innovation
+        p01 = self.p01
+        self.p11 -= k1 * p01
+        self.p01 = p01 - k0 * p01
+        self.p00 -= k0 * self.p00
+        return innovation
+
+
+class PredictiveROITracker:
+    """Constant-velocity Kalman tracker over (cx, cy, w, h) that extrapolates between detections.
+
+    ``needs_detection`` flips once ``max_predict_frames`` frames were extrapolated, the decayed
+    confidence falls below ``min_confidence``, or the last detection missed the prediction by more
+    than ``max_error_ratio`` of the box size.
+    """
+
+    def __init__(
+        self,
+        max_predict_frames: int = 2,
+        process_noise: float = 4000.0,
+        measurement_noise: float = 4.0,
+        confidence_decay: float = 0.85,
+        min_confidence: float = 0.35,
+        max_error_ratio: float = 0.25,
+        default_dt_ms: float = 1000.0 / 30,
+    ) -> None:
+        self.max_predict_frames = max(0, int(max_predict_frames))
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.confidence_decay = max(0.0, min(1.0, confidence_decay))
+        self.min_confidence = min_confidence
+        self.max_error_ratio = max_error_ratio
+        self.default_dt_ms = default_dt_ms
+        self.axes: Optional[List[KalmanAxis]] = None
+        self.last_timestamp_ms: Optional[float] = None
+        self.detection_confidence = 0.0
+        self.confidence = 0.0
+        self.frames_since_detection = 0
+        self.last_error_ratio = 0.0
+
+    def _dt(self, timestamp_ms: float) -> float:
+        if self.last_timestamp_ms is None or timestamp_ms <= self.last_timestamp_ms:
+            dt_ms = self.default_dt_ms
+        else:
+            dt_ms = timestamp_ms - self.last_timestamp_ms
+        self.last_timestamp_ms = timestamp_ms
+        return dt_ms / 1000.0
+
+    def _xywh(self) -> Tuple[float, float, float, float]:
+        cx, cy, w, h = (axis.pos for axis in self.axes)
+        w = max(1.0, w)
+        h = max(1.0, h)
+        return cx - w / 2, cy - h / 2, w, h
+
+    def update(
+        self,
+        xywh: Tuple[float, float, float, float],
+        timestamp_ms: float,
+        confidence: float = 1.0,
+    ) -> Tuple[float, float, float, float]:
+        x, y, w, h = xywh
+        measured = (x + w / 2, y + h / 2, w, h)
+        if self.axes is None:
+            self.axes = [KalmanAxis(v, self.process_noise, self.measurement_noise) for v in measured]
+            self._dt(timestamp_ms)
+            self.last_error_ratio = 0.0
+        else:
+            dt = self._dt(timestamp_ms)
+            for axis in self.axes:
+                axis.predict(dt)
+            pw = max(1.0, self.axes[2].pos)
+            ph = max(1.0, self.axes[3].pos)
+            ex = measured[0] - self.axes[0].pos
+            ey = measured[1] - self.axes[1].pos
+            self.last_error_ratio = max(abs(ex) / pw, abs(ey) / ph)
+            for axis, z in zip(self.axes, measured):
+                axis.correct(z)
+        self.detection_confidence = max(0.0, min(1.0, float(confidence)))
+        self.confidence = self.detection_confidence
+        self.frames_since_detection = 0
+        return self._xywh()
+
+    def predict(self, timestamp_ms: float) -> Optional[Tuple[float, float, float, float]]:
+        if self.axes is None:
+            return None
+        dt = self._dt(timestamp_ms)
+        for axis in self.axes:
+            axis.predict(dt)
+        self.frames_since_detection += 1
+        self.confidence = self.detection_confidence * self.confidence_decay ** self.frames_since_detection
+        return self._xywh()
+
+    @property
+    def can_predict(self) -> bool:
+        return (
+            self.axes is not None
+            and self.frames_since_detection < self.max_predict_frames
+            and self.confidence >= self.min_confidence
+        )
+
+    @property
+    def needs_detection(self) -> bool:
+        return not self.can_predict or self.last_error_ratio > self.max_error_ratio
+
+
+@dataclass(slots=True)
 class FaceObservation:
     track_id: str
     bbox_xywh: Tuple[float, float, float, float]
@@ -87,22 +424,115 @@ class FaceObservation:
     pose_yaw_pitch_roll: Optional[Tuple[float, float, float]] = None
     mouth_roi: Optional[ROITransform] = None
     face_roi: Optional[ROITransform] = None
-    occlusion_flags: List[str] = None
+    occlusion_flags: List[str] = field(default_factory=list)
+    mouth_open: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FaceTrackResult:
     frame_id: str
     timestamp_ms: int
     faces: List[FaceObservation]
 
 
+_NO_MATCH_COST = 1e6
+
+
+def bbox_iou(a: Tuple[float, float, float, float], b: Tuple[float, float, float, float]) -> float:
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    iw = min(ax + aw, bx + bw) - max(ax, bx)
+    ih = min(ay + ah, by + bh) - max(ay, by)
+    if iw <= 0 or ih <= 0:
+        return 0.0
+    inter = iw * ih
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _center_distance(a: Tuple[float, float, float, float], b: Tuple[float, float, float, float]) -> float:
+    dx = (a[0] + a[2] / 2) - (b[0] + b[2] / 2)
+    dy = (a[1] + a[3] / 2) - (b[1] + b[3] / 2)
+    return (dx * dx + dy * dy) ** 0.5
+
+
+def _observation_box(
+    rois: Tuple[Optional[Any], Optional[ROITransform], Optional[ROITransform]],
+) -> Optional[Tuple[float, float, float, float]]:
+    bbox, _, face_roi = rois
+    if bbox:
+        return tuple(float(v) for v in bbox[:4])
+    return face_roi.crop_xywh if face_roi else None
+
+
+def solve_assignment(cost: List[List[float]]) -> List[Tuple[int, int]]:
+    """Minimum-cost rectangular assignment (Hungarian / Kuhn-Munkres); returns (row, col) pairs."""
+    n_rows = len(cost)
+    n_cols = len(cost[0]) if n_rows else 0
+    if n_rows == 0 or n_cols == 0:
+        return []
+    transposed = n_rows > n_cols
+    if transposed:
+        cost = [list(col) for col in zip(*cost)]
+        n_rows, n_cols = n_cols, n_rows
+
+    inf = float("inf")
+    u = [0.0] * (n_rows + 1)
+    v = [0.0] * (n_cols + 1)
+    col_row = [0] * (n_cols + 1)
+    way = [0] * (n_cols + 1)
+    for i in range(1, n_rows + 1):
+        col_row[0] = i
+        j0 = 0
+        min_v = [inf] * (n_cols + 1)
+        used = [False] * (n_cols + 1)
+        while True:
+            used[j0] = True
+            i0 = col_row[j0]
+            row = cost[i0 - 1]
+            delta = inf
+            j1 = 0
+            for j in range(1, n_cols + 1):
+                if used[j]:
+                    continue
+                cur = row[j - 1] - u[i0] - v[j]
+                if cur < min_v[j]:
+                    min_v[j] = cur
+                    way[j] = j0
+                if min_v[j] < delta:
+                    delta = min_v[j]
+                    j1 = j
+            for j in range(n_cols + 1):
+                if used[j]:
+                    u[col_row[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_v[j] -= delta
+            j0 = j1
+            if col_row[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            col_row[j0] = col_row[j1]
+            j0 = j1
+
+    pairs = [(col_row[j] - 1, j - 1) for j in range(1, n_cols + 1) if col_row[j]]
+    if transposed:
+        pairs = [(c, r) for r, c in pairs]
+    return sorted(pairs)
+
+
+def _needs_detection(trackers: Dict[str, PredictiveROITracker]) -> bool:
+    active = [t for t in trackers.values() if t.axes is not None]
+    return not active or any(t.needs_detection for t in active)
+
+
 class NoopFaceTrackBackend:
     def init(self, frame: Any, hint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         return {}
 
     def update(self, frame: Any, state: Dict[str, Any], hint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        now_ms = int(__import__("time").time() * 1000)
+        now_ms = int(time.time() * 1000)
         result = FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=[])
         return {"result": result, "state": state}
 
@@ -114,54 +544,105 @@ class HeuristicFaceTrackBackend:
         face_indices: Optional[List[int]] = None,
         normalized_size: Tuple[int, int] = (96, 96),
         smooth_alpha: float = 0.8,
+        max_predict_frames: int = 0,
+        tracker_options: Optional[Dict[str, float]] = None,
+        max_faces: int = 1,
+        max_track_misses: int = 5,
+        min_iou: float = 0.1,
+        max_center_distance: float = 0.5,
+        landmark_weight: float = 1.0,
     ) -> None:
         self.mouth_indices = mouth_indices or list(range(48, 68))
         self.face_indices = face_indices or list(range(17))
         self.normalized_size = normalized_size
         self.smooth_alpha = smooth_alpha
+        self.max_predict_frames = max(0, int(max_predict_frames))
+        self.tracker_options = dict(tracker_options or {})
+        self._mouth_selector = _flat_selector(self.mouth_indices)
+        self._face_selector = _flat_selector(self.face_indices)
+        self.max_faces = max(1, int(max_faces))
+        self.max_track_misses = max(0, int(max_track_misses))
+        self.min_iou = min_iou
+        self.max_center_distance = max_center_distance
+        self.landmark_weight = landmark_weight
 
-    def init(self, frame: Any, hint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        return {"track_id": f"track_{int(__import__('time').time() * 1000)}"}
+    def _new_tracker(self) -> PredictiveROITracker:
+        return PredictiveROITracker(max_predict_frames=self.max_predict_frames, **self.tracker_options)
 
-    def update(self, frame: Any, state: Dict[str, Any], hint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        now_ms = int(getattr(frame, "timestamp_ms", None) or __import__("time").time() * 1000)
-        faces = getattr(frame, "faces", None) or frame.get("faces", []) if isinstance(frame, dict) else []
-        if not faces:
-            return {"result": FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=[]), "state": state}
-        primary = max(faces, key=lambda f: f.get("confidence", 0.0))
-        bbox = primary.get("bbox_xywh") or primary.get("bbox")
-        clamp_to = None
-        dims = frame.get("dimensions") if isinstance(frame, dict) else None
-        if dims and len(dims) == 2:
-            clamp_to = {"width": dims[0], "height": dims[1]}
+    def _coast(self, track: Dict[str, Any], now_ms: int) -> Optional[Tuple[FaceObservation, Dict[str, Any]]]:
+        """Extrapolate an undetected track from its Kalman trackers; None once it may not coast."""
+        trackers = track.get("trackers") or {}
+        active = [t for t in trackers.values() if t.axes is not None]
+        if not active or not all(t.can_predict for t in active):
+            return None
 
+        bbox = trackers["bbox"].predict(now_ms)
+        mouth_xywh = trackers["mouth"].predict(now_ms)
+        face_xywh = trackers["face"].predict(now_ms)
+        mouth_roi = _roi_from_xywh(*mouth_xywh, self.normalized_size) if mouth_xywh else None
+        face_roi = _roi_from_xywh(*face_xywh, self.normalized_size) if face_xywh else None
+        obs = FaceObservation(
+            track_id=track.get("track_id") or f"track_{now_ms}",
+            bbox_xywh=bbox or (0.0, 0.0, 0.0, 0.0),
+            confidence=min(t.confidence for t in active),
+            pose_yaw_pitch_roll=track.get("prev_pose"),
+            mouth_roi=mouth_roi,
+            face_roi=face_roi,
+            occlusion_flags=[],
+        )
+        next_track = {
+            **track,
+            "prev_mouth_roi": mouth_roi,
+            "prev_face_roi": face_roi,
+            "needs_detection": _needs_detection(trackers),
+        }
+        if "box" in track:
+            next_track["box"] = _observation_box((bbox, mouth_roi, face_roi)) or track["box"]
+        return obs, next_track
+
+    def _predict(self, state: Dict[str, Any], now_ms: int) -> Dict[str, Any]:
+        coasted = self._coast(state, now_ms)
+        if coasted is None:
+            empty = FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=[])
+            return {"result": empty, "state": {**state, "needs_detection": True}}
+        obs, next_state = coasted
+        result = FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=[obs])
+        return {"result": result, "state": next_state}
+
+    def init(self, frame: Any, hint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {"track_id": f"track_{int(time.time() * 1000)}"}
+
+    def _face_rois(
+        self, face: Dict[str, Any], clamp_to: Optional[Dict[str, int]]
+    ) -> Tuple[Optional[Any], Optional[ROITransform], Optional[ROITransform]]:
+        bbox = face.get("bbox_xywh") or face.get("bbox")
         mouth_roi = None
-        if primary.get("mouth_landmarks"):
+        if face.get("mouth_landmarks"):
             mouth_roi = roi_from_landmarks(
-                primary["mouth_landmarks"],
-                list(range(len(primary["mouth_landmarks"]))),
+                face["mouth_landmarks"],
+                list(range(len(face["mouth_landmarks"]))),
                 normalized_size=self.normalized_size,
                 clamp_to=clamp_to,
             )
-        elif primary.get("landmarks"):
+        elif face.get("landmarks"):
             mouth_roi = roi_from_landmarks(
-                primary["landmarks"],
+                face["landmarks"],
                 self.mouth_indices,
                 normalized_size=self.normalized_size,
                 clamp_to=clamp_to,
             )
 
         face_roi = None
-        if primary.get("face_landmarks"):
+        if face.get("face_landmarks"):
             face_roi = roi_from_landmarks(
-                primary["face_landmarks"],
-                list(range(len(primary["face_landmarks"]))),
+                face["face_landmarks"],
+                list(range(len(face["face_landmarks"]))),
                 normalized_size=self.normalized_size,
                 clamp_to=clamp_to,
             )
-        elif primary.get("landmarks"):
+        elif face.get("landmarks"):
             face_roi = roi_from_landmarks(
-                primary["landmarks"],
+                face["landmarks"],
                 self.face_indices,
                 normalized_size=self.normalized_size,
                 clamp_to=clamp_to,
@@ -179,23 +660,422 @@ class HeuristicFaceTrackBackend:
                 [0, 1],
                 normalized_size=self.normalized_size,
             )
+        return bbox, mouth_roi, face_roi
 
-        if state.get("prev_mouth_roi") and mouth_roi:
-            mouth_roi = smooth_roi(state["prev_mouth_roi"], mouth_roi, self.smooth_alpha)
-        if state.get("prev_face_roi") and face_roi:
-            face_roi = smooth_roi(state["prev_face_roi"], face_roi, self.smooth_alpha)
+    def _observe(
+        self,
+        face: Dict[str, Any],
+        rois: Tuple[Optional[Any], Optional[ROITransform], Optional[ROITransform]],
+        track: Dict[str, Any],
+        track_id: str,
+        now_ms: int,
+    ) -> Tuple[FaceObservation, Dict[str, Any]]:
+        bbox, mouth_roi, face_roi = rois
+        confidence = float(face.get("confidence", 0.5))
+        bbox_xywh = tuple(bbox) if bbox else (0.0, 0.0, 0.0, 0.0)
+        trackers = None
+        if self.max_predict_frames > 0:
+            trackers = track.get("trackers") if track.get("track_id") == track_id else None
+            trackers = trackers or {"bbox": self._new_tracker(), "mouth": self._new_tracker(), "face": self._new_tracker()}
+            if bbox:
+                bbox_xywh = trackers["bbox"].update(bbox_xywh, now_ms, confidence)
+            if mouth_roi:
+                mouth_roi = _roi_from_xywh(*trackers["mouth"].update(mouth_roi.crop_xywh, now_ms, confidence), self.normalized_size)
+            if face_roi:
+                face_roi = _roi_from_xywh(*trackers["face"].update(face_roi.crop_xywh, now_ms, confidence), self.normalized_size)
+        else:
+            if track.get("prev_mouth_roi") and mouth_roi:
+                mouth_roi = smooth_roi(track["prev_mouth_roi"], mouth_roi, self.smooth_alpha)
+            if track.get("prev_face_roi") and face_roi:
+                face_roi = smooth_roi(track["prev_face_roi"], face_roi, self.smooth_alpha)
 
+        pose = tuple(face.get("pose_yaw_pitch_roll")) if face.get("pose_yaw_pitch_roll") else None
         obs = FaceObservation(
-            track_id=primary.get("track_id") or state.get("track_id") or f"track_{now_ms}",
-            bbox_xywh=tuple(bbox) if bbox else (0.0, 0.0, 0.0, 0.0),
-            confidence=float(primary.get("confidence", 0.5)),
-            pose_yaw_pitch_roll=tuple(primary.get("pose_yaw_pitch_roll")) if primary.get("pose_yaw_pitch_roll") else None,
+            track_id=track_id,
+            bbox_xywh=bbox_xywh,
+            confidence=confidence,
+            pose_yaw_pitch_roll=pose,
             mouth_roi=mouth_roi,
             face_roi=face_roi,
-            occlusion_flags=primary.get("occlusion_flags") or [],
+            occlusion_flags=face.get("occlusion_flags") or [],
+            mouth_open=_face_mouth_openness(face),
         )
+        next_track: Dict[str, Any] = {"track_id": track_id, "prev_mouth_roi": mouth_roi, "prev_face_roi": face_roi}
+        if trackers is not None:
+            next_track["trackers"] = trackers
+            next_track["prev_pose"] = pose
+            next_track["needs_detection"] = _needs_detection(trackers)
+        return obs, next_track
+
+    def update(self, frame: Any, state: Dict[str, Any], hint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        timestamp_ms = frame.get("timestamp_ms") if isinstance(frame, dict) else getattr(frame, "timestamp_ms", None)
+        now_ms = int(timestamp_ms or time.time() * 1000)
+        faces = getattr(frame, "faces", None) or frame.get("faces", []) if isinstance(frame, dict) else []
+        clamp_to = None
+        dims = frame.get("dimensions") if isinstance(frame, dict) else None
+        if dims and len(dims) == 2:
+            clamp_to = {"width": dims[0], "height": dims[1]}
+        if self.max_faces > 1:
+            return self._update_multi(faces, state, now_ms, clamp_to)
+        if not faces:
+            if self.max_predict_frames > 0:
+                return self._predict(state, now_ms)
+            return {"result": FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=[]), "state": state}
+        primary = max(faces, key=lambda f: f.get("confidence", 0.0))
+        track_id = primary.get("track_id") or state.get("track_id") or f"track_{now_ms}"
+        obs, next_state = self._observe(primary, self._face_rois(primary, clamp_to), state, track_id, now_ms)
         result = FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=[obs])
-        return {
-            "result": result,
-            "state": {"track_id": obs.track_id, "prev_mouth_roi": mouth_roi, "prev_face_roi": face_roi},
-        }
+        return {"result": result, "state": next_state}
+
+    def update_arrays(
+        self,
+        landmarks: Sequence[float],
+        timestamp_ms: int,
+        state: Dict[str, Any],
+        confidence: float = 1.0,
+        bbox_xywh: Optional[Tuple[float, float, float, float]] = None,
+        pose_yaw_pitch_roll: Optional[Tuple[float, float, float]] = None,
+        occlusion_flags: Sequence[str] = (),
+        dimensions: Optional[Tuple[int, int]] = None,
+        track_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Single-face fast path for preparsed 68-point landmarks given as flat ``[x0, y0, x1, y1, ...]``.
+
+        Produces the same result/state as ``update`` with ``{"landmarks": ...}`` input, without
+        dict probing or per-point tuple conversion.
+        """
+        if NUMPY_AVAILABLE and isinstance(landmarks, np.ndarray):
+            landmarks = landmarks.ravel().tolist()
+        now_ms = int(timestamp_ms)
+        clamp_to = {"width": dimensions[0], "height": dimensions[1]} if dimensions else None
+        ns = self.normalized_size
+        track_id = track_id or state.get("track_id") or f"track_{now_ms}"
+
+        mouth_xywh = _padded_xywh(*_flat_bounds(landmarks, self._mouth_selector), 0.25, clamp_to)
+        face_xywh = _padded_xywh(*_flat_bounds(landmarks, self._face_selector), 0.25, clamp_to)
+        bbox = tuple(bbox_xywh) if bbox_xywh else (0.0, 0.0, 0.0, 0.0)
+        trackers = None
+        if self.max_predict_frames > 0:
+            trackers = state.get("trackers") if state.get("track_id") == track_id else None
+            trackers = trackers or {"bbox": self._new_tracker(), "mouth": self._new_tracker(), "face": self._new_tracker()}
+            if bbox_xywh:
+                bbox = trackers["bbox"].update(bbox, now_ms, confidence)
+            mouth_xywh = trackers["mouth"].update(mouth_xywh, now_ms, confidence)
+            face_xywh = trackers["face"].update(face_xywh, now_ms, confidence)
+        else:
+            prev_mouth = state.get("prev_mouth_roi")
+            if prev_mouth:
+                mouth_xywh = _ema_xywh(prev_mouth.crop_xywh, mouth_xywh, self.smooth_alpha)
+            prev_face = state.get("prev_face_roi")
+            if prev_face:
+                face_xywh = _ema_xywh(prev_face.crop_xywh, face_xywh, self.smooth_alpha)
+        mouth_roi = _roi_from_xywh(*mouth_xywh, ns)
+        face_roi = _roi_from_xywh(*face_xywh, ns)
+
+        flags = list(occlusion_flags)
+        occluded = bool(flags) and not MOUTH_OCCLUSION_FLAGS.isdisjoint(flags)
+        obs = FaceObservation(
+            track_id=track_id,
+            bbox_xywh=bbox,
+            confidence=float(confidence),
+            pose_yaw_pitch_roll=tuple(pose_yaw_pitch_roll) if pose_yaw_pitch_roll else None,
+            mouth_roi=mouth_roi,
+            face_roi=face_roi,
+            occlusion_flags=flags,
+            mouth_open=None if occluded else _flat_mouth_openness(landmarks),
+        )
+        next_state: Dict[str, Any] = {"track_id": track_id, "prev_mouth_roi": mouth_roi, "prev_face_roi": face_roi}
+        if trackers is not None:
+            next_state["trackers"] = trackers
+            next_state["prev_pose"] = obs.pose_yaw_pitch_roll
+            next_state["needs_detection"] = _needs_detection(trackers)
+        return {"result": FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=[obs]), "state": next_state}
+
+    def _update_multi(
+        self,
+        faces: List[Dict[str, Any]],
+        state: Dict[str, Any],
+        now_ms: int,
+        clamp_to: Optional[Dict[str, int]],
+    ) -> Dict[str, Any]:
+        tracks: List[Dict[str, Any]] = list(state.get("tracks") or [])
+        next_seq = int(state.get("next_track_seq", 0))
+        detections = sorted(faces, key=lambda f: f.get("confidence", 0.0), reverse=True)[: self.max_faces]
+        det_rois = [self._face_rois(face, clamp_to) for face in detections]
+        det_boxes = [_observation_box(rois) for rois in det_rois]
+
+        matches: Dict[int, int] = {}
+        if tracks and detections:
+            cost = [
+                [self._association_cost(track, box, rois[1]) for box, rois in zip(det_boxes, det_rois)]
+                for track in tracks
+            ]
+            for t_idx, d_idx in solve_assignment(cost):
+                if cost[t_idx][d_idx] < _NO_MATCH_COST:
+                    matches[d_idx] = t_idx
+
+        observations: List[FaceObservation] = []
+        next_tracks: List[Dict[str, Any]] = []
+        matched_tracks = set(matches.values())
+        live_ids = {track["track_id"] for track in tracks}
+        for d_idx, face in enumerate(detections):
+            t_idx = matches.get(d_idx)
+            if t_idx is not None:
+                track = tracks[t_idx]
+                track_id = track["track_id"]
+            else:
+                # A detector-supplied id is only kept if no live track uses it already.
+                track = {}
+                track_id = face.get("track_id")
+                while not track_id or track_id in live_ids:
+                    track_id = f"track_{now_ms}_{next_seq}"
+                    next_seq += 1
+                live_ids.add(track_id)
+            obs, next_track = self._observe(face, det_rois[d_idx], track, track_id, now_ms)
+            next_track["box"] = det_boxes[d_idx]
+            next_track["misses"] = 0
+            observations.append(obs)
+            next_tracks.append(next_track)
+
+        for t_idx, track in enumerate(tracks):
+            if t_idx in matched_tracks:
+                continue
+            misses = int(track.get("misses", 0)) + 1
+            if misses > self.max_track_misses:
+                continue
+            # Same coasting as the single-face path: up to max_predict_frames Kalman predictions.
+            coasted = self._coast(track, now_ms) if self.max_predict_frames > 0 else None
+            if coasted is not None:
+                obs, track = coasted
+                observations.append(obs)
+            next_tracks.append({**track, "misses": misses})
+
+        result = FaceTrackResult(frame_id=str(now_ms), timestamp_ms=now_ms, faces=observations)
+        next_state: Dict[str, Any] = {"tracks": next_tracks, "next_track_seq": next_seq}
+        if self.max_predict_frames > 0:
+            next_state["needs_detection"] = not next_tracks or any(t.get("needs_detection", True) for t in next_tracks)
+        return {"result": result, "state": next_state}
+
+    def _association_cost(
+        self,
+        track: Dict[str, Any],
+        box: Optional[Tuple[float, float, float, float]],
+        mouth_roi: Optional[ROITransform],
+    ) -> float:
+        prev_box = track.get("box")
+        if not prev_box or not box:
+            return _NO_MATCH_COST
+        iou = bbox_iou(prev_box, box)
+        prev_mouth = track.get("prev_mouth_roi")
+        if prev_mouth and mouth_roi:
+            dist = _center_distance(prev_mouth.crop_xywh, mouth_roi.crop_xywh)
+        else:
+            dist = _center_distance(prev_box, box)
+        dist /= max(1.0, (prev_box[2] ** 2 + prev_box[3] ** 2) ** 0.5)
+        if iou < self.min_iou and dist > self.max_center_distance:
+            return _NO_MATCH_COST
+        return (1.0 - iou) + self.landmark_weight * dist
+
+
+def _inverse_affine(
+    affine: Tuple[float, float, float, float, float, float],
+) -> Tuple[float, float, float, float, float, float]:
+    a, b, c, d, e, f = affine
+    det = a * e - b * d
+    if abs(det) < 1e-12:
+        raise ValueError("affine_2x3 is not invertible")
+    return (e / det, -b / det, (b * f - e * c) / det, -d / det, a / det, (d * c - a * f) / det)
+
+
+class _WarpScratch:
+    __slots__ = ("grid_u", "grid_v", "coeffs", "sx", "sy", "fx", "fy", "idx", "idx2", "pix", "top", "bottom", "tmp")
+
+    def __init__(self, max_batch: int, out_h: int, out_w: int, step: float) -> None:
+        shape = (max_batch, out_h, out_w)
+        self.grid_u = ((np.arange(out_w, dtype=np.float32) + 0.5) * step).reshape(1, 1, out_w)
+        self.grid_v = ((np.arange(out_h, dtype=np.float32) + 0.5) * step).reshape(1, out_h, 1)
+        self.coeffs = np.zeros((6, max_batch, 1, 1), dtype=np.float32)
+        self.sx = np.empty(shape, dtype=np.float32)
+        self.sy = np.empty(shape, dtype=np.float32)
+        self.fx = np.empty(shape, dtype=np.float32)
+        self.fy = np.empty(shape, dtype=np.float32)
+        self.idx = np.empty(shape, dtype=np.intp)
+        self.idx2 = np.empty(shape, dtype=np.intp)
+        self.pix = np.empty(shape, dtype=np.uint8)
+        self.top = np.empty(shape, dtype=np.float32)
+        self.bottom = np.empty(shape, dtype=np.float32)
+        self.tmp = np.empty(shape, dtype=np.float32)
+
+
+class ROICropEngine:
+    """Warps yuv420p planes into fixed-size normalized crops using each ROI's ``affine_2x3``.
+
+    All output and scratch buffers are allocated once for ``max_batch`` ROIs; ``crop`` only
+    writes into them. Outputs are exposed as ``luma``/``chroma_u``/``chroma_v`` (numpy views
+    when numpy is installed, otherwise memoryviews over the backing ``bytearray``) and are
+    overwritten by the next call.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        output_size: Tuple[int, int] = (96, 96),
+        max_batch: int = 4,
+        with_chroma: bool = False,
+    ) -> None:
+        if width < 2 or height < 2:
+            raise ValueError("frame must be at least 2x2")
+        self.width = int(width)
+        self.height = int(height)
+        self.output_size = output_size
+        self.max_batch = max(1, int(max_batch))
+        self.with_chroma = with_chroma
+        out_w, out_h = output_size
+        self._luma_buf = bytearray(self.max_batch * out_w * out_h)
+        self._u_buf = bytearray(self.max_batch * (out_w // 2) * (out_h // 2)) if with_chroma else None
+        self._v_buf = bytearray(self.max_batch * (out_w // 2) * (out_h // 2)) if with_chroma else None
+        self._coeffs: List[Tuple[float, float, float, float, float, float]] = [(0.0,) * 6] * self.max_batch
+        if NUMPY_AVAILABLE:
+            self.luma = np.frombuffer(self._luma_buf, dtype=np.uint8).reshape(self.max_batch, out_h, out_w)
+            self._luma_scratch = _WarpScratch(self.max_batch, out_h, out_w, 1.0)
+            if with_chroma:
+                chroma_shape = (self.max_batch, out_h // 2, out_w // 2)
+                self.chroma_u = np.frombuffer(self._u_buf, dtype=np.uint8).reshape(chroma_shape)
+                self.chroma_v = np.frombuffer(self._v_buf, dtype=np.uint8).reshape(chroma_shape)
+                self._chroma_scratch = _WarpScratch(self.max_batch, out_h // 2, out_w // 2, 2.0)
+        else:
+            self.luma = memoryview(self._luma_buf)
+            if with_chroma:
+                self.chroma_u = memoryview(self._u_buf)
+                self.chroma_v = memoryview(self._v_buf)
+
+    def crop(
+        self,
+        y_plane: Any,
+        rois: Sequence[ROITransform],
+        u_plane: Optional[Any] = None,
+        v_plane: Optional[Any] = None,
+    ) -> int:
+        n = len(rois)
+        if n > self.max_batch:
+            raise ValueError(f"batch of {n} ROIs exceeds max_batch={self.max_batch}")
+        for i, roi in enumerate(rois):
+            affine = roi.affine_2x3
+            if affine is None:
+                affine = _roi_from_xywh(*roi.crop_xywh, self.output_size).affine_2x3
+            elif roi.normalized_size and tuple(roi.normalized_size) != tuple(self.output_size):
+                sx = self.output_size[0] / roi.normalized_size[0]
+                sy = self.output_size[1] / roi.normalized_size[1]
+                affine = (affine[0] * sx, affine[1] * sx, affine[2] * sx, affine[3] * sy, affine[4] * sy, affine[5] * sy)
+            self._coeffs[i] = _inverse_affine(affine)
+        if n == 0:
+            return 0
+
+        chroma = self.with_chroma and u_plane is not None and v_plane is not None
+        cw, ch = self.width // 2, self.height // 2
+        if NUMPY_AVAILABLE:
+            self._load_coeffs(self._luma_scratch, n)
+            self._warp_np(y_plane, self.width, self.height, self._luma_scratch, self.luma, n, 1.0)
+            if chroma:
+                self._load_coeffs(self._chroma_scratch, n)
+                self._warp_np(u_plane, cw, ch, self._chroma_scratch, self.chroma_u, n, 0.5)
+                self._warp_np(v_plane, cw, ch, self._chroma_scratch, self.chroma_v, n, 0.5)
+        else:
+            out_w, out_h = self.output_size
+            self._warp_py(y_plane, self.width, self.height, self._luma_buf, n, out_w, out_h, 1.0)
+            if chroma:
+                self._warp_py(u_plane, cw, ch, self._u_buf, n, out_w // 2, out_h // 2, 2.0)
+                self._warp_py(v_plane, cw, ch, self._v_buf, n, out_w // 2, out_h // 2, 2.0)
+        return n
+
+    def _load_coeffs(self, scratch: _WarpScratch, n: int) -> None:
+        for i in range(n):
+            for k, value in enumerate(self._coeffs[i]):
+                scratch.coeffs[k, i, 0, 0] = value
+
+    @staticmethod
+    def _warp_np(plane: Any, pw: int, ph: int, scratch: _WarpScratch, out: Any, n: int, src_scale: float) -> None:
+        src = np.frombuffer(plane, dtype=np.uint8, count=pw * ph)
+        a, b, c, d, e, f = (scratch.coeffs[k, :n] for k in range(6))
+        sx, sy, fx, fy = scratch.sx[:n], scratch.sy[:n], scratch.fx[:n], scratch.fy[:n]
+        idx, idx2, pix = scratch.idx[:n], scratch.idx2[:n], scratch.pix[:n]
+        top, bottom, tmp = scratch.top[:n], scratch.bottom[:n], scratch.tmp[:n]
+
+        # Source pixel coordinates of every output pixel centre, clamped so x0+1/y0+1 stay in range.
+        np.multiply(a, scratch.grid_u, out=sx)
+        np.multiply(b, scratch.grid_v, out=tmp)
+        np.add(sx, tmp, out=sx)
+        np.add(sx, c, out=sx)
+        np.multiply(sx, src_scale, out=sx)
+        np.subtract(sx, 0.5, out=sx)
+        np.clip(sx, 0.0, pw - 1.001, out=sx)
+        np.multiply(d, scratch.grid_u, out=sy)
+        np.multiply(e, scratch.grid_v, out=tmp)
+        np.add(sy, tmp, out=sy)
+        np.add(sy, f, out=sy)
+        np.multiply(sy, src_scale, out=sy)
+        np.subtract(sy, 0.5, out=sy)
+        np.clip(sy, 0.0, ph - 1.001, out=sy)
+        np.floor(sx, out=fx)
+        np.floor(sy, out=fy)
+        np.copyto(idx, fy, casting="unsafe")
+        np.multiply(idx, pw, out=idx)
+        np.copyto(idx2, fx, casting="unsafe")
+        np.add(idx, idx2, out=idx)
+        np.subtract(sx, fx, out=fx)
+        np.subtract(sy, fy, out=fy)
+
+        # Bilinear blend: top row, bottom row, then vertical.
+        np.take(src, idx, out=pix, mode="clip")
+        np.copyto(top, pix)
+        np.add(idx, 1, out=idx2)
+        np.take(src, idx2, out=pix, mode="clip")
+        np.subtract(pix, top, out=tmp)
+        np.multiply(tmp, fx, out=tmp)
+        np.add(top, tmp, out=top)
+        np.add(idx, pw, out=idx2)
+        np.take(src, idx2, out=pix, mode="clip")
+        np.copyto(bottom, pix)
+        np.add(idx2, 1, out=idx2)
+        np.take(src, idx2, out=pix, mode="clip")
+        np.subtract(pix, bottom, out=tmp)
+        np.multiply(tmp, fx, out=tmp)
+        np.add(bottom, tmp, out=bottom)
+        np.subtract(bottom, top, out=tmp)
+        np.multiply(tmp, fy, out=tmp)
+        np.add(top, tmp, out=top)
+        np.add(top, 0.5, out=top)
+        np.copyto(out[:n], top, casting="unsafe")
+
+    def _warp_py(
+        self, plane: Any, pw: int, ph: int, out: bytearray, n: int, out_w: int, out_h: int, step: float
+    ) -> None:
+        src = memoryview(plane)
+        src_scale = 1.0 / step
+        max_x = pw - 1.001
+        max_y = ph - 1.001
+        for i in range(n):
+            a, b, c, d, e, f = self._coeffs[i]
+            base = i * out_w * out_h
+            for oy in range(out_h):
+                v = (oy + 0.5) * step
+                row_x = b * v + c
+                row_y = e * v + f
+                for ox in range(out_w):
+                    u = (ox + 0.5) * step
+                    x = min(max_x, max(0.0, (a * u + row_x) * src_scale - 0.5))
+                    y = min(max_y, max(0.0, (d * u + row_y) * src_scale - 0.5))
+                    x0 = int(x)
+                    y0 = int(y)
+                    wx = x - x0
+                    wy = y - y0
+                    k = y0 * pw + x0
+                    p00 = src[k]
+                    p01 = src[k + 1]
+                    p10 = src[k + pw]
+                    p11 = src[k + pw + 1]
+                    t = p00 + (p01 - p00) * wx
+                    bt = p10 + (p11 - p10) * wx
+                    out[base + oy * out_w + ox] = int(t + (bt - t) * wy + 0.5)
+
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Microbenchmark: HeuristicFaceTrackBackend.update (dict frames) vs update_arrays (flat landmarks).
+
+Reports the best of several repeats in microseconds per frame.
+"""
+
+import math
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from face_track import HeuristicFaceTrackBackend  # noqa: E402
+
+
+def synthetic_landmarks(frame_idx: int) -> list:
+    cx = 360 + 40 * math.sin(frame_idx / 15)
+    cy = 640 + 20 * math.cos(frame_idx / 11)
+    return [
+        (cx + 120 * math.cos(2 * math.pi * i / 68), cy + 160 * math.sin(2 * math.pi * i / 68))
+        for i in range(68)
+    ]
+
+
+def bench(frames: int = 20000, repeats: int = 5) -> None:
+    points = [synthetic_landmarks(i) for i in range(64)]
+    dict_frames = [
+        {
+            "timestamp_ms": 1000 + i * 33,
+            "dimensions": (720, 1280),
+            "faces": [{"landmarks": points[i % 64], "confidence": 0.9, "bbox_xywh": (240, 480, 240, 320)}],
+        }
+        for i in range(64)
+    ]
+    flat_frames = [[v for p in pts for v in p] for pts in points]
+    backend = HeuristicFaceTrackBackend()
+
+    def run_dict() -> None:
+        state: dict = {}
+        for i in range(frames):
+            state = backend.update(dict_frames[i % 64], state)["state"]
+
+    def run_arrays() -> None:
+        state: dict = {}
+        for i in range(frames):
+            state = backend.update_arrays(
+                flat_frames[i % 64],
+                1000 + i * 33,
+                state,
+                confidence=0.9,
+                bbox_xywh=(240, 480, 240, 320),
+                dimensions=(720, 1280),
+            )["state"]
+
+    dict_us = min(timeit.repeat(run_dict, number=1, repeat=repeats)) / frames * 1e6
+    arrays_us = min(timeit.repeat(run_arrays, number=1, repeat=repeats)) / frames * 1e6
+
+    print(f"update (dict):   {dict_us:8.2f} us/frame")
+    print(f"update_arrays:   {arrays_us:8.2f} us/frame")
+    print(f"speedup:         {dict_us / arrays_us:8.2f}x")
+
+
+if __name__ == "__main__":
+    bench(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Check that face_track's observation types match their contracts/types.py definitions.
+
+face_track keeps its own copies of ``ROITransform``, ``FaceObservation`` and ``FaceTrackResult`` so
+it stays importable on its own; this fails if a field, its annotation, default or the slots
+layout drifts between the two.
+"""
+
+import dataclasses
+import importlib.util
+import itertools
+import sys
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(root / "face-track" / "python"))
+
+import face_track  # noqa: E402
+
+TYPES = ("ROITransform", "FaceObservation", "FaceTrackResult")
+
+
+def load_contracts():
+    # Loaded under another name: importing contracts/types.py as ``types`` would shadow the stdlib.
+    spec = importlib.util.spec_from_file_location("contracts_types", root / "contracts" / "types.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def shape(cls) -> list:
+    fields = [
+        (f.name, str(f.type), repr(f.default), getattr(f.default_factory, "__name__", None))
+        for f in dataclasses.fields(cls)
+    ]
+    return fields + [("__slots__", tuple(getattr(cls, "__slots__", ())))]
+
+
+def main() -> int:
+    contracts = load_contracts()
+    failed = False
+    for name in TYPES:
+        ours, theirs = shape(getattr(face_track, name)), shape(getattr(contracts, name))
+        ok = ours == theirs
+        failed |= not ok
+        print(f"{name:>16}: {'ok' if ok else 'MISMATCH'}")
+        if not ok:
+            for mine, other in itertools.zip_longest(ours, theirs):
+                if mine != other:
+                    print(f"    face_track={mine}  contracts={other}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,45 @@
 from .identity_drift import (
     DEFAULT_DRIFT_THRESHOLDS,
+    DRIFT_SAMPLING_EVENTS,
+    DriftSamplingScheduler,
+    DriftMonitor,
+    EmbeddingBatcher,
+    IVFIndex,
+    LumaFlickerEngine,
+    NUMPY_AVAILABLE,
+    ReferenceBank,
+    RollingStats,
+    StandInEmbedder,
     classify_drift,
     cosine_similarity,
     flicker_score,
     max_similarity,
     recommend_action,
+    replay_sampling_trace,
     score_frame,
+    score_frames,
     update_drift_trend,
 )
 
 __all__ = [
     "DEFAULT_DRIFT_THRESHOLDS",
+    "DRIFT_SAMPLING_EVENTS",
+    "DriftSamplingScheduler",
+    "DriftMonitor",
+    "EmbeddingBatcher",
+    "IVFIndex",
+    "LumaFlickerEngine",
+    "NUMPY_AVAILABLE",
+    "ReferenceBank",
+    "RollingStats",
+    "StandInEmbedder",
     "classify_drift",
     "cosine_similarity",
     "flicker_score",
     "max_similarity",
     "recommend_action",
+    "replay_sampling_trace",
     "score_frame",
+    "score_frames",
     "update_drift_trend",
 ]
@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import array
+import asyncio
+import operator
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:  # optional dependency
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
 
 
 DEFAULT_DRIFT_THRESHOLDS = {
@@ -40,6 +54,355 @@ def max_similarity(embedding: List[float], refs: List[List[float]]) -> float:
     return 0.0 if best == float("-inf") else best
 
 
+def _normalize_rows(rows: Sequence[Sequence[float]]) -> Any:
+    if NUMPY_AVAILABLE:
+        if len(rows) == 0:
+            return np.zeros((0, 0), dtype=np.float32)
+        mat = np.array(rows, dtype=np.float32)
+        if mat.ndim != 2:
+            raise ValueError("reference embeddings must share one dimension")
+        norms = np.linalg.norm(mat, axis=1, keepdims=True)
+        np.divide(mat, norms, out=mat, where=norms > 0)
+        mat[(norms == 0).ravel()] = 0.0
+        return np.ascontiguousarray(mat)
+    dims = {len(row) for row in rows}
+    if len(dims) > 1:
+        raise ValueError("reference embeddings must share one dimension")
+    out: List[List[float]] = []
+    for row in rows:
+        norm = sum(v * v for v in row) ** 0.5
+        out.append([v / norm for v in row] if norm > 0 else [0.0] * len(row))
+    return out
+
+
+def _normalize_query(embedding: Sequence[float]) -> Any:
+    if NUMPY_AVAILABLE:
+        q = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        return q / norm if norm > 0 else None
+    norm = sum(v * v for v in embedding) ** 0.5
+    return [v / norm for v in embedding] if norm > 0 else None
+
+
+class ReferenceBank:
+    """Persona reference embeddings, L2-normalized once into contiguous float32 matrices.
+
+    Build one per persona version; ``best_match`` is then a single matrix-vector product and
+    ``score_batch`` scores many frames with one matrix product. Falls back to pre-normalized
+    Python lists when numpy is unavailable.
+    """
+
+    def __init__(
+        self,
+        face_embeddings: Optional[Sequence[Sequence[float]]] = None,
+        bg_embeddings: Optional[Sequence[Sequence[float]]] = None,
+        version: Optional[str] = None,
+    ) -> None:
+        self.version = version
+        self._banks = {
+            "face": _normalize_rows(list(face_embeddings or [])),
+            "bg": _normalize_rows(list(bg_embeddings or [])),
+        }
+        self._indexes: Dict[str, "IVFIndex"] = {}
+
+    def attach_index(self, index: "IVFIndex", kind: str = "face") -> None:
+        """Route ``kind`` lookups through an ANN index (e.g. a cross-persona bank) instead of the dense matrix."""
+        self._indexes[kind] = index
+
+    @classmethod
+    def from_refs(cls, refs: Dict[str, List[List[float]]], version: Optional[str] = None) -> "ReferenceBank":
+        return cls(refs.get("face_embeddings"), refs.get("bg_embeddings"), version=version)
+
+    def size(self, kind: str = "face") -> int:
+        return len(self._banks[kind])
+
+    def _check_dim(self, bank: Any, dim: int) -> None:
+        bank_dim = bank.shape[1] if NUMPY_AVAILABLE else len(bank[0])
+        if dim != bank_dim:
+            raise ValueError(f"embedding dimension {dim} does not match reference bank dimension {bank_dim}")
+
+    def best_match(self, embedding: Optional[Sequence[float]], kind: str = "face") -> Tuple[float, int]:
+        index = self._indexes.get(kind)
+        if index is not None:
+            if embedding is None or len(embedding) == 0:
+                return 0.0, -1
+            hits = index.search(embedding, k=1)
+            return (hits[0][0], hits[0][1]) if hits else (0.0, -1)
+        bank = self._banks[kind]
+        if embedding is None or len(embedding) == 0 or len(bank) == 0:
+            return 0.0, -1
+        self._check_dim(bank, len(embedding))
+        q = _normalize_query(embedding)
+        if q is None:
+            return 0.0, -1
+        if NUMPY_AVAILABLE:
+            sims = bank @ q
+            idx = int(np.argmax(sims))
+            return float(sims[idx]), idx
+        best = float("-inf")
+        best_idx = -1
+        for idx, row in enumerate(bank):
+            sim = sum(map(operator.mul, row, q))
+            if sim > best:
+                best = sim
+                best_idx = idx
+        return best, best_idx
+
+    def max_similarity(self, embedding: Optional[Sequence[float]], kind: str = "face") -> float:
+        return self.best_match(embedding, kind)[0]
+
+    def score_batch(self, embeddings: Any, kind: str = "face") -> Tuple[Any, Any]:
+        """Best similarity and reference index for each row of ``embeddings`` (N x D)."""
+        bank = self._banks[kind]
+        if not NUMPY_AVAILABLE or kind in self._indexes:
+            matches = [self.best_match(e, kind) for e in embeddings]
+            return [m[0] for m in matches], [m[1] for m in matches]
+        queries = np.asarray(embeddings, dtype=np.float32)
+        if queries.ndim != 2 or queries.shape[0] == 0 or len(bank) == 0:
+            n = queries.shape[0] if queries.ndim == 2 else 0
+            return np.zeros(n, dtype=np.float32), np.full(n, -1, dtype=np.int64)
+        self._check_dim(bank, queries.shape[1])
+        norms = np.linalg.norm(queries, axis=1)
+        sims = queries @ bank.T
+        idx = np.argmax(sims, axis=1)
+        best = sims[np.arange(len(idx)), idx]
+        valid = norms > 0
+        best = np.where(valid, best / np.where(valid, norms, 1.0), 0.0).astype(np.float32)
+        return best, np.where(valid, idx, -1)
+
+
+class IVFIndex:
+    """Inverted-file ANN index over L2-normalized embeddings (cosine similarity), numpy only.
+
+    Vectors are bucketed by their nearest of ``nlist`` spherical k-means centroids; a query scans
+    the ``nprobe`` closest buckets, so ``nprobe`` trades recall for latency (``nprobe >= nlist``
+    is an exact scan). Until ``train_size`` vectors are present the index is a flat exact scan;
+    it trains itself once that size is reached and keeps assigning later inserts to the existing
+    centroids (call ``train()`` to recluster).
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        nlist: int = 32,
+        nprobe: int = 4,
+        train_size: Optional[int] = None,
+        kmeans_iters: int = 10,
+        seed: int = 0,
+    ) -> None:
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("IVFIndex requires numpy")
+        self.dim = int(dim)
+        self.nlist = max(1, int(nlist))
+        self.nprobe = max(1, int(nprobe))
+        self.train_size = int(train_size) if train_size is not None else self.nlist * 16
+        self.kmeans_iters = kmeans_iters
+        self.seed = seed
+        self.labels: List[str] = []
+        self.centroids: Optional[Any] = None
+        self._data = np.zeros((0, self.dim), dtype=np.float32)
+        self._count = 0
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._lists: List[Tuple[Any, Any, int]] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def _grow(self, extra: int) -> None:
+        need = self._count + extra
+        if need <= len(self._data):
+            return
+        cap = max(need, 2 * len(self._data), 64)
+        data = np.zeros((cap, self.dim), dtype=np.float32)
+        data[: self._count] = self._data[: self._count]
+        assign = np.zeros(cap, dtype=np.int32)
+        assign[: self._count] = self._assign[: self._count]
+        self._data = data
+        self._assign = assign
+
+    def _append_to_list(self, list_id: int, vecs: Any, rows: Any) -> None:
+        lvecs, lrows, size = self._lists[list_id]
+        need = size + len(vecs)
+        if need > len(lvecs):
+            cap = max(need, 2 * len(lvecs), 16)
+            grown_vecs = np.zeros((cap, self.dim), dtype=np.float32)
+            grown_vecs[:size] = lvecs[:size]
+            grown_rows = np.zeros(cap, dtype=np.int64)
+            grown_rows[:size] = lrows[:size]
+            lvecs, lrows = grown_vecs, grown_rows
+        lvecs[size:need] = vecs
+        lrows[size:need] = rows
+        self._lists[list_id] = (lvecs, lrows, need)
+
+    def _rebuild_lists(self) -> None:
+        n_lists = len(self.centroids) if self.trained else 1
+        self._lists = [(np.zeros((0, self.dim), dtype=np.float32), np.zeros(0, dtype=np.int64), 0) for _ in range(n_lists)]
+        assign = self._assign[: self._count]
+        for list_id in range(n_lists):
+            rows = np.nonzero(assign == list_id)[0]
+            if len(rows):
+                self._append_to_list(list_id, self._data[rows], rows)
+
+    def add(self, embeddings: Any, labels: Sequence[str]) -> None:
+        vecs = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        if len(vecs) != len(labels):
+            raise ValueError("embeddings and labels must be the same length")
+        if len(vecs) == 0:
+            return
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        vecs = np.divide(vecs, norms, out=np.zeros_like(vecs), where=norms > 0)
+        self._grow(len(vecs))
+        start = self._count
+        rows = np.arange(start, start + len(vecs))
+        self._data[start : start + len(vecs)] = vecs
+        self._count += len(vecs)
+        self.labels.extend(str(label) for label in labels)
+
+        if not self.trained and self._count >= self.train_size:
+            self.train()
+            return
+        if not self._lists:
+            self._lists = [(np.zeros((0, self.dim), dtype=np.float32), np.zeros(0, dtype=np.int64), 0)]
+        assign = np.argmax(vecs @ self.centroids.T, axis=1) if self.trained else np.zeros(len(vecs), dtype=np.int32)
+        self._assign[start : self._count] = assign
+        for list_id in np.unique(assign):
+            mask = assign == list_id
+            self._append_to_list(int(list_id), vecs[mask], rows[mask])
+
+    def train(self) -> None:
+        data = self._data[: self._count]
+        if len(data) == 0:
+            return
+        k = min(self.nlist, len(data))
+        rng = np.random.default_rng(self.seed)
+        centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+        assign = np.zeros(len(data), dtype=np.int32)
+        for _ in range(self.kmeans_iters):
+            assign = np.argmax(data @ centroids.T, axis=1).astype(np.int32)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, data)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms.ravel() == 0
+            if empty.any():
+                sums[empty] = data[rng.choice(len(data), size=int(empty.sum()))]
+                norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = sums / norms
+        self.centroids = centroids.astype(np.float32)
+        self._assign[: self._count] = np.argmax(data @ self.centroids.T, axis=1)
+        self._rebuild_lists()
+
+    def search(self, embedding: Sequence[float], k: int = 1, nprobe: Optional[int] = None) -> List[Tuple[float, int, str]]:
+        """Top-``k`` ``(similarity, row, label)`` hits, best first."""
+        if self._count == 0:
+            return []
+        q = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if len(q) != self.dim:
+            raise ValueError(f"embedding dimension {len(q)} does not match index dimension {self.dim}")
+        norm = float(np.linalg.norm(q))
+        if norm == 0:
+            return []
+        q = q / norm
+        if self.trained:
+            probe = min(len(self.centroids), nprobe or self.nprobe)
+            csims = self.centroids @ q
+            list_ids = np.argpartition(-csims, probe - 1)[:probe] if probe < len(csims) else range(len(csims))
+        else:
+            list_ids = range(len(self._lists))
+        sims_parts = []
+        rows_parts = []
+        for list_id in list_ids:
+            lvecs, lrows, size = self._lists[int(list_id)]
+            if size:
+                sims_parts.append(lvecs[:size] @ q)
+                rows_parts.append(lrows[:size])
+        if not sims_parts:
+            return []
+        sims = np.concatenate(sims_parts) if len(sims_parts) > 1 else sims_parts[0]
+        rows = np.concatenate(rows_parts) if len(rows_parts) > 1 else rows_parts[0]
+        k = min(k, len(sims))
+        top = np.argpartition(-sims, k - 1)[:k] if k < len(sims) else np.arange(len(sims))
+        top = top[np.argsort(-sims[top])]
+        return [(float(sims[i]), int(rows[i]), self.labels[int(rows[i])]) for i in top]
+
+    def max_similarity(self, embedding: Sequence[float], nprobe: Optional[int] = None) -> float:
+        hits = self.search(embedding, k=1, nprobe=nprobe)
+        return hits[0][0] if hits else 0.0
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as fh:
+            np.savez(
+                fh,
+                meta=np.array([self.dim, self.nlist, self.nprobe, self.train_size, self.kmeans_iters, self.seed], dtype=np.int64),
+                data=self._data[: self._count],
+                assign=self._assign[: self._count],
+                centroids=self.centroids if self.trained else np.zeros((0, self.dim), dtype=np.float32),
+                labels=np.array(self.labels, dtype=np.str_),
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IVFIndex":
+        with np.load(Path(path), allow_pickle=False) as payload:
+            dim, nlist, nprobe, train_size, kmeans_iters, seed = (int(v) for v in payload["meta"])
+            index = cls(dim, nlist=nlist, nprobe=nprobe, train_size=train_size, kmeans_iters=kmeans_iters, seed=seed)
+            data = payload["data"]
+            index._grow(len(data))
+            index._data[: len(data)] = data
+            index._assign[: len(data)] = payload["assign"]
+            index._count = len(data)
+            index.labels = [str(label) for label in payload["labels"]]
+            centroids = payload["centroids"]
+            index.centroids = centroids.copy() if len(centroids) else None
+        index._rebuild_lists()
+        return index
+
+    def persona_version_listener(
+        self,
+        load_embedding: Callable[[str], Optional[Sequence[float]]],
+        kind: str = "face",
+    ) -> Callable[[str, Dict[str, Any]], None]:
+        """Callback for ``PersonaRegistry.add_version_listener`` that inserts a new pack's embeddings.
+
+        ``load_embedding`` resolves an ``identity.face_embedding_refs`` (or, for ``kind="bg"``,
+        ``style.style_embedding_refs``) entry to its vector; labels are ``persona_id:version:ref``.
+        """
+        section, key = ("identity", "face_embedding_refs") if kind == "face" else ("style", "style_embedding_refs")
+
+        def on_version(persona_id: str, pack: Dict[str, Any]) -> None:
+            refs = (pack.get(section) or {}).get(key) or []
+            vectors: List[Sequence[float]] = []
+            labels: List[str] = []
+            for ref in refs:
+                vec = load_embedding(ref)
+                if vec is not None and len(vec) == self.dim:
+                    vectors.append(vec)
+                    labels.append(f"{persona_id}:{pack.get('version')}:{ref}")
+            if vectors:
+                self.add(vectors, labels)
+
+        return on_version
+
+
+def score_frames(
+    bank: ReferenceBank,
+    face_embeddings: Any = None,
+    bg_embeddings: Any = None,
+) -> Dict[str, Any]:
+    identity, identity_idx = bank.score_batch(face_embeddings, "face") if face_embeddings is not None else ([], [])
+    bg, bg_idx = bank.score_batch(bg_embeddings, "bg") if bg_embeddings is not None else ([], [])
+    return {
+        "identity_similarity": identity,
+        "identity_ref_index": identity_idx,
+        "bg_similarity": bg,
+        "bg_ref_index": bg_idx,
+    }
+
+
 def flicker_score(prev: List[float], nxt: List[float]) -> float:
     if not prev or not nxt:
         return 0.0
@@ -50,17 +413,139 @@ def flicker_score(prev: List[float], nxt: List[float]) -> float:
     return diff / n
 
 
+class LumaFlickerEngine:
+    """Temporal flicker on raw Y planes (the ``bytes`` from ``delivery_playback.load_image_planes``).
+
+    Each frame is decimated by ``stride`` and averaged into a ``grid`` of (cols, rows) blocks, then
+    compared with a running (EMA) reference grid. The mean block shift is reported as
+    ``exposure_shift``; ``local_flicker`` is what remains after removing it. Scores are in luma
+    units / 255. ``flicker_score`` is ``local_flicker`` when ``separate_exposure`` is set, otherwise
+    the raw mean block difference.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        grid: Tuple[int, int] = (18, 32),
+        stride: int = 4,
+        reference_alpha: float = 0.5,
+        separate_exposure: bool = True,
+    ) -> None:
+        self.width = int(width)
+        self.height = int(height)
+        self.stride = max(1, int(stride))
+        self.grid_cols, self.grid_rows = grid
+        self.block_w = (self.width // self.stride) // self.grid_cols
+        self.block_h = (self.height // self.stride) // self.grid_rows
+        if self.block_w < 1 or self.block_h < 1:
+            raise ValueError("grid is too fine for the frame size and stride")
+        self.reference_alpha = max(0.0, min(1.0, reference_alpha))
+        self.separate_exposure = separate_exposure
+        self._blocks = self.grid_cols * self.grid_rows
+        self._has_reference = False
+        if NUMPY_AVAILABLE:
+            self._sub = np.empty((self.grid_rows * self.block_h, self.grid_cols * self.block_w), dtype=np.float32)
+            self._grid = np.empty((self.grid_rows, self.grid_cols), dtype=np.float32)
+            self._ref = np.zeros((self.grid_rows, self.grid_cols), dtype=np.float32)
+            self._diff = np.empty((self.grid_rows, self.grid_cols), dtype=np.float32)
+        else:
+            self._grid_py = [0.0] * self._blocks
+            self._ref_py = [0.0] * self._blocks
+
+    def reset(self) -> None:
+        self._has_reference = False
+
+    def _downsample_np(self, y_plane: Any) -> Any:
+        y = np.frombuffer(y_plane, dtype=np.uint8, count=self.width * self.height).reshape(self.height, self.width)
+        rows = self.grid_rows * self.block_h * self.stride
+        cols = self.grid_cols * self.block_w * self.stride
+        np.copyto(self._sub, y[:rows:self.stride, :cols:self.stride])
+        blocks = self._sub.reshape(self.grid_rows, self.block_h, self.grid_cols, self.block_w)
+        blocks.sum(axis=(1, 3), out=self._grid)
+        self._grid *= 1.0 / (self.block_h * self.block_w * 255.0)
+        return self._grid
+
+    def _downsample_py(self, y_plane: Any) -> List[float]:
+        plane = memoryview(y_plane)
+        grid = self._grid_py
+        for i in range(self._blocks):
+            grid[i] = 0.0
+        span = self.block_w * self.stride
+        for gy in range(self.grid_rows):
+            base_row = gy * self.block_h
+            out = gy * self.grid_cols
+            for r in range(self.block_h):
+                offset = (base_row + r) * self.stride * self.width
+                for gx in range(self.grid_cols):
+                    start = offset + gx * span
+                    grid[out + gx] += sum(plane[start : start + span : self.stride])
+        scale = 1.0 / (self.block_h * self.block_w * 255.0)
+        for i in range(self._blocks):
+            grid[i] *= scale
+        return grid
+
+    def update(self, y_plane: Any) -> Dict[str, float]:
+        a = self.reference_alpha
+        if NUMPY_AVAILABLE:
+            grid = self._downsample_np(y_plane)
+            if not self._has_reference:
+                self._ref[...] = grid
+                self._has_reference = True
+                return {"flicker_score": 0.0, "local_flicker": 0.0, "exposure_shift": 0.0, "max_block_diff": 0.0}
+            np.subtract(grid, self._ref, out=self._diff)
+            shift = float(self._diff.mean())
+            raw = float(np.abs(self._diff).mean())
+            self._diff -= shift
+            np.abs(self._diff, out=self._diff)
+            local = float(self._diff.mean())
+            peak = float(self._diff.max())
+            self._ref *= a
+            self._ref += (1.0 - a) * grid
+        else:
+            grid = self._downsample_py(y_plane)
+            ref = self._ref_py
+            n = self._blocks
+            if not self._has_reference:
+                ref[:] = grid
+                self._has_reference = True
+                return {"flicker_score": 0.0, "local_flicker": 0.0, "exposure_shift": 0.0, "max_block_diff": 0.0}
+            diffs = [grid[i] - ref[i] for i in range(n)]
+            shift = sum(diffs) / n
+            raw = sum(abs(d) for d in diffs) / n
+            local_diffs = [abs(d - shift) for d in diffs]
+            local = sum(local_diffs) / n
+            peak = max(local_diffs)
+            for i in range(n):
+                ref[i] = ref[i] * a + grid[i] * (1.0 - a)
+        return {
+            "flicker_score": local if self.separate_exposure else raw,
+            "local_flicker": local,
+            "exposure_shift": shift,
+            "max_block_diff": peak,
+        }
+
+
 def score_frame(
     face_embedding: Optional[List[float]] = None,
     bg_embedding: Optional[List[float]] = None,
     prev_frame_luma: Optional[List[float]] = None,
     frame_luma: Optional[List[float]] = None,
-    refs: Optional[Dict[str, List[List[float]]]] = None,
+    refs: Optional[Union[Dict[str, List[List[float]]], ReferenceBank]] = None,
+    y_plane: Optional[Any] = None,
+    flicker_engine: Optional[LumaFlickerEngine] = None,
 ) -> Dict[str, float]:
-    refs = refs or {}
-    identity = max_similarity(face_embedding, refs.get("face_embeddings", [])) if face_embedding else 0.0
-    bg = max_similarity(bg_embedding, refs.get("bg_embeddings", [])) if bg_embedding else 0.0
-    flicker = flicker_score(prev_frame_luma, frame_luma) if prev_frame_luma and frame_luma else 0.0
+    if isinstance(refs, ReferenceBank):
+        identity = refs.max_similarity(face_embedding, "face")
+        bg = refs.max_similarity(bg_embedding, "bg")
+    else:
+        refs = refs or {}
+        identity = max_similarity(face_embedding, refs.get("face_embeddings", [])) if face_embedding else 0.0
+        bg = max_similarity(bg_embedding, refs.get("bg_embeddings", [])) if bg_embedding else 0.0
+    if flicker_engine is not None and y_plane is not None:
+        flicker = flicker_engine.update(y_plane)["flicker_score"]
+    else:
+        flicker = flicker_score(prev_frame_luma, frame_luma) if prev_frame_luma and frame_luma else 0.0
     return {"identity_similarity": identity, "bg_similarity": bg, "flicker_score": flicker}
 
 
@@ -101,3 +586,533 @@ def recommend_action(bands: Dict[str, str]) -> Dict[str, str]:
     if bands["identity"] == "warn" or bands["background"] == "warn" or bands["flicker"] == "warn":
         return {"action": "STRENGTHEN_ANCHOR", "reason": "warn"}
     return {"action": "NONE", "reason": "ok"}
+
+
+class RollingStats:
+    """Fixed-window mean/variance in O(1) per sample plus a histogram sketch for quantiles.
+
+    Quantiles are exact to within one histogram bin (``(hi - lo) / bins``) over the window.
+    """
+
+    def __init__(self, capacity: int = 64, lo: float = 0.0, hi: float = 1.0, bins: int = 100) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = int(capacity)
+        self.lo = lo
+        self.hi = hi
+        self.bins = max(1, int(bins))
+        self._scale = self.bins / (hi - lo)
+        self._values = array.array("d", [0.0]) * self.capacity
+        self._bin_of = array.array("i", [0]) * self.capacity
+        self._hist = array.array("i", [0]) * self.bins
+        self._head = 0
+        self.count = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._since_resum = 0
+
+    def _bin(self, x: float) -> int:
+        b = int((x - self.lo) * self._scale)
+        return 0 if b < 0 else (self.bins - 1 if b >= self.bins else b)
+
+    def push(self, x: float) -> None:
+        i = self._head
+        if self.count == self.capacity:
+            old = self._values[i]
+            self._sum -= old
+            self._sumsq -= old * old
+            self._hist[self._bin_of[i]] -= 1
+        else:
+            self.count += 1
+        b = self._bin(x)
+        self._values[i] = x
+        self._bin_of[i] = b
+        self._hist[b] += 1
+        self._sum += x
+        self._sumsq += x * x
+        self._head = (i + 1) % self.capacity
+        self._since_resum += 1
+        if self._since_resum >= self.capacity:
+            # Re-sum once per window so add/subtract rounding error cannot accumulate.
+            live = self._values if self.count == self.capacity else self._values[: self.count]
+            self._sum = sum(live)
+            self._sumsq = sum(v * v for v in live)
+            self._since_resum = 0
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        mu = self._sum / self.count
+        return max(0.0, self._sumsq / self.count - mu * mu)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = max(1.0, q * self.count)
+        seen = 0
+        for b in range(self.bins):
+            seen += self._hist[b]
+            if seen >= target:
+                return self.lo + (b + 0.5) / self._scale
+        return self.hi
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "mean": self.mean,
+            "variance": self.variance,
+            "p10": self.quantile(0.1),
+            "p90": self.quantile(0.9),
+            "count": float(self.count),
+        }
+
+
+def _band_with_hysteresis(value: float, warn: float, fail: float, current: str, margin: float, higher_is_better: bool) -> str:
+    # Normalize so that "worse" always means smaller, then require `margin` to move back up a band.
+    if not higher_is_better:
+        value, warn, fail = -value, -warn, -fail
+    if current == "fail" and value < fail + margin:
+        return "fail"
+    if value < fail:
+        return "fail"
+    if current in ("fail", "warn") and value < warn + margin:
+        return "warn"
+    if value < warn:
+        return "warn"
+    return "ok"
+
+
+class _BandTracker:
+    __slots__ = ("band", "candidate", "streak")
+
+    def __init__(self) -> None:
+        self.band = "ok"
+        self.candidate = "ok"
+        self.streak = 0
+
+    def step(self, raw: str, sustain: int) -> bool:
+        if raw == self.band:
+            self.candidate = raw
+            self.streak = 0
+            return False
+        if raw == self.candidate:
+            self.streak += 1
+        else:
+            self.candidate = raw
+            self.streak = 1
+        if self.streak >= sustain:
+            self.band = raw
+            self.streak = 0
+            return True
+        return False
+
+
+_DRIFT_METRICS = (
+    ("identity", "identity_similarity", "identity_warn", "identity_fail", True),
+    ("background", "bg_similarity", "bg_warn", "bg_fail", True),
+    ("flicker", "flicker_score", "flicker_warn", "flicker_fail", False),
+)
+
+
+class DriftMonitor:
+    """Per-session drift monitor: rolling windows, hysteresis bands and sustained-deviation actions.
+
+    A metric only changes band after ``sustain`` consecutive samples agree, and leaving a worse
+    band requires clearing its threshold by ``hysteresis``. ``update`` returns the
+    ``recommend_action`` result when the adopted bands change to something actionable, else None.
+    """
+
+    def __init__(
+        self,
+        window: int = 64,
+        thresholds: Optional[Dict[str, float]] = None,
+        sustain: int = 4,
+        hysteresis: float = 0.02,
+        bins: int = 100,
+    ) -> None:
+        t = dict(DEFAULT_DRIFT_THRESHOLDS)
+        if thresholds:
+            t.update(thresholds)
+        self.thresholds = t
+        self.sustain = max(1, int(sustain))
+        self.hysteresis = hysteresis
+        self.stats = {
+            "identity": RollingStats(window, 0.0, 1.0, bins),
+            "background": RollingStats(window, 0.0, 1.0, bins),
+            "flicker": RollingStats(window, 0.0, 1.0, bins),
+        }
+        self._bands = {name: _BandTracker() for name in self.stats}
+        self._last_action = "NONE"
+        self.samples = 0
+
+    @property
+    def bands(self) -> Dict[str, str]:
+        return {name: tracker.band for name, tracker in self._bands.items()}
+
+    def _push(self, values: Tuple[float, float, float]) -> Optional[Dict[str, str]]:
+        self.samples += 1
+        changed = False
+        t = self.thresholds
+        for (name, _, warn_key, fail_key, higher), value in zip(_DRIFT_METRICS, values):
+            self.stats[name].push(value)
+            tracker = self._bands[name]
+            raw = _band_with_hysteresis(value, t[warn_key], t[fail_key], tracker.band, self.hysteresis, higher)
+            changed = tracker.step(raw, self.sustain) or changed
+        if not changed:
+            return None
+        action = recommend_action(self.bands)
+        previous = self._last_action
+        self._last_action = action["action"]
+        if action["action"] == "NONE" or action["action"] == previous:
+            return None
+        return action
+
+    def update(self, signal: Dict[str, float]) -> Optional[Dict[str, str]]:
+        return self._push(tuple(float(signal[key]) for _, key, _, _, _ in _DRIFT_METRICS))
+
+    def ingest(self, batch: Any) -> List[Tuple[int, Dict[str, str]]]:
+        """Bulk path for offline clips: ``batch`` is a list of signal dicts or a dict of equal-length
+        score sequences keyed like DriftSignal. Returns ``(sample_index, action)`` for each emission."""
+        if isinstance(batch, dict):
+            columns = [batch[key] for _, key, _, _, _ in _DRIFT_METRICS]
+            rows = zip(*(c.tolist() if hasattr(c, "tolist") else c for c in columns))
+        else:
+            rows = (tuple(float(sig[key]) for _, key, _, _, _ in _DRIFT_METRICS) for sig in batch)
+        events: List[Tuple[int, Dict[str, str]]] = []
+        start = self.samples
+        for offset, values in enumerate(rows):
+            action = self._push(values)
+            if action is not None:
+                events.append((start + offset, action))
+        return events
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "bands": self.bands,
+            "stats": {name: stats.summary() for name, stats in self.stats.items()},
+        }
+
+
+DRIFT_SAMPLING_EVENTS = ("anchor_reset", "camera_mode_change", "pose_jump")
+
+
+class DriftSamplingScheduler:
+    """Decides which frames get face/background embeddings for ``score_frame``.
+
+    The sampling interval shrinks from ``max_interval_ms`` to ``dense_interval_ms`` as risk rises:
+    risk is 1 for ``dense_hold_ms`` after an anchor reset, camera-mode change or pose jump, and
+    otherwise grows as the latest/trend similarities approach the warn thresholds (within
+    ``margin``) or flicker approaches its warn level. A token bucket caps the rate at
+    ``budget_per_sec`` embeddings per second.
+    """
+
+    def __init__(
+        self,
+        budget_per_sec: float = 4.0,
+        max_interval_ms: float = 1000.0,
+        dense_interval_ms: float = 100.0,
+        dense_hold_ms: float = 1500.0,
+        margin: float = 0.06,
+        pose_jump_deg: float = 12.0,
+        thresholds: Optional[Dict[str, float]] = None,
+    ) -> None:
+        t = dict(DEFAULT_DRIFT_THRESHOLDS)
+        if thresholds:
+            t.update(thresholds)
+        self.thresholds = t
+        self.budget_per_sec = max(1e-6, budget_per_sec)
+        self.max_interval_ms = max_interval_ms
+        self.dense_interval_ms = min(dense_interval_ms, max_interval_ms)
+        self.dense_hold_ms = dense_hold_ms
+        self.margin = max(1e-6, margin)
+        self.pose_jump_deg = pose_jump_deg
+        self._tokens = self.budget_per_sec
+        self._last_refill_ms: Optional[float] = None
+        self._last_sample_ms: Optional[float] = None
+        self._dense_until_ms = float("-inf")
+        self._last_pose: Optional[Tuple[float, float, float]] = None
+        self._last_signal: Optional[Dict[str, float]] = None
+        self._trend: Optional[Dict[str, float]] = None
+        self.sampled = 0
+        self.skipped = 0
+
+    def note_event(self, kind: str, now_ms: float) -> None:
+        if kind not in DRIFT_SAMPLING_EVENTS:
+            raise ValueError(f"unknown drift sampling event: {kind}")
+        self._dense_until_ms = max(self._dense_until_ms, now_ms + self.dense_hold_ms)
+
+    def observe_pose(self, pose_yaw_pitch_roll: Optional[Sequence[float]], now_ms: float) -> None:
+        if not pose_yaw_pitch_roll:
+            return
+        pose = tuple(float(v) for v in pose_yaw_pitch_roll[:3])
+        if self._last_pose is not None:
+            jump = max(abs(a - b) for a, b in zip(pose, self._last_pose))
+            if jump >= self.pose_jump_deg:
+                self.note_event("pose_jump", now_ms)
+        self._last_pose = pose
+
+    def observe_signal(self, signal: Dict[str, float]) -> None:
+        self._last_signal = signal
+        self._trend = update_drift_trend(self._trend, signal)
+
+    def risk(self, now_ms: float) -> float:
+        if now_ms < self._dense_until_ms or self._last_signal is None:
+            return 1.0
+        t = self.thresholds
+        sig = self._last_signal
+        trend = self._trend or {}
+        identity = min(sig["identity_similarity"], trend.get("identity_avg", sig["identity_similarity"]))
+        bg = min(sig["bg_similarity"], trend.get("bg_avg", sig["bg_similarity"]))
+        flicker = max(sig["flicker_score"], trend.get("flicker_avg", sig["flicker_score"]))
+        headroom = min(identity - t["identity_warn"], bg - t["bg_warn"], t["flicker_warn"] - flicker)
+        return max(0.0, min(1.0, 1.0 - headroom / self.margin))
+
+    def interval_ms(self, now_ms: float) -> float:
+        r = self.risk(now_ms)
+        return self.max_interval_ms - r * (self.max_interval_ms - self.dense_interval_ms)
+
+    def should_sample(self, now_ms: float) -> bool:
+        if self._last_refill_ms is not None:
+            elapsed = max(0.0, now_ms - self._last_refill_ms)
+            self._tokens = min(self.budget_per_sec, self._tokens + elapsed / 1000.0 * self.budget_per_sec)
+        self._last_refill_ms = now_ms
+        due = self._last_sample_ms is None or now_ms - self._last_sample_ms >= self.interval_ms(now_ms)
+        if due and self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self._last_sample_ms = now_ms
+            self.sampled += 1
+            return True
+        self.skipped += 1
+        return False
+
+
+def replay_sampling_trace(trace: Sequence[Dict[str, Any]], scheduler: DriftSamplingScheduler) -> Dict[str, float]:
+    """Replay a recorded per-frame trace through ``scheduler`` and compare with embedding every frame.
+
+    Each entry needs ``timestamp_ms`` and the three DriftSignal scores; optional ``events`` (list of
+    DRIFT_SAMPLING_EVENTS) and ``pose_yaw_pitch_roll`` are fed to the scheduler. Detection latency is
+    measured from the first frame of each non-ok episode to the first sampled frame that sees it.
+    """
+    thresholds = scheduler.thresholds
+    sampled = 0
+    episode_start: Optional[float] = None
+    detected = False
+    latencies: List[float] = []
+    missed = 0
+    for frame in trace:
+        now_ms = float(frame["timestamp_ms"])
+        for kind in frame.get("events") or ():
+            scheduler.note_event(kind, now_ms)
+        scheduler.observe_pose(frame.get("pose_yaw_pitch_roll"), now_ms)
+        bands = classify_drift(frame, thresholds)
+        drifting = any(band != "ok" for band in bands.values())
+        if drifting and episode_start is None:
+            episode_start = now_ms
+            detected = False
+        elif not drifting and episode_start is not None:
+            if not detected:
+                missed += 1
+            episode_start = None
+        if scheduler.should_sample(now_ms):
+            sampled += 1
+            scheduler.observe_signal(frame)
+            if drifting and not detected and episode_start is not None:
+                latencies.append(now_ms - episode_start)
+                detected = True
+    if episode_start is not None and not detected:
+        missed += 1
+    frames = len(trace)
+    return {
+        "frames": float(frames),
+        "embeddings": float(sampled),
+        "compute_saved": 1.0 - sampled / frames if frames else 0.0,
+        "episodes_detected": float(len(latencies)),
+        "episodes_missed": float(missed),
+        "mean_detection_latency_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+        "max_detection_latency_ms": max(latencies) if latencies else 0.0,
+    }
+
+
+class StandInEmbedder:
+    """Deterministic local embedder for load-testing the drift path without a model.
+
+    Each crop (``bytes``/``bytearray``/uint8 array of ``input_size`` pixels) is average-pooled
+    to ``pool`` cells and projected with a fixed seeded Gaussian matrix, then L2-normalized.
+    Identical crops give identical embeddings and similar crops give similar ones.
+    """
+
+    def __init__(self, dim: int = 512, input_size: Tuple[int, int] = (96, 96), pool: int = 8, seed: int = 0) -> None:
+        self.dim = int(dim)
+        self.input_w, self.input_h = input_size
+        self.pool = max(1, int(pool))
+        self.cell_w = max(1, self.input_w // self.pool)
+        self.cell_h = max(1, self.input_h // self.pool)
+        features = self.pool * self.pool
+        rng = random.Random(seed)
+        rows = [[rng.gauss(0.0, 1.0) for _ in range(self.dim)] for _ in range(features)]
+        if NUMPY_AVAILABLE:
+            self._proj = np.asarray(rows, dtype=np.float32)
+        else:
+            self._proj_py = rows
+
+    def _pooled_py(self, crop: Any) -> List[float]:
+        data = bytes(crop)
+        out: List[float] = []
+        for gy in range(self.pool):
+            for gx in range(self.pool):
+                total = 0
+                for r in range(gy * self.cell_h, (gy + 1) * self.cell_h):
+                    start = r * self.input_w + gx * self.cell_w
+                    total += sum(data[start : start + self.cell_w])
+                out.append(total / (self.cell_w * self.cell_h * 255.0) - 0.5)
+        return out
+
+    def embed_batch(self, crops: Sequence[Any]) -> List[List[float]]:
+        if not crops:
+            return []
+        if NUMPY_AVAILABLE:
+            h = self.pool * self.cell_h
+            w = self.pool * self.cell_w
+            pixels = np.stack(
+                [np.frombuffer(bytes(c) if not isinstance(c, np.ndarray) else c.tobytes(), dtype=np.uint8, count=self.input_w * self.input_h)
+                 .reshape(self.input_h, self.input_w)[:h, :w] for c in crops]
+            ).astype(np.float32)
+            pooled = pixels.reshape(len(crops), self.pool, self.cell_h, self.pool, self.cell_w).mean(axis=(2, 4))
+            feats = pooled.reshape(len(crops), -1) / 255.0 - 0.5
+            emb = feats @ self._proj
+            norms = np.linalg.norm(emb, axis=1, keepdims=True)
+            emb = np.divide(emb, norms, out=np.zeros_like(emb), where=norms > 0)
+            return emb.tolist()
+        out: List[List[float]] = []
+        for crop in crops:
+            feats = self._pooled_py(crop)
+            emb = [0.0] * self.dim
+            for f, row in zip(feats, self._proj_py):
+                if f:
+                    for j in range(self.dim):
+                        emb[j] += f * row[j]
+            norm = sum(v * v for v in emb) ** 0.5
+            out.append([v / norm for v in emb] if norm > 0 else emb)
+        return out
+
+
+class EmbeddingBatcher:
+    """In-process micro-batching queue shared by many sessions.
+
+    ``await embed(crop)`` enqueues a crop; a single worker task flushes when ``max_batch`` requests
+    are waiting or the oldest has waited ``max_wait_ms``, runs one ``embed_batch`` call (in the
+    default executor when ``offload`` is set, so the loop keeps pacing media) and resolves each
+    request's future. ``stats()`` reports queue wait, batch sizes and throughput.
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        max_batch: int = 16,
+        max_wait_ms: float = 8.0,
+        offload: bool = True,
+    ) -> None:
+        self.embedder = embedder
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait_ms = max_wait_ms
+        self.offload = offload
+        self._pending: List[Tuple[Any, "asyncio.Future[List[float]]", float]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+        self._started_at: Optional[float] = None
+        self._items = 0
+        self._batches = 0
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._embed_total_ms = 0.0
+        self._max_batch_seen = 0
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+
+    async def embed(self, crop: Any) -> List[float]:
+        if self._closed:
+            raise RuntimeError("EmbeddingBatcher is closed")
+        self._ensure_worker()
+        future: "asyncio.Future[List[float]]" = asyncio.get_running_loop().create_future()
+        self._pending.append((crop, future, time.monotonic()))
+        if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not (self._closed and not self._pending):
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            deadline = self._pending[0][2] + self.max_wait_ms / 1000.0
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            batch = self._pending[: self.max_batch]
+            del self._pending[: self.max_batch]
+            crops = [item[0] for item in batch]
+            flushed_at = time.monotonic()
+            try:
+                if self.offload:
+                    vectors = await loop.run_in_executor(None, self.embedder.embed_batch, crops)
+                else:
+                    vectors = self.embedder.embed_batch(crops)
+                # A short result would leave the unmatched callers waiting forever.
+                if len(vectors) != len(batch):
+                    raise ValueError(f"embed_batch returned {len(vectors)} vectors for {len(batch)} crops")
+            except Exception as exc:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            done_at = time.monotonic()
+            self._batches += 1
+            self._items += len(batch)
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+            self._embed_total_ms += (done_at - flushed_at) * 1000.0
+            for (_, future, enqueued), vector in zip(batch, vectors):
+                wait_ms = (flushed_at - enqueued) * 1000.0
+                self._wait_total_ms += wait_ms
+                self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+                if not future.done():
+                    future.set_result(vector)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._worker is not None:
+            await self._worker
+
+    def stats(self) -> Dict[str, float]:
+        elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "items": float(self._items),
+            "batches": float(self._batches),
+            "mean_batch_size": self._items / self._batches if self._batches else 0.0,
+            "max_batch_size": float(self._max_batch_seen),
+            "mean_queue_wait_ms": self._wait_total_ms / self._items if self._items else 0.0,
+            "max_queue_wait_ms": self._wait_max_ms,
+            "mean_embed_ms": self._embed_total_ms / self._batches if self._batches else 0.0,
+            "throughput_per_s": self._items / elapsed if elapsed > 0 else 0.0,
+        }
+
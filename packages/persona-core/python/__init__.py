@@ -11,6 +11,7 @@ from .persona_core import (
     select_canonical_anchor,
     should_refresh_anchor,
     validate_persona_pack,
+    validate_persona_pack_schema,
 )
 
 # Import generated Pydantic models
@@ -39,6 +40,7 @@ __all__ = [
     "select_canonical_anchor",
     "should_refresh_anchor",
     "validate_persona_pack",
+    "validate_persona_pack_schema",
     # Generated models
     "AnchorEntry",
     "AnchorMetadata",
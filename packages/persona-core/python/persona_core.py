@@ -5,6 +5,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+try:  # compiled schema validators are optional
+    from schema_validators import compile_validator
+except ImportError:  # pragma: no cover - exercised only without schema-validators
+    compile_validator = None  # type: ignore[assignment]
+
 
 CAMERA_MODES = ["A_SELFIE", "B_MIRROR", "C_CUTAWAY"]
 
@@ -60,6 +65,21 @@ def validate_persona_pack(pack: Any) -> Dict[str, Any]:
     return {"ok": len(errors) == 0, "errors": errors}
 
 
+_PACK_SCHEMA_VALIDATOR: Dict[str, Callable[[Any], List[str]]] = {}
+
+
+def validate_persona_pack_schema(pack: Any) -> Dict[str, Any]:
+    """Full persona_pack.schema.json check through a compiled validator."""
+    if compile_validator is None:
+        raise RuntimeError("validate_persona_pack_schema requires the schema-validators package")
+    validator = _PACK_SCHEMA_VALIDATOR.get("pack")
+    if validator is None:
+        validator = compile_validator(read_persona_pack_schema_json(), root="pack", prefix="persona_pack")
+        _PACK_SCHEMA_VALIDATOR["pack"] = validator
+    errors = validator(pack)
+    return {"ok": len(errors) == 0, "errors": errors}
+
+
 def get_anchor_set(pack: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
     anchor_sets = pack.get("anchor_sets") if isinstance(pack, dict) else None
     if isinstance(anchor_sets, dict) and mode in anchor_sets:
@@ -201,6 +221,10 @@ class PersonaRegistry:
     def __init__(self, asset_resolver: Optional[Callable[[str], str]] = None) -> None:
         self.asset_resolver = asset_resolver
         self.personas: Dict[str, PersonaRegistryEntry] = {}
+        self.version_listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+    def add_version_listener(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        self.version_listeners.append(listener)
 
     def create_persona(self, persona_id: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         if not persona_id:
@@ -227,6 +251,8 @@ class PersonaRegistry:
             raise ValueError("version must be a string")
 
         entry.versions[version] = pack
+        for listener in self.version_listeners:
+            listener(persona_id, pack)
         return version
 
     def get_persona_pack(self, persona_id: str, version: str) -> Optional[Dict[str, Any]]:
@@ -1,29 +1,43 @@
 from .planning_control import (
     CAMERA_MODES,
     DEFAULT_BUDGET,
+    StreamingSegmenter,
+    TurnPlanPromptCompiler,
     TurnPlanResult,
+    TurnPlanStreamParser,
+    add_prompt_invalidation_listener,
     build_turn_plan_prompt,
     clamp_turn_plan,
     create_heuristic_turn_plan,
     estimate_speech_seconds,
+    invalidate_turn_plan_prompts,
     load_turn_plan_schema,
+    segment_text,
     split_into_segments,
     split_sentences,
     turn_budget,
     validate_turn_plan,
+    validate_turn_plan_schema,
 )
 
 __all__ = [
     "CAMERA_MODES",
     "DEFAULT_BUDGET",
+    "StreamingSegmenter",
+    "TurnPlanPromptCompiler",
     "TurnPlanResult",
+    "TurnPlanStreamParser",
+    "add_prompt_invalidation_listener",
     "build_turn_plan_prompt",
     "clamp_turn_plan",
     "create_heuristic_turn_plan",
     "estimate_speech_seconds",
+    "invalidate_turn_plan_prompts",
     "load_turn_plan_schema",
+    "segment_text",
     "split_into_segments",
     "split_sentences",
     "turn_budget",
     "validate_turn_plan",
+    "validate_turn_plan_schema",
 ]
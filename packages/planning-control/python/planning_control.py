@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import copy
 import json
 import math
 import os
 import re
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:  # compiled schema validators are optional
+    from schema_validators import compile_validator
+except ImportError:  # pragma: no cover - exercised only without schema-validators
+    compile_validator = None  # type: ignore[assignment]
 
 
 DEFAULT_BUDGET = {
@@ -35,6 +42,106 @@ def load_turn_plan_schema() -> Dict[str, Any]:
     return _apply_budget_to_schema(schema, turn_budget())
 
 
+# Parsed schema file and compiled system prompts, keyed by (budget, camera modes).
+_RAW_SCHEMA_CACHE: Dict[str, Any] = {}
+_SYSTEM_PROMPT_CACHE: Dict[Tuple[Any, ...], str] = {}
+_PROMPT_INVALIDATION_LISTENERS: List[Callable[[], None]] = []
+_PROMPT_COMPILERS: "weakref.WeakSet[TurnPlanPromptCompiler]" = weakref.WeakSet()
+_SCHEMA_VALIDATOR_CACHE: Dict[Tuple[Any, ...], Callable[[Any], List[str]]] = {}
+
+
+def _raw_turn_plan_schema() -> Dict[str, Any]:
+    schema = _RAW_SCHEMA_CACHE.get("schema")
+    if schema is None:
+        schema = json.loads(_schema_path().read_text("utf-8"))
+        _RAW_SCHEMA_CACHE["schema"] = schema
+    return schema
+
+
+def _budget_key(budget: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        float(budget["hardcap_sec"]),
+        float(budget["min_target_sec"]),
+        tuple(float(v) for v in budget["default_target_range_sec"]),
+        float(budget["tail_buffer_sec"]),
+    )
+
+
+def _compile_system_prompt(budget: Dict[str, Any], camera_modes: Sequence[str]) -> str:
+    key = (_budget_key(budget), tuple(camera_modes))
+    system = _SYSTEM_PROMPT_CACHE.get(key)
+    if system is not None:
+        return system
+    schema = _apply_budget_to_schema(copy.deepcopy(_raw_turn_plan_schema()), budget)
+    schema_text = json.dumps(schema, indent=2, sort_keys=True)
+    system = "\n".join([
+        "You are a planning engine that outputs STRICT JSON only.",
+        "Produce a TurnPlan that matches the provided JSON schema exactly.",
+        f"Constraints: hardcap={budget['hardcap_sec']:g}s, default ~{budget['default_target_range_sec'][0]:g}s, allow up to {budget['default_target_range_sec'][1]:g}s, minimum {budget['min_target_sec']:g}s unless ultra-short.",
+        f"Camera modes: {', '.join(camera_modes)}.",
+        "Speech segments must be ordered by priority (0 is highest priority).",
+        "Never cut mid-segment; segments should be safe boundaries.",
+        "Actor timeline should include listening->speaking transitions and reasonable emotion/gaze hints.",
+        "",
+        "TURN PLAN JSON SCHEMA:",
+        schema_text,
+    ])
+    _SYSTEM_PROMPT_CACHE[key] = system
+    return system
+
+
+def _user_prompt(user_text: str, persona: Optional[Dict[str, str]], camera_mode: str) -> str:
+    persona_name = persona.get("name") if persona else None
+    persona_style = persona.get("style") if persona else None
+    return "\n".join([
+        f"Persona: {persona_name or '(unspecified)'}",
+        f"Style: {persona_style or '(unspecified)'}",
+        f"Camera mode suggestion: {camera_mode}",
+        "",
+        "User message:",
+        user_text,
+    ])
+
+
+def add_prompt_invalidation_listener(listener: Callable[[], None]) -> None:
+    _PROMPT_INVALIDATION_LISTENERS.append(listener)
+
+
+def invalidate_turn_plan_prompts() -> None:
+    """Drop cached schema/system prompts; call when the schema file or budget config changes."""
+    _RAW_SCHEMA_CACHE.clear()
+    _SYSTEM_PROMPT_CACHE.clear()
+    _SCHEMA_VALIDATOR_CACHE.clear()
+    for compiler in list(_PROMPT_COMPILERS):
+        compiler.refresh()
+    for listener in list(_PROMPT_INVALIDATION_LISTENERS):
+        listener()
+
+
+class TurnPlanPromptCompiler:
+    """Serves turn-plan prompts from a budget snapshot taken once.
+
+    The system prompt is built once per (budget, camera-mode set) and returned as the same
+    string on every turn, so providers' prefix caching can hit; only the user part is formatted
+    per call. ``invalidate_turn_plan_prompts()`` (or ``refresh()``) re-snapshots the budget.
+    """
+
+    def __init__(self, budget: Optional[Dict[str, Any]] = None, camera_modes: Optional[Sequence[str]] = None) -> None:
+        self._fixed_budget = dict(budget) if budget is not None else None
+        self.camera_modes = tuple(camera_modes or CAMERA_MODES)
+        self.budget: Dict[str, Any] = {}
+        self.system = ""
+        self.refresh()
+        _PROMPT_COMPILERS.add(self)
+
+    def refresh(self) -> None:
+        self.budget = dict(self._fixed_budget) if self._fixed_budget is not None else turn_budget()
+        self.system = _compile_system_prompt(self.budget, self.camera_modes)
+
+    def build(self, user_text: str, persona: Optional[Dict[str, str]] = None, camera_mode: str = "A_SELFIE") -> Dict[str, str]:
+        return {"system": self.system, "user": _user_prompt(user_text, persona, camera_mode)}
+
+
 def _env_float(key: str, default: float) -> float:
     raw = (os.environ.get(key) or "").strip()
     if not raw:
@@ -104,14 +211,14 @@ def split_sentences(text: str) -> List[str]:
     if not cleaned:
         return []
     out: List[str] = []
-    buf = ""
-    for ch in cleaned:
-        buf += ch
+    start = 0
+    for idx, ch in enumerate(cleaned):
         if ch in ".!?":
-            out.append(buf.strip())
-            buf = ""
-    if buf.strip():
-        out.append(buf.strip())
+            out.append(cleaned[start : idx + 1].strip())
+            start = idx + 1
+    tail = cleaned[start:].strip()
+    if tail:
+        out.append(tail)
     return [s for s in out if s]
 
 
@@ -139,6 +246,178 @@ def split_into_segments(text: str, max_words: int = 28, max_segments: int = 8) -
     return segments
 
 
+# Sentence terminators; full-width ones end a sentence without a following space.
+_SENTENCE_TERMINATORS = frozenset(".!?\u2026\u203c\u2047\u2048\u2049\u061f\u0964\u0965\u3002\uff01\uff1f\uff0e")
+_FULLWIDTH_TERMINATORS = frozenset("\u3002\uff01\uff1f\uff0e")
+_SENTENCE_CLOSERS = frozenset("\"')]}\u201d\u2019\u00bb\u300d\u300f\uff09")
+# "Dr. Smith": never a boundary. "etc. The": a boundary only before an uppercase word.
+_TITLE_ABBREVIATIONS = frozenset(
+    "mr mrs ms dr prof sr jr st mt vs no fig approx dept gen col lt sgt capt rev hon".split()
+)
+_SOFT_ABBREVIATIONS = frozenset(
+    "etc e.g i.e a.m p.m u.s u.k inc ltd co corp jan feb mar apr jun jul aug sep sept oct nov dec".split()
+)
+
+_HARD, _SOFT, _ABBREV = 1, 2, 3
+# Longest token / terminator run the boundary rules look at; keeping only this much per word keeps
+# feed() linear on text without spaces (CJK).
+_TOKEN_TAIL = 16
+
+
+def _terminator_kind(run: str, token: str) -> int:
+    if any(ch in _FULLWIDTH_TERMINATORS for ch in run) or any(ch not in ".\u2026" for ch in run):
+        return _HARD
+    if "\u2026" in run or len(run) > 1:
+        return _SOFT
+    word = token.lstrip("\"'([{\u201c\u2018\u00ab").rstrip(".").lower()
+    if word in _TITLE_ABBREVIATIONS:
+        return _ABBREV
+    if len(word) == 1 and word.isalpha():
+        return _ABBREV if token.lstrip("\"'([{").rstrip(".").isupper() else _HARD
+    if word in _SOFT_ABBREVIATIONS or "." in word:
+        return _SOFT
+    return _HARD
+
+
+class StreamingSegmenter:
+    """Incremental sentence splitter and segment packer for streamed LLM text.
+
+    ``feed(delta)`` scans each character once and returns the speech segments that became final:
+    sentences are packed greedily up to ``max_words`` (as split_into_segments() does), and a
+    segment is released as soon as the sentence being read can no longer fit in it, so the first
+    one can go to TTS mid-generation. Boundaries skip decimals ("3.5"), initials and common
+    abbreviations, treat ellipses as boundaries only before a capitalized word, and understand
+    CJK, Arabic and Devanagari terminators. After ``max_segments`` segments ``done`` is set and
+    further text is ignored.
+    """
+
+    def __init__(self, max_words: int = 28, max_segments: int = 8) -> None:
+        self.max_words = max_words
+        self.max_segments = max_segments
+        self.segments: List[str] = []
+        self.done = False
+        # Text of the sentence being read, kept as pieces so long sentences are joined once.
+        self._pieces: List[str] = []
+        self._sentence_words = 0
+        self._in_word = False
+        self._token = ""
+        self._run = ""
+        self._run_token = ""
+        # Pending boundary: kind, whether whitespace followed it, and where the sentence ends
+        # (piece index, offset) once the next visible character confirms it.
+        self._candidate = 0
+        self._candidate_space = False
+        self._candidate_end = (0, 0)
+        self._current: List[str] = []
+        self._current_words = 0
+
+    def _release(self, out: List[str]) -> None:
+        if self._current and not self.done:
+            segment = self._current[0]
+            for sentence in self._current[1:]:
+                segment += sentence if segment[-1] in _FULLWIDTH_TERMINATORS else " " + sentence
+            self.segments.append(segment)
+            out.append(segment)
+            if len(self.segments) >= self.max_segments:
+                self.done = True
+        self._current = []
+        self._current_words = 0
+
+    def _add_sentence(self, sentence: str, words: int, out: List[str]) -> None:
+        if not sentence or self.done:
+            return
+        if self._current and self._current_words + words > self.max_words:
+            self._release(out)
+            if self.done:
+                return
+        self._current.append(sentence)
+        self._current_words += words
+        if self._current_words >= self.max_words:
+            self._release(out)
+
+    def _close_sentence(self, out: List[str]) -> None:
+        piece_idx, offset = self._candidate_end
+        pieces = self._pieces
+        text = "".join(pieces[:piece_idx]) + pieces[piece_idx][:offset]
+        self._add_sentence(text.strip(), self._sentence_words, out)
+        self._pieces = []
+        self._sentence_words = 0
+        self._in_word = False
+        self._candidate = 0
+        self._token = ""
+        self._run = ""
+
+    def feed(self, delta: str) -> List[str]:
+        out: List[str] = []
+        if self.done or not delta:
+            return out
+        start = 0
+        for idx, ch in enumerate(delta):
+            if self._candidate:
+                if ch.isspace():
+                    self._candidate_space = True
+                    self._in_word = False
+                    self._token = ""
+                    continue
+                if not self._candidate_space and ch in _SENTENCE_CLOSERS:
+                    self._candidate_end = (len(self._pieces), idx + 1 - start)
+                    self._token = (self._token + ch)[-_TOKEN_TAIL:]
+                    continue
+                if self._candidate_space and (
+                    self._candidate == _HARD or (self._candidate == _SOFT and not ch.islower())
+                ):
+                    self._pieces.append(delta[start:idx])
+                    start = idx
+                    self._close_sentence(out)
+                    if self.done:
+                        return out
+                elif ch not in _SENTENCE_TERMINATORS or self._candidate_space:
+                    self._candidate = 0
+                    self._run = ""
+            if ch.isspace():
+                self._in_word = False
+                self._token = ""
+                self._run = ""
+                continue
+            if not self._in_word:
+                self._in_word = True
+                self._sentence_words += 1
+                if self._current and self._current_words + self._sentence_words > self.max_words:
+                    self._release(out)
+                    if self.done:
+                        return out
+            if ch in _SENTENCE_TERMINATORS:
+                if not self._run:
+                    self._run_token = self._token
+                if len(self._run) < _TOKEN_TAIL:
+                    self._run += ch
+                self._candidate = _terminator_kind(self._run, self._run_token + ch)
+                self._candidate_space = ch in _FULLWIDTH_TERMINATORS
+                self._candidate_end = (len(self._pieces), idx + 1 - start)
+            else:
+                self._run = ""
+            self._token = (self._token + ch)[-_TOKEN_TAIL:]
+        self._pieces.append(delta[start:])
+        return out
+
+    def finish(self) -> List[str]:
+        out: List[str] = []
+        if not self.done:
+            self._add_sentence("".join(self._pieces).strip(), self._sentence_words, out)
+            self._pieces = []
+            self._sentence_words = 0
+            self._candidate = 0
+            self._release(out)
+        return out
+
+
+def segment_text(text: str, max_words: int = 28, max_segments: int = 8) -> List[str]:
+    segmenter = StreamingSegmenter(max_words, max_segments)
+    segmenter.feed(text or "")
+    segmenter.finish()
+    return segmenter.segments
+
+
 def choose_target_seconds(estimated: float, budget: Dict[str, Any]) -> float:
     min_default, max_default = budget["default_target_range_sec"]
     if estimated <= 0:
@@ -148,15 +427,20 @@ def choose_target_seconds(estimated: float, budget: Dict[str, Any]) -> float:
     return min(max_default, max(min_default, estimated))
 
 
-def create_heuristic_turn_plan(response_text: str, camera_mode: str = "A_SELFIE") -> Dict[str, Any]:
+def create_heuristic_turn_plan(
+    response_text: str,
+    camera_mode: str = "A_SELFIE",
+    speech_estimator: Optional[Callable[[str], float]] = None,
+) -> Dict[str, Any]:
     budget = turn_budget()
+    estimate = speech_estimator or estimate_speech_seconds
     segments = split_into_segments(response_text)
     speech_segments = []
     for idx, text in enumerate(segments):
         speech_segments.append({
             "priority": idx,
             "text": text,
-            "est_sec": estimate_speech_seconds(text),
+            "est_sec": estimate(text),
         })
     total_est = sum(seg.get("est_sec", 0) for seg in speech_segments)
     target = choose_target_seconds(total_est, budget)
@@ -191,6 +475,24 @@ def create_heuristic_turn_plan(response_text: str, camera_mode: str = "A_SELFIE"
     }
 
 
+def _segment_errors(idx: int, seg: Any) -> List[str]:
+    if not isinstance(seg, dict):
+        return [f"speech_segments[{idx}] must be an object"]
+    errors: List[str] = []
+    priority = seg.get("priority")
+    if not isinstance(priority, int) or priority < 0:
+        errors.append(f"speech_segments[{idx}].priority must be an integer >= 0")
+    text = seg.get("text")
+    if not isinstance(text, str) or not text.strip():
+        errors.append(f"speech_segments[{idx}].text must be a non-empty string")
+    est_sec = seg.get("est_sec")
+    if est_sec is not None and (
+        not isinstance(est_sec, (int, float)) or not math.isfinite(est_sec) or est_sec < 0
+    ):
+        errors.append(f"speech_segments[{idx}].est_sec must be a non-negative number when present")
+    return errors
+
+
 def validate_turn_plan(plan: Dict[str, Any]) -> List[str]:
     errors: List[str] = []
     if not isinstance(plan, dict):
@@ -211,20 +513,7 @@ def validate_turn_plan(plan: Dict[str, Any]) -> List[str]:
         errors.append("speech_segments must be a non-empty array")
     if isinstance(segments, list):
         for idx, seg in enumerate(segments):
-            if not isinstance(seg, dict):
-                errors.append(f"speech_segments[{idx}] must be an object")
-                continue
-            priority = seg.get("priority")
-            if not isinstance(priority, int) or priority < 0:
-                errors.append(f"speech_segments[{idx}].priority must be an integer >= 0")
-            text = seg.get("text")
-            if not isinstance(text, str) or not text.strip():
-                errors.append(f"speech_segments[{idx}].text must be a non-empty string")
-            est_sec = seg.get("est_sec")
-            if est_sec is not None and (
-                not isinstance(est_sec, (int, float)) or not math.isfinite(est_sec) or est_sec < 0
-            ):
-                errors.append(f"speech_segments[{idx}].est_sec must be a non-negative number when present")
+            errors.extend(_segment_errors(idx, seg))
 
     timeline = plan.get("actor_timeline")
     if not isinstance(timeline, list):
@@ -247,9 +536,44 @@ def validate_turn_plan(plan: Dict[str, Any]) -> List[str]:
     return errors
 
 
-def clamp_turn_plan(plan: Dict[str, Any]) -> TurnPlanResult:
-    warnings: List[str] = []
+def validate_turn_plan_schema(plan: Any) -> List[str]:
+    """Full turn_plan.schema.json check (current budget applied) through a compiled validator."""
+    if compile_validator is None:
+        raise RuntimeError("validate_turn_plan_schema requires the schema-validators package")
     budget = turn_budget()
+    key = _budget_key(budget)
+    validator = _SCHEMA_VALIDATOR_CACHE.get(key)
+    if validator is None:
+        schema = _apply_budget_to_schema(copy.deepcopy(_raw_turn_plan_schema()), budget)
+        validator = compile_validator(schema, root="plan", prefix="turn_plan")
+        _SCHEMA_VALIDATOR_CACHE[key] = validator
+    return validator(plan)
+
+
+def _normalize_segment(
+    seg: Dict[str, Any],
+    warnings: List[str],
+    speech_estimator: Optional[Callable[[str], float]] = None,
+) -> Dict[str, Any]:
+    text = str(seg.get("text", "")).strip() or "..."
+    if speech_estimator is not None:
+        # A calibrated voice model beats the planner's own guess.
+        return {"priority": seg.get("priority", 0), "text": text, "est_sec": speech_estimator(text)}
+    est_sec = seg.get("est_sec")
+    if not isinstance(est_sec, (int, float)) or est_sec < 0:
+        est_sec = estimate_speech_seconds(text)
+        warnings.append("segment est_sec recomputed")
+    return {"priority": seg.get("priority", 0), "text": text, "est_sec": est_sec}
+
+
+def clamp_turn_plan(
+    plan: Dict[str, Any],
+    speech_estimator: Optional[Callable[[str], float]] = None,
+    budget: Optional[Dict[str, Any]] = None,
+) -> TurnPlanResult:
+    warnings: List[str] = []
+    if budget is None:
+        budget = turn_budget()
     hardcap = budget["hardcap_sec"]
     max_exec = hardcap - budget["tail_buffer_sec"]
 
@@ -262,14 +586,7 @@ def clamp_turn_plan(plan: Dict[str, Any]) -> TurnPlanResult:
     segments = plan.get("speech_segments") or []
     segments = sorted(segments, key=lambda s: s.get("priority", 0))
 
-    normalized = []
-    for seg in segments:
-        text = str(seg.get("text", "")).strip() or "..."
-        est_sec = seg.get("est_sec")
-        if not isinstance(est_sec, (int, float)) or est_sec < 0:
-            est_sec = estimate_speech_seconds(text)
-            warnings.append("segment est_sec recomputed")
-        normalized.append({"priority": seg.get("priority", 0), "text": text, "est_sec": est_sec})
+    normalized = [_normalize_segment(seg, warnings, speech_estimator) for seg in segments]
 
     included = []
     cum = 0.0
@@ -305,31 +622,193 @@ def clamp_turn_plan(plan: Dict[str, Any]) -> TurnPlanResult:
 
 
 def build_turn_plan_prompt(user_text: str, persona: Optional[Dict[str, str]] = None, camera_mode: str = "A_SELFIE") -> Dict[str, str]:
-    budget = turn_budget()
-    schema_text = json.dumps(load_turn_plan_schema(), indent=2, sort_keys=True)
-    persona_name = persona.get("name") if persona else None
-    persona_style = persona.get("style") if persona else None
-
-    system = "\n".join([
-        "You are a planning engine that outputs STRICT JSON only.",
-        "Produce a TurnPlan that matches the provided JSON schema exactly.",
-        f"Constraints: hardcap={budget['hardcap_sec']:g}s, default ~{budget['default_target_range_sec'][0]:g}s, allow up to {budget['default_target_range_sec'][1]:g}s, minimum {budget['min_target_sec']:g}s unless ultra-short.",
-        f"Camera modes: {', '.join(CAMERA_MODES)}.",
-        "Speech segments must be ordered by priority (0 is highest priority).",
-        "Never cut mid-segment; segments should be safe boundaries.",
-        "Actor timeline should include listening->speaking transitions and reasonable emotion/gaze hints.",
-        "",
-        "TURN PLAN JSON SCHEMA:",
-        schema_text,
-    ])
-
-    user_lines = [
-        f"Persona: {persona_name or '(unspecified)'}",
-        f"Style: {persona_style or '(unspecified)'}",
-        f"Camera mode suggestion: {camera_mode}",
-        "",
-        "User message:",
-        user_text,
-    ]
-
-    return {"system": system, "user": "\n".join(user_lines)}
+    system = _compile_system_prompt(turn_budget(), CAMERA_MODES)
+    return {"system": system, "user": _user_prompt(user_text, persona, camera_mode)}
+
+
+_STREAM_SCALAR_KEYS = ("speech_budget_sec_target", "speech_budget_sec_hardcap", "camera_mode_suggestion")
+
+
+class TurnPlanStreamParser:
+    """Incremental TurnPlan JSON parser for a streaming planner response.
+
+    ``feed(delta)`` scans only the new text and returns each ``speech_segments[i]`` as soon as its
+    object closes, normalized the way clamp_turn_plan() would. Segments are validated on arrival
+    (``errors``) and their ``est_sec`` accumulated against ``max_exec``; once the next segment would
+    not fit, or the plan's target is reached, ``budget_exhausted`` is set and the caller can cancel
+    generation. ``finish()`` clamps the full document, or the segments seen so far if the stream
+    was cut short.
+    """
+
+    def __init__(
+        self,
+        budget: Optional[Dict[str, Any]] = None,
+        speech_estimator: Optional[Callable[[str], float]] = None,
+    ) -> None:
+        self.budget = dict(budget) if budget is not None else turn_budget()
+        self.speech_estimator = speech_estimator
+        self.max_exec = self.budget["hardcap_sec"] - self.budget["tail_buffer_sec"]
+        self.segments: List[Dict[str, Any]] = []
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.scalars: Dict[str, Any] = {}
+        self.cum_sec = 0.0
+        self.budget_exhausted = False
+        self._chunks: List[str] = []
+        self._stack: List[str] = []
+        self._in_str = False
+        self._esc = False
+        self._expect_key = False
+        self._key = ""
+        self._capture: Optional[List[str]] = None
+        self._capture_kind = ""
+        self._capture_start = 0
+        self._seg_index = 0
+        self._elem_open = False
+
+    def _target(self) -> Optional[float]:
+        target = self.scalars.get("speech_budget_sec_target")
+        if isinstance(target, (int, float)) and target > 0:
+            return min(self.max_exec, max(1, float(target)))
+        return None
+
+    def _accept_segment(self, raw: str) -> Optional[Dict[str, Any]]:
+        idx = self._seg_index
+        self._seg_index += 1
+        try:
+            seg = json.loads(raw)
+        except ValueError:
+            self.errors.append(f"speech_segments[{idx}] must be an object")
+            return None
+        self.errors.extend(_segment_errors(idx, seg))
+        if not isinstance(seg, dict) or self.budget_exhausted:
+            return None
+        normalized = _normalize_segment(seg, self.warnings, self.speech_estimator)
+        if self.segments and normalized["priority"] < self.segments[-1]["priority"]:
+            self.warnings.append("segment priority out of order")
+        seg_sec = float(normalized["est_sec"])
+        if self.segments and self.cum_sec + seg_sec > self.max_exec:
+            self.budget_exhausted = True
+            return None
+        self.segments.append(normalized)
+        self.cum_sec += seg_sec
+        target = self._target()
+        if target is not None and self.cum_sec >= target:
+            self.budget_exhausted = True
+        return normalized
+
+    def _end_capture(self, delta: str, end: int) -> Optional[str]:
+        pieces = self._capture
+        if pieces is None:
+            return None
+        pieces.append(delta[self._capture_start:end])
+        self._capture = None
+        return "".join(pieces)
+
+    def _end_scalar(self, delta: str, end: int) -> None:
+        if self._capture_kind != "scalar":
+            return
+        raw = self._end_capture(delta, end)
+        if raw is None:
+            return
+        try:
+            self.scalars[self._key] = json.loads(raw)
+        except ValueError:
+            pass
+
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        released: List[Dict[str, Any]] = []
+        if not delta:
+            return released
+        self._chunks.append(delta)
+        if self._capture is not None:
+            self._capture_start = 0
+        stack = self._stack
+        i = 0
+        n = len(delta)
+        key_start = 0
+        key_pieces: Optional[List[str]] = [] if (self._in_str and self._expect_key and len(stack) == 1) else None
+        while i < n:
+            ch = delta[i]
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+                    if key_pieces is not None:
+                        key_pieces.append(delta[key_start:i])
+                        self._key = self._key + "".join(key_pieces)
+                        key_pieces = None
+                else:
+                    # Skip ordinary string content in one step.
+                    nxt = min((j for j in (delta.find('"', i), delta.find("\\", i)) if j >= 0), default=n)
+                    i = max(i + 1, nxt)
+                    continue
+                i += 1
+                continue
+            in_segments = stack == ["{", "["] and self._key == "speech_segments"
+            if in_segments and self._elem_open and ch not in " \t\r\n,]":
+                self._elem_open = False
+                if ch != "{":
+                    self.errors.append(f"speech_segments[{self._seg_index}] must be an object")
+                    self._seg_index += 1
+            if ch == '"':
+                self._in_str = True
+                if len(stack) == 1 and self._expect_key:
+                    self._key = ""
+                    key_pieces = []
+                    key_start = i + 1
+            elif ch in "{[":
+                if ch == "[" and len(stack) == 1 and self._key == "speech_segments":
+                    self._elem_open = True
+                if ch == "{" and in_segments:
+                    self._capture = []
+                    self._capture_kind = "segment"
+                    self._capture_start = i
+                stack.append(ch)
+                self._expect_key = ch == "{"
+            elif ch in "}]":
+                if len(stack) == 1:
+                    self._end_scalar(delta, i)
+                if stack:
+                    stack.pop()
+                if ch == "}" and stack == ["{", "["] and self._capture_kind == "segment" and self._capture is not None:
+                    segment = self._accept_segment(self._end_capture(delta, i + 1))
+                    if segment is not None:
+                        released.append(segment)
+            elif len(stack) == 1:
+                if ch == ":":
+                    self._expect_key = False
+                    if self._key in _STREAM_SCALAR_KEYS:
+                        self._capture = []
+                        self._capture_kind = "scalar"
+                        self._capture_start = i + 1
+                elif ch == ",":
+                    self._end_scalar(delta, i)
+                    self._expect_key = True
+            elif in_segments and ch == ",":
+                self._elem_open = True
+            i += 1
+        if key_pieces is not None:
+            self._key = self._key + "".join(key_pieces) + delta[key_start:n]
+        if self._capture is not None:
+            self._capture.append(delta[self._capture_start:])
+        return released
+
+    def finish(self) -> TurnPlanResult:
+        text = "".join(self._chunks)
+        try:
+            plan = json.loads(text)
+        except ValueError:
+            plan = None
+        if not isinstance(plan, dict):
+            plan = {key: value for key, value in self.scalars.items()}
+            plan["speech_segments"] = list(self.segments)
+            if not self.budget_exhausted:
+                self.warnings.append("turn plan stream incomplete")
+        result = clamp_turn_plan(plan, self.speech_estimator, self.budget)
+        # clamp_turn_plan re-normalizes the same segments; report each warning once.
+        result.warnings = list(dict.fromkeys(self.warnings + result.warnings))
+        return result
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Scaling check: StreamingSegmenter.feed must stay linear in input length.
+
+Streams 50k and 400k characters of CJK (no spaces), space-separated English and one long
+unterminated run in small deltas, and fails if the per-character cost of the 400k run exceeds
+``MAX_COST_RATIO`` times that of the 50k run. Linear code stays near 1x and quadratic code lands
+near 8x, so timing noise alone does not trip the bound.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from planning_control import StreamingSegmenter  # noqa: E402
+
+SIZES = (50_000, 400_000)
+REPEATS = 5
+MAX_COST_RATIO = 3.0
+
+CORPORA = {
+    "cjk": "今日はとても良い天気ですね散歩に行きましょう。明日は雨が降るかもしれません？",
+    "english": "Dr. Smith paid 3.50 for it, e.g. in the U.S. market. Then he left! ",
+    "no-terminator": "あいうえおかきくけこさしすせそ",
+}
+
+
+def stream_seconds(text: str, delta: int = 7) -> float:
+    segmenter = StreamingSegmenter(max_words=28, max_segments=10**9)
+    start = time.perf_counter()
+    for i in range(0, len(text), delta):
+        segmenter.feed(text[i : i + delta])
+    segmenter.finish()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    failed = False
+    for name, unit in CORPORA.items():
+        timings = []
+        for size in SIZES:
+            text = (unit * (size // len(unit) + 1))[:size]
+            timings.append(min(stream_seconds(text) for _ in range(REPEATS)))
+        per_char = [t / size for size, t in zip(SIZES, timings)]
+        ratio = per_char[-1] / max(1e-12, per_char[0])
+        ok = ratio <= MAX_COST_RATIO
+        failed |= not ok
+        cells = "  ".join(f"{size // 1000}k={t:.3f}s" for size, t in zip(SIZES, timings))
+        print(f"{name:>14}: {cells}  per-char cost ratio={ratio:.2f}  {'ok' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
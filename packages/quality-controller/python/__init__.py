@@ -1,13 +1,45 @@
 from .quality_controller import (
+    DEFAULT_PREDICTIVE_DEGRADE_POLICY,
     DEFAULT_QUALITY_POLICY,
+    DEFAULT_SIGNAL_MAX_AGE_MS,
+    HEAVY_ACTION_TYPES,
+    NUMPY_AVAILABLE,
+    SIGNAL_KINDS,
+    TRACE_COLUMNS,
+    BatchQualityController,
+    PredictiveDegradeController,
+    QualityControlDriver,
+    SignalFusionBuffer,
     create_initial_controller_state,
     decide,
+    decide_predictive,
     normalize_quality_policy,
+    policy_grid,
+    replay_policy,
+    simulate_load_trace,
+    sweep_policies,
+    trace_columns,
 )
 
 __all__ = [
+    "BatchQualityController",
+    "DEFAULT_PREDICTIVE_DEGRADE_POLICY",
     "DEFAULT_QUALITY_POLICY",
+    "DEFAULT_SIGNAL_MAX_AGE_MS",
+    "HEAVY_ACTION_TYPES",
+    "NUMPY_AVAILABLE",
+    "PredictiveDegradeController",
+    "QualityControlDriver",
+    "SIGNAL_KINDS",
+    "SignalFusionBuffer",
+    "TRACE_COLUMNS",
     "create_initial_controller_state",
     "decide",
+    "decide_predictive",
     "normalize_quality_policy",
+    "policy_grid",
+    "replay_policy",
+    "simulate_load_trace",
+    "sweep_policies",
+    "trace_columns",
 ]
@@ -1,6 +1,21 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import array
+import asyncio
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:  # numpy is optional; BatchQualityController falls back to per-session decide() without it.
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
 
 
 DEFAULT_QUALITY_POLICY = {
@@ -38,15 +53,19 @@ def _cooldown_ready(state: Dict[str, int], now_ms: int, policy: Dict[str, float]
     return now_ms - state["last_heavy_action_ms"] >= policy["cooldown_ms_heavy_action"]
 
 
-def _contains_heavy_action(actions: List[Dict[str, object]]) -> bool:
-    heavy = {
+HEAVY_ACTION_TYPES = frozenset(
+    {
         "RESTART_PROVIDER_STREAM",
         "FAILOVER_BACKEND",
         "FALLBACK_OFFLINE_CLIP",
         "FORCE_ANCHOR_RESET",
         "RERENDER_BLOCK",
     }
-    return any(str(action.get("type")) in heavy for action in actions)
+)
+
+
+def _contains_heavy_action(actions: List[Dict[str, object]]) -> bool:
+    return any(str(action.get("type")) in HEAVY_ACTION_TYPES for action in actions)
 
 
 def decide(
@@ -212,3 +231,1083 @@ def decide(
     }
 
     return {"actions": actions, "state": state, "debug": debug}
+
+
+# Band codes used by the batch controller; ordering matches the string bands in decide().
+_IGNORE, _OK, _WARN, _FAIL = 0, 1, 2, 3
+
+# Per-session capability bits.
+_CAP_RESTART = 1
+_CAP_FAILOVER = 2  # supports_failover and a failover_backend_id is configured
+_CAP_MOUTH = 4
+_CAP_RERENDER = 8
+_CAP_ANCHOR = 16
+
+# Action types decide() can emit.
+_ACTION_TYPES = (
+    "RESTART_PROVIDER_STREAM",
+    "FAILOVER_BACKEND",
+    "REDUCE_FPS",
+    "SHORTEN_REMAINING_TURN",
+    "APPLY_MOUTH_CORRECTOR",
+    "RERENDER_BLOCK",
+    "FORCE_ANCHOR_RESET",
+    "REDUCE_RESOLUTION",
+)
+
+# Per-session action codes for each decide() branch.
+_ACT_NONE = 0
+_ACT_RESTART = 1
+_ACT_FAILOVER = 2
+_ACT_REDUCE_AND_SHORTEN = 3
+_ACT_MOUTH = 4
+_ACT_RERENDER = 5
+_ACT_ANCHOR = 6
+
+SignalColumn = Optional[Union[Sequence[float], "np.ndarray"]]
+
+
+def _cap_bits(caps: Dict[str, object], options: Optional[Dict[str, object]]) -> int:
+    bits = 0
+    if caps.get("supports_restart_stream"):
+        bits |= _CAP_RESTART
+    if caps.get("supports_failover") and (options or {}).get("failover_backend_id"):
+        bits |= _CAP_FAILOVER
+    if caps.get("supports_mouth_corrector"):
+        bits |= _CAP_MOUTH
+    if caps.get("supports_rerender_block"):
+        bits |= _CAP_RERENDER
+    if caps.get("supports_anchor_reset"):
+        bits |= _CAP_ANCHOR
+    return bits
+
+
+class BatchQualityController:
+    """Evaluates decide() for many sessions at once over struct-of-arrays state.
+
+    Controller state (streaks, degrade level, last heavy action time) lives in parallel arrays
+    indexed by session slot. ``step`` takes one column per signal (NaN marks a missing value,
+    i.e. what decide() sees as an absent key) and returns ``[(slot, actions), ...]`` only for
+    sessions whose action list is non-empty. Per session the actions and state are identical
+    to calling decide() with the same caps, options, policy and ``now_ms``; ``now_ms`` may also be
+    a per-session column when sessions run on independent clocks (e.g. replayed traces).
+    """
+
+    def __init__(
+        self,
+        sessions: int,
+        caps: Union[Dict[str, object], Sequence[Dict[str, object]], None] = None,
+        policy: Optional[Dict[str, float]] = None,
+        options: Union[Dict[str, object], Sequence[Dict[str, object]], None] = None,
+    ) -> None:
+        self.sessions = int(sessions)
+        self.policy = normalize_quality_policy(policy)
+        shared_options = options if isinstance(options, dict) or options is None else None
+        base = shared_options or (options[0] if options else {})
+        self.degrade_fps_targets = list(base.get("degrade_fps_targets") or [30, 24, 20, 15])
+        self.degrade_short_side_targets = list(base.get("degrade_short_side_targets") or [720, 640, 512, 384])
+        self._caps: List[Dict[str, object]] = []
+        self._options: List[Dict[str, object]] = []
+        for slot in range(self.sessions):
+            slot_caps = caps if isinstance(caps, dict) or caps is None else caps[slot]
+            slot_options = shared_options if shared_options is not None or options is None else options[slot]
+            self._caps.append(dict(slot_caps or {}))
+            self._options.append(dict(slot_options or {}))
+        if NUMPY_AVAILABLE:
+            n = self.sessions
+            self.lip_fail_streak = np.zeros(n, dtype=np.int64)
+            self.lip_ok_streak = np.zeros(n, dtype=np.int64)
+            self.drift_fail_streak = np.zeros(n, dtype=np.int64)
+            self.overall_ok_streak = np.zeros(n, dtype=np.int64)
+            self.degrade_level = np.zeros(n, dtype=np.int64)
+            self.last_heavy_action_ms = np.zeros(n, dtype=np.int64)
+            self.cap_bits = np.array([_cap_bits(c, o) for c, o in zip(self._caps, self._options)], dtype=np.int64)
+            # Degrade targets per slot and level; plain lists so values come back exactly as configured.
+            self._fps_by_level: List[List[object]] = [[] for _ in range(n)]
+            self._short_by_level: List[List[object]] = [[] for _ in range(n)]
+            for slot in range(n):
+                self._fill_level_targets(slot)
+        else:
+            self._states = [create_initial_controller_state() for _ in range(self.sessions)]
+
+    def configure(self, slot: int, caps: Dict[str, object], options: Optional[Dict[str, object]] = None) -> None:
+        self._caps[slot] = dict(caps)
+        self._options[slot] = dict(options or {})
+        if NUMPY_AVAILABLE:
+            self.cap_bits[slot] = _cap_bits(self._caps[slot], self._options[slot])
+            self._fill_level_targets(slot)
+
+    def _fill_level_targets(self, slot: int) -> None:
+        # Same resolution as _step_fallback + decide(): slot options, else the shared targets.
+        options = self._options[slot]
+        fps = options.get("degrade_fps_targets", self.degrade_fps_targets) or [30, 24, 20, 15]
+        short = options.get("degrade_short_side_targets", self.degrade_short_side_targets) or [720, 640, 512, 384]
+        self._fps_by_level[slot] = [fps[min(level, len(fps) - 1)] for level in range(4)]
+        self._short_by_level[slot] = [short[min(level, len(short) - 1)] for level in range(4)]
+
+    def reset(self, slot: int) -> None:
+        if NUMPY_AVAILABLE:
+            for column in (
+                self.lip_fail_streak,
+                self.lip_ok_streak,
+                self.drift_fail_streak,
+                self.overall_ok_streak,
+                self.degrade_level,
+                self.last_heavy_action_ms,
+            ):
+                column[slot] = 0
+        else:
+            self._states[slot] = create_initial_controller_state()
+
+    def state(self, slot: int) -> Dict[str, int]:
+        if not NUMPY_AVAILABLE:
+            return dict(self._states[slot])
+        return {
+            "lip_fail_streak": int(self.lip_fail_streak[slot]),
+            "lip_ok_streak": int(self.lip_ok_streak[slot]),
+            "drift_fail_streak": int(self.drift_fail_streak[slot]),
+            "overall_ok_streak": int(self.overall_ok_streak[slot]),
+            "degrade_level": int(self.degrade_level[slot]),
+            "last_heavy_action_ms": int(self.last_heavy_action_ms[slot]),
+        }
+
+    def _column(self, values: SignalColumn, fill: float = math.nan) -> "np.ndarray":
+        if values is None:
+            return np.full(self.sessions, fill, dtype=np.float64)
+        column = np.asarray(values, dtype=np.float64)
+        if column.shape != (self.sessions,):
+            raise ValueError(f"signal column must have shape ({self.sessions},), got {column.shape}")
+        return column
+
+    def _flags(self, values: SignalColumn) -> "np.ndarray":
+        if values is None:
+            return np.zeros(self.sessions, dtype=bool)
+        return np.asarray(values, dtype=bool)
+
+    def step(
+        self,
+        now_ms: Union[int, SignalColumn],
+        lip_score: SignalColumn = None,
+        lip_confidence: SignalColumn = None,
+        lip_silence: SignalColumn = None,
+        lip_occluded: SignalColumn = None,
+        identity_similarity: SignalColumn = None,
+        av_offset_ms: SignalColumn = None,
+        render_fps: SignalColumn = None,
+        remaining_turn_sec: SignalColumn = None,
+    ) -> List[Tuple[int, List[Dict[str, object]]]]:
+        if hasattr(now_ms, "__len__"):
+            now_ms = np.asarray(now_ms, dtype=np.int64) if NUMPY_AVAILABLE else [int(v) for v in now_ms]
+        else:
+            now_ms = int(now_ms)
+        if not NUMPY_AVAILABLE:
+            return self._step_fallback(
+                now_ms,
+                lip_score,
+                lip_confidence,
+                lip_silence,
+                lip_occluded,
+                identity_similarity,
+                av_offset_ms,
+                render_fps,
+                remaining_turn_sec,
+            )
+        playback_act, lip_act, drift_act, emit_degrade, levels = self._advance(
+            now_ms,
+            lip_score,
+            lip_confidence,
+            lip_silence,
+            lip_occluded,
+            identity_similarity,
+            av_offset_ms,
+            render_fps,
+        )
+        active = np.flatnonzero((playback_act != _ACT_NONE) | (lip_act != _ACT_NONE) | (drift_act != _ACT_NONE) | emit_degrade)
+        if active.size == 0:
+            return []
+        remaining = None if remaining_turn_sec is None else self._column(remaining_turn_sec)[active].tolist()
+        levels = levels[active]
+        fps_targets = [self._fps_by_level[slot][level] for slot, level in zip(active.tolist(), levels.tolist())]
+        short_targets = [self._short_by_level[slot][level] for slot, level in zip(active.tolist(), levels.tolist())]
+        rows = zip(
+            active.tolist(),
+            playback_act[active].tolist(),
+            lip_act[active].tolist(),
+            drift_act[active].tolist(),
+            emit_degrade[active].tolist(),
+            fps_targets,
+            short_targets,
+        )
+        out: List[Tuple[int, List[Dict[str, object]]]] = []
+        for row, (slot, playback_code, lip_code, drift_code, degrade, target_fps, target_short) in enumerate(rows):
+            actions: List[Dict[str, object]] = []
+            if playback_code == _ACT_REDUCE_AND_SHORTEN:
+                target_sec: float = 6
+                if remaining is not None and not math.isnan(remaining[row]):
+                    target_sec = min(6, remaining[row])
+                actions.append({"type": "REDUCE_FPS", "target_fps": 24})
+                actions.append({"type": "SHORTEN_REMAINING_TURN", "target_sec": target_sec})
+            elif playback_code:
+                actions.append(self._switch_action(slot, playback_code))
+            if lip_code == _ACT_MOUTH:
+                actions.append({"type": "APPLY_MOUTH_CORRECTOR", "window": "last_block"})
+            elif lip_code == _ACT_RERENDER:
+                actions.append({"type": "RERENDER_BLOCK", "strengthen_anchor": True})
+            elif lip_code:
+                actions.append(self._switch_action(slot, lip_code))
+            if drift_code == _ACT_ANCHOR:
+                actions.append({"type": "FORCE_ANCHOR_RESET"})
+            elif drift_code:
+                actions.append(self._switch_action(slot, drift_code))
+            if degrade:
+                actions.append({"type": "REDUCE_FPS", "target_fps": target_fps})
+                actions.append({"type": "REDUCE_RESOLUTION", "target_short_side": target_short})
+            out.append((slot, actions))
+        return out
+
+    def _advance(
+        self,
+        now_ms: Union[int, "np.ndarray"],
+        lip_score: SignalColumn,
+        lip_confidence: SignalColumn,
+        lip_silence: SignalColumn,
+        lip_occluded: SignalColumn,
+        identity_similarity: SignalColumn,
+        av_offset_ms: SignalColumn,
+        render_fps: SignalColumn,
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Update state for one tick and return per-session action codes.
+
+        Returns ``(playback_act, lip_act, drift_act, emit_degrade, degrade_level_for_targets)``.
+        """
+        policy = self.policy
+        score = self._column(lip_score)
+
+        confidence = self._column(lip_confidence, 1.0)
+        confidence = np.where(np.isnan(confidence), 1.0, confidence)
+        identity = self._column(identity_similarity)
+        offset = np.abs(self._column(av_offset_ms))
+        fps = self._column(render_fps)
+
+        lip_ignored = self._flags(lip_silence) | np.isnan(score) | self._flags(lip_occluded) | (confidence < 0.2)
+        lip_band = np.where(
+            lip_ignored,
+            _IGNORE,
+            np.where(score < policy["lip_fail"], _FAIL, np.where(score < policy["lip_warn"], _WARN, _OK)),
+        )
+        drift_band = np.where(
+            np.isnan(identity),
+            _IGNORE,
+            np.where(
+                identity < policy["drift_fail_identity"],
+                _FAIL,
+                np.where(identity < policy["drift_warn_identity"], _WARN, _OK),
+            ),
+        )
+        playback_band = np.where(
+            np.isnan(offset),
+            _IGNORE,
+            np.where(
+                offset >= policy["av_offset_fail_ms"],
+                _FAIL,
+                np.where(offset >= policy["av_offset_warn_ms"], _WARN, _OK),
+            ),
+        )
+        system_band = np.where(np.isnan(fps), _IGNORE, np.where(fps < 20, _FAIL, np.where(fps < 26, _WARN, _OK)))
+
+        lip_fail = lip_band == _FAIL
+        lip_ok = lip_band == _OK
+        self.lip_fail_streak = np.where(lip_fail, self.lip_fail_streak + 1, np.where(lip_ok, 0, self.lip_fail_streak))
+        self.lip_ok_streak = np.where(lip_ok, self.lip_ok_streak + 1, 0)
+        drift_fail = drift_band == _FAIL
+        self.drift_fail_streak = np.where(
+            drift_fail, self.drift_fail_streak + 1, np.where(drift_band == _OK, 0, self.drift_fail_streak)
+        )
+
+        playback_fail = playback_band == _FAIL
+        system_fail = system_band == _FAIL
+        any_fail = lip_fail | drift_fail | playback_fail | system_fail
+        all_ok = (lip_band <= _OK) & (drift_band <= _OK) & (playback_band <= _OK) & (system_band <= _OK)
+        self.overall_ok_streak = np.where(all_ok, self.overall_ok_streak + 1, 0)
+
+        sustained_lip = lip_fail & (self.lip_fail_streak >= policy["lip_fail_consecutive"])
+        sustained_drift = drift_fail & (self.drift_fail_streak >= 2)
+        can_heavy = (now_ms - self.last_heavy_action_ms) >= policy["cooldown_ms_heavy_action"]
+
+        bits = self.cap_bits
+        has_restart = (bits & _CAP_RESTART) != 0
+        has_failover = (bits & _CAP_FAILOVER) != 0
+        playback_act = np.where(
+            playback_fail & can_heavy,
+            np.where(has_restart, _ACT_RESTART, np.where(has_failover, _ACT_FAILOVER, _ACT_REDUCE_AND_SHORTEN)),
+            _ACT_NONE,
+        )
+        lip_act = np.where(
+            sustained_lip,
+            np.where(
+                (bits & _CAP_MOUTH) != 0,
+                _ACT_MOUTH,
+                np.where(
+                    (bits & _CAP_RERENDER) != 0,
+                    _ACT_RERENDER,
+                    np.where(
+                        has_restart & can_heavy,
+                        _ACT_RESTART,
+                        np.where(has_failover & can_heavy, _ACT_FAILOVER, _ACT_NONE),
+                    ),
+                ),
+            ),
+            _ACT_NONE,
+        )
+        drift_act = np.where(
+            sustained_drift & can_heavy,
+            np.where(
+                (bits & _CAP_ANCHOR) != 0,
+                _ACT_ANCHOR,
+                np.where(has_restart, _ACT_RESTART, np.where(has_failover, _ACT_FAILOVER, _ACT_NONE)),
+            ),
+            _ACT_NONE,
+        )
+
+        grow = any_fail | ((system_band == _WARN) & (self.degrade_level < 3))
+        self.degrade_level = np.where(grow, np.minimum(3, self.degrade_level + 1), self.degrade_level)
+        degraded = self.degrade_level > 0
+        stream_switch = (
+            (playback_act == _ACT_RESTART)
+            | (playback_act == _ACT_FAILOVER)
+            | (lip_act == _ACT_RESTART)
+            | (lip_act == _ACT_FAILOVER)
+            | (drift_act == _ACT_RESTART)
+            | (drift_act == _ACT_FAILOVER)
+        )
+        emit_degrade = degraded & ~stream_switch
+        level_for_targets = self.degrade_level.copy()
+
+        recover = degraded & (self.overall_ok_streak >= policy["ok_consecutive_to_recover"])
+        self.degrade_level = np.where(recover, self.degrade_level - 1, self.degrade_level)
+        self.overall_ok_streak = np.where(recover, 0, self.overall_ok_streak)
+
+        heavy = (
+            (playback_act == _ACT_RESTART)
+            | (playback_act == _ACT_FAILOVER)
+            | ((lip_act != _ACT_NONE) & (lip_act != _ACT_MOUTH))
+            | (drift_act != _ACT_NONE)
+        )
+        self.last_heavy_action_ms = np.where(heavy, now_ms, self.last_heavy_action_ms)
+        return playback_act, lip_act, drift_act, emit_degrade, level_for_targets
+
+    def _switch_action(self, slot: int, code: int) -> Dict[str, object]:
+        if code == _ACT_RESTART:
+            return {"type": "RESTART_PROVIDER_STREAM"}
+        return {"type": "FAILOVER_BACKEND", "backend_id": self._options[slot]["failover_backend_id"]}
+
+    def _step_fallback(
+        self,
+        now_ms: Union[int, List[int]],
+        lip_score: SignalColumn,
+        lip_confidence: SignalColumn,
+        lip_silence: SignalColumn,
+        lip_occluded: SignalColumn,
+        identity_similarity: SignalColumn,
+        av_offset_ms: SignalColumn,
+        render_fps: SignalColumn,
+        remaining_turn_sec: SignalColumn,
+    ) -> List[Tuple[int, List[Dict[str, object]]]]:
+        def value(column: SignalColumn, slot: int) -> Optional[float]:
+            if column is None:
+                return None
+            item = column[slot]
+            return None if item is None or math.isnan(item) else float(item)
+
+        out: List[Tuple[int, List[Dict[str, object]]]] = []
+        for slot in range(self.sessions):
+            lipsync: Dict[str, object] = {}
+            score = value(lip_score, slot)
+            if score is not None:
+                lipsync["score"] = score
+            confidence = value(lip_confidence, slot)
+            if confidence is not None:
+                lipsync["confidence"] = confidence
+            if lip_silence is not None and lip_silence[slot]:
+                lipsync["is_silence"] = True
+            if lip_occluded is not None and lip_occluded[slot]:
+                lipsync["occluded"] = True
+            identity = value(identity_similarity, slot)
+            offset = value(av_offset_ms, slot)
+            fps = value(render_fps, slot)
+            remaining = value(remaining_turn_sec, slot)
+            options = dict(self._options[slot])
+            options.setdefault("degrade_fps_targets", self.degrade_fps_targets)
+            options.setdefault("degrade_short_side_targets", self.degrade_short_side_targets)
+            result = decide(
+                self._caps[slot],
+                lipsync=lipsync,
+                drift={"identity_similarity": identity} if identity is not None else None,
+                playback={"av_offset_ms": offset} if offset is not None else None,
+                system={"render_fps": fps} if fps is not None else None,
+                ctx={"remaining_turn_sec": remaining} if remaining is not None else None,
+                policy=self.policy,
+                state=self._states[slot],
+                now_ms=now_ms if isinstance(now_ms, int) else now_ms[slot],
+                options=options,
+            )
+            self._states[slot] = result["state"]
+            if result["actions"]:
+                out.append((slot, result["actions"]))
+        return out
+
+
+# Per-window signal columns extracted from a recorded trace, in BatchQualityController.step order.
+TRACE_COLUMNS = (
+    "lip_score",
+    "lip_confidence",
+    "lip_silence",
+    "lip_occluded",
+    "identity_similarity",
+    "av_offset_ms",
+    "render_fps",
+    "remaining_turn_sec",
+)
+
+
+def _numeric(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+def trace_columns(trace: Sequence[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """Flatten a recorded trace into per-window columns.
+
+    Each window is ``{"t_ms", "lipsync", "drift", "playback", "system", "ctx"}`` with the same
+    payloads decide() receives; missing or non-numeric values become NaN.
+    """
+    columns: Dict[str, List[float]] = {name: [] for name in ("t_ms",) + TRACE_COLUMNS}
+    for window in trace:
+        lipsync = window.get("lipsync") or {}
+        columns["t_ms"].append(int(window["t_ms"]))
+        columns["lip_score"].append(_numeric(lipsync.get("score")))
+        columns["lip_confidence"].append(_numeric(lipsync.get("confidence")))
+        columns["lip_silence"].append(bool(lipsync.get("is_silence")))
+        columns["lip_occluded"].append(bool(lipsync.get("occluded")))
+        columns["identity_similarity"].append(_numeric((window.get("drift") or {}).get("identity_similarity")))
+        columns["av_offset_ms"].append(_numeric((window.get("playback") or {}).get("av_offset_ms")))
+        columns["render_fps"].append(_numeric((window.get("system") or {}).get("render_fps")))
+        columns["remaining_turn_sec"].append(_numeric((window.get("ctx") or {}).get("remaining_turn_sec")))
+    return columns
+
+
+def policy_grid(base: Optional[Dict[str, float]] = None, **axes: Sequence[float]) -> List[Dict[str, float]]:
+    """Cartesian product of candidate values, e.g. ``policy_grid(lip_warn=[0.5, 0.55])``."""
+    names = sorted(axes)
+    grid = []
+    for values in itertools.product(*(axes[name] for name in names)):
+        policy = dict(base or {})
+        policy.update(zip(names, values))
+        grid.append(policy)
+    return grid
+
+
+def _new_trace_metrics() -> Dict[str, Any]:
+    return {
+        "windows": 0,
+        "duration_ms": 0.0,
+        "action_counts": {},
+        "heavy_actions": 0,
+        "degraded_ms": 0.0,
+        "level_ms": 0.0,
+        "degrade_ups": 0,
+        "degrade_downs": 0,
+        "oscillations": 0,
+    }
+
+
+def _finish_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    duration_ms = metrics["duration_ms"]
+    minutes = duration_ms / 60000.0
+    metrics["heavy_actions_per_min"] = metrics["heavy_actions"] / minutes if minutes > 0 else 0.0
+    metrics["degraded_fraction"] = metrics["degraded_ms"] / duration_ms if duration_ms > 0 else 0.0
+    metrics["mean_degrade_level"] = metrics.pop("level_ms") / duration_ms if duration_ms > 0 else 0.0
+    return metrics
+
+
+def replay_policy(
+    traces: Sequence[Union[Sequence[Dict[str, Any]], Dict[str, List[float]]]],
+    policy: Optional[Dict[str, float]] = None,
+    caps: Optional[Dict[str, object]] = None,
+    options: Optional[Dict[str, object]] = None,
+) -> Dict[str, Any]:
+    """Replay recorded traces through the controller under one policy.
+
+    All traces advance in lockstep as sessions of one BatchQualityController, so each decision
+    matches decide() on that trace. Returns per-trace metrics plus a ``total`` aggregate: action
+    counts, heavy-action rate, time spent degraded (each window lasts until the next one) and
+    oscillations (reversals in degrade-level direction). Raises ValueError if any trace is empty.
+    """
+    columns = [trace if isinstance(trace, dict) else trace_columns(trace) for trace in traces]
+    lengths = [len(col["t_ms"]) for col in columns]
+    empty = [i for i, n in enumerate(lengths) if n == 0]
+    if empty:
+        raise ValueError(f"replay_policy traces must not be empty (empty trace indices: {empty})")
+    count = len(columns)
+    controller = BatchQualityController(count, caps, policy, options)
+    metrics = [_new_trace_metrics() for _ in range(count)]
+    ticks = max(lengths, default=0)
+
+    # Pad every trace to the longest one; padded windows carry no signals and zero duration.
+    flags = ("lip_silence", "lip_occluded")
+    if NUMPY_AVAILABLE:
+        rows: Dict[str, Any] = {
+            name: np.zeros((ticks, count), dtype=bool) if name in flags else np.full((ticks, count), math.nan)
+            for name in TRACE_COLUMNS
+        }
+        now_rows: Any = np.zeros((ticks, count), dtype=np.int64)
+        dt_rows: Any = np.zeros((ticks, count))
+        for i, col in enumerate(columns):
+            n = lengths[i]
+            for name in TRACE_COLUMNS:
+                rows[name][:n, i] = col[name]
+            times = np.asarray(col["t_ms"], dtype=np.int64)
+            now_rows[:n, i] = times
+            now_rows[n:, i] = times[-1]
+            if n > 1:
+                dt_rows[: n - 1, i] = np.diff(times)
+                dt_rows[n - 1, i] = times[-1] - times[-2]
+        live_rows: Any = np.arange(ticks)[:, None] < np.asarray(lengths)[None, :]
+        prev_level = np.zeros(count, dtype=np.int64)
+        last_direction = np.zeros(count, dtype=np.int64)
+        acc = {key: np.zeros(count) for key in ("duration_ms", "level_ms", "degraded_ms", "degrade_ups", "degrade_downs", "oscillations")}
+    else:
+        rows = {}
+        for name in TRACE_COLUMNS:
+            pad: Any = False if name in flags else math.nan
+            rows[name] = [[col[name][t] if t < lengths[i] else pad for i, col in enumerate(columns)] for t in range(ticks)]
+        now_rows = [[col["t_ms"][min(t, lengths[i] - 1)] for i, col in enumerate(columns)] for t in range(ticks)]
+        dt_rows = [[0] * count for _ in range(ticks)]
+        for i, col in enumerate(columns):
+            times = col["t_ms"]
+            for t in range(lengths[i] - 1):
+                dt_rows[t][i] = times[t + 1] - times[t]
+            if lengths[i] > 1:
+                dt_rows[lengths[i] - 1][i] = times[-1] - times[-2]
+        live_rows = [[t < n for n in lengths] for t in range(ticks)]
+        prev_level = [0] * count
+        last_direction = [0] * count
+
+    heavy_types = HEAVY_ACTION_TYPES
+    action_acc = {kind: np.zeros(count, dtype=np.int64) for kind in _ACTION_TYPES} if NUMPY_AVAILABLE else {}
+    for tick in range(ticks):
+        step_rows = {name: rows[name][tick] for name in TRACE_COLUMNS}
+        if NUMPY_AVAILABLE:
+            # Count actions straight from the per-session codes; building decide()-style dicts
+            # would dominate the replay cost.
+            step_rows.pop("remaining_turn_sec")
+            playback_act, lip_act, drift_act, emit_degrade, _ = controller._advance(now_rows[tick], **step_rows)
+            live = live_rows[tick]
+            shorten = (playback_act == _ACT_REDUCE_AND_SHORTEN) & live
+            degrade = emit_degrade & live
+            action_acc["REDUCE_FPS"] += shorten
+            action_acc["REDUCE_FPS"] += degrade
+            action_acc["SHORTEN_REMAINING_TURN"] += shorten
+            action_acc["REDUCE_RESOLUTION"] += degrade
+            for codes in (playback_act, lip_act, drift_act):
+                action_acc["RESTART_PROVIDER_STREAM"] += (codes == _ACT_RESTART) & live
+                action_acc["FAILOVER_BACKEND"] += (codes == _ACT_FAILOVER) & live
+            action_acc["APPLY_MOUTH_CORRECTOR"] += (lip_act == _ACT_MOUTH) & live
+            action_acc["RERENDER_BLOCK"] += (lip_act == _ACT_RERENDER) & live
+            action_acc["FORCE_ANCHOR_RESET"] += (drift_act == _ACT_ANCHOR) & live
+        else:
+            for slot, actions in controller.step(now_rows[tick], **step_rows):
+                if tick >= lengths[slot]:
+                    continue
+                counts = metrics[slot]["action_counts"]
+                for action in actions:
+                    kind = action["type"]
+                    counts[kind] = counts.get(kind, 0) + 1
+                    if kind in heavy_types:
+                        metrics[slot]["heavy_actions"] += 1
+        if NUMPY_AVAILABLE:
+            level = controller.degrade_level
+            dt = dt_rows[tick]
+            live = live_rows[tick]
+            acc["duration_ms"] += dt
+            acc["level_ms"] += level * dt
+            acc["degraded_ms"] += (level > 0) * dt
+            direction = np.sign(level - prev_level) * live
+            acc["degrade_ups"] += direction > 0
+            acc["degrade_downs"] += direction < 0
+            acc["oscillations"] += (direction != 0) & (last_direction != 0) & (direction != last_direction)
+            last_direction = np.where(direction != 0, direction, last_direction)
+            prev_level = np.where(live, level, prev_level)
+            continue
+        levels = [state["degrade_level"] for state in controller._states]
+        for i in range(count):
+            if not live_rows[tick][i]:
+                continue
+            m = metrics[i]
+            level, dt = levels[i], dt_rows[tick][i]
+            m["duration_ms"] += dt
+            m["level_ms"] += level * dt
+            if level > 0:
+                m["degraded_ms"] += dt
+            if level != prev_level[i]:
+                direction = 1 if level > prev_level[i] else -1
+                m["degrade_ups" if direction > 0 else "degrade_downs"] += 1
+                if last_direction[i] and direction != last_direction[i]:
+                    m["oscillations"] += 1
+                last_direction[i] = direction
+                prev_level[i] = level
+    for i, m in enumerate(metrics):
+        m["windows"] = lengths[i]
+        if NUMPY_AVAILABLE:
+            for key, values in acc.items():
+                m[key] = float(values[i]) if key.endswith("_ms") else int(values[i])
+            m["action_counts"] = {kind: int(n[i]) for kind, n in action_acc.items() if n[i]}
+            m["heavy_actions"] = sum(n for kind, n in m["action_counts"].items() if kind in heavy_types)
+    total = _new_trace_metrics()
+    for m in metrics:
+        for key in ("windows", "duration_ms", "heavy_actions", "degraded_ms", "level_ms", "degrade_ups", "degrade_downs", "oscillations"):
+            total[key] += m[key]
+        for kind, n in m["action_counts"].items():
+            total["action_counts"][kind] = total["action_counts"].get(kind, 0) + n
+    return {
+        "policy": normalize_quality_policy(policy),
+        "traces": [_finish_metrics(m) for m in metrics],
+        "total": _finish_metrics(total),
+    }
+
+
+def _replay_summary(args: Tuple[Sequence[Dict[str, List[float]]], Dict[str, float], Any, Any]) -> Dict[str, Any]:
+    traces, policy, caps, options = args
+    report = replay_policy(traces, policy, caps, options)
+    return {"policy": report["policy"], "total": report["total"]}
+
+
+def sweep_policies(
+    traces: Sequence[Union[Sequence[Dict[str, Any]], Dict[str, List[float]]]],
+    policies: Iterable[Dict[str, float]],
+    caps: Optional[Dict[str, object]] = None,
+    options: Optional[Dict[str, object]] = None,
+    processes: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Replay every trace under each candidate policy, spreading policies across processes.
+
+    Returns one ``{"policy", "total"}`` summary per policy, in input order. ``processes=1`` runs
+    inline.
+    """
+    columns = [trace if isinstance(trace, dict) else trace_columns(trace) for trace in traces]
+    jobs = [(columns, policy, caps, options) for policy in policies]
+    workers = processes or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        return [_replay_summary(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_replay_summary, jobs))
+
+
+SIGNAL_KINDS = ("lipsync", "drift", "playback", "system")
+
+# How old the latest sample of each signal may be before decide() stops seeing it.
+DEFAULT_SIGNAL_MAX_AGE_MS = {"lipsync": 1500, "drift": 3000, "playback": 1000, "system": 2000}
+
+
+class SignalFusionBuffer:
+    """Per-session, timestamp-aligned view over the four controller signals.
+
+    Each signal has a bounded ring of ``(timestamp_ms, sample)``. ``fuse(now_ms)`` picks, per
+    signal, the newest sample not later than ``now_ms`` (late, out-of-order arrivals included)
+    and within that signal's max age; older or missing signals are passed as None and flagged
+    stale.
+    """
+
+    def __init__(self, capacity: int = 32, max_age_ms: Optional[Dict[str, float]] = None) -> None:
+        self.capacity = max(1, int(capacity))
+        self.max_age_ms = dict(DEFAULT_SIGNAL_MAX_AGE_MS)
+        if max_age_ms:
+            self.max_age_ms.update(max_age_ms)
+        self._times = {kind: array.array("d", [-math.inf]) * self.capacity for kind in SIGNAL_KINDS}
+        self._samples: Dict[str, List[Optional[Dict[str, object]]]] = {
+            kind: [None] * self.capacity for kind in SIGNAL_KINDS
+        }
+        self._heads = dict.fromkeys(SIGNAL_KINDS, 0)
+        self._newest = dict.fromkeys(SIGNAL_KINDS, -1)
+
+    def push(self, kind: str, timestamp_ms: float, sample: Dict[str, object]) -> None:
+        if kind not in self._heads:
+            raise ValueError(f"unknown signal kind: {kind}")
+        head = self._heads[kind]
+        times = self._times[kind]
+        newest = self._newest[kind]
+        newest_ts = times[newest] if newest >= 0 else -math.inf
+        times[head] = timestamp_ms
+        self._samples[kind][head] = sample
+        if timestamp_ms >= newest_ts:
+            self._newest[kind] = head
+        elif newest == head:
+            self._newest[kind] = max(range(self.capacity), key=times.__getitem__)
+        self._heads[kind] = (head + 1) % self.capacity
+
+    def latest(self, kind: str, now_ms: float) -> Tuple[Optional[Dict[str, object]], Optional[float]]:
+        """Newest sample at or before ``now_ms`` and its age, regardless of max age."""
+        times = self._times[kind]
+        newest = self._newest[kind]
+        if newest >= 0 and times[newest] <= now_ms:
+            return self._samples[kind][newest], now_ms - times[newest]
+        best = -1
+        best_ts = -math.inf
+        for slot in range(self.capacity):
+            ts = times[slot]
+            if best_ts < ts <= now_ms:
+                best, best_ts = slot, ts
+        if best < 0:
+            return None, None
+        return self._samples[kind][best], now_ms - best_ts
+
+    def fuse(self, now_ms: float) -> Dict[str, object]:
+        fused: Dict[str, object] = {}
+        stale: Dict[str, bool] = {}
+        ages: Dict[str, Optional[float]] = {}
+        for kind in SIGNAL_KINDS:
+            sample, age = self.latest(kind, now_ms)
+            ages[kind] = age
+            stale[kind] = age is None or age > self.max_age_ms[kind]
+            fused[kind] = None if stale[kind] else sample
+        fused["stale"] = stale
+        fused["age_ms"] = ages
+        return fused
+
+    def clear(self) -> None:
+        for kind in SIGNAL_KINDS:
+            self._times[kind] = array.array("d", [-math.inf]) * self.capacity
+            self._samples[kind] = [None] * self.capacity
+            self._heads[kind] = 0
+            self._newest[kind] = -1
+
+
+class _DriverSession:
+    __slots__ = ("buffer", "caps", "options", "ctx_provider", "on_actions", "state")
+
+    def __init__(self, buffer, caps, options, ctx_provider, on_actions) -> None:
+        self.buffer = buffer
+        self.caps = caps
+        self.options = options
+        self.ctx_provider = ctx_provider
+        self.on_actions = on_actions
+        self.state = create_initial_controller_state()
+
+
+class QualityControlDriver:
+    """Ticks decide() for many sessions from one shared asyncio timer.
+
+    Producers call ``ingest(session_id, kind, timestamp_ms, sample)`` whenever a signal arrives;
+    every ``interval_ms`` the driver fuses each session's buffer at the tick time (minus
+    ``align_delay_ms``, giving slow signals time to land), runs decide() and hands non-empty
+    action lists to the session's ``on_actions(session_id, actions, debug)`` callback.
+    """
+
+    def __init__(
+        self,
+        interval_ms: float = 250.0,
+        policy: Optional[Dict[str, float]] = None,
+        align_delay_ms: float = 0.0,
+        buffer_capacity: int = 32,
+        max_age_ms: Optional[Dict[str, float]] = None,
+        clock: Optional[Any] = None,
+    ) -> None:
+        self.interval_ms = interval_ms
+        self.policy = normalize_quality_policy(policy)
+        self.align_delay_ms = align_delay_ms
+        self.buffer_capacity = buffer_capacity
+        self.max_age_ms = max_age_ms
+        self.clock = clock or (lambda: time.time() * 1000.0)
+        self.sessions: Dict[str, _DriverSession] = {}
+        self.ticks = 0
+        self.max_tick_ms = 0.0
+        self.late_ticks = 0
+        self._running = False
+
+    def add_session(
+        self,
+        session_id: str,
+        caps: Dict[str, object],
+        on_actions: Optional[Any] = None,
+        options: Optional[Dict[str, object]] = None,
+        ctx_provider: Optional[Any] = None,
+    ) -> SignalFusionBuffer:
+        buffer = SignalFusionBuffer(self.buffer_capacity, self.max_age_ms)
+        self.sessions[session_id] = _DriverSession(buffer, caps, options or {}, ctx_provider, on_actions)
+        return buffer
+
+    def remove_session(self, session_id: str) -> None:
+        self.sessions.pop(session_id, None)
+
+    def ingest(self, session_id: str, kind: str, timestamp_ms: float, sample: Dict[str, object]) -> None:
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.buffer.push(kind, timestamp_ms, sample)
+
+    def state(self, session_id: str) -> Dict[str, int]:
+        return dict(self.sessions[session_id].state)
+
+    def tick(self, now_ms: Optional[float] = None) -> Dict[str, List[Dict[str, object]]]:
+        now_ms = self.clock() if now_ms is None else now_ms
+        aligned_ms = now_ms - self.align_delay_ms
+        emitted: Dict[str, List[Dict[str, object]]] = {}
+        for session_id, session in list(self.sessions.items()):
+            fused = session.buffer.fuse(aligned_ms)
+            result = decide(
+                session.caps,
+                lipsync=fused["lipsync"],
+                drift=fused["drift"],
+                playback=fused["playback"],
+                system=fused["system"],
+                ctx=session.ctx_provider() if session.ctx_provider else None,
+                policy=self.policy,
+                state=session.state,
+                now_ms=int(now_ms),
+                options=session.options,
+            )
+            session.state = result["state"]
+            if result["actions"]:
+                debug = result["debug"]
+                debug["fusion"] = {"stale": fused["stale"], "age_ms": fused["age_ms"]}
+                emitted[session_id] = result["actions"]
+                if session.on_actions is not None:
+                    session.on_actions(session_id, result["actions"], debug)
+        self.ticks += 1
+        return emitted
+
+    async def run(self) -> None:
+        """Tick on a drift-free schedule until ``stop()``; a slow tick skips missed slots."""
+        loop = asyncio.get_running_loop()
+        interval = self.interval_ms / 1000.0
+        next_at = loop.time() + interval
+        self._running = True
+        while self._running:
+            delay = next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if not self._running:
+                break
+            started = loop.time()
+            self.tick()
+            self.max_tick_ms = max(self.max_tick_ms, (loop.time() - started) * 1000.0)
+            next_at += interval
+            if loop.time() > next_at:
+                missed = int((loop.time() - next_at) // interval) + 1
+                self.late_ticks += missed
+                next_at += missed * interval
+
+    def stop(self) -> None:
+        self._running = False
+
+
+DEFAULT_PREDICTIVE_DEGRADE_POLICY = {
+    "horizon_ms": 1000,
+    "trend_window": 6,
+    "block_deadline_ms": 400,
+    "queue_depth_limit": 4,
+    "step_cooldown_ms": 750,
+    "recover_pressure": 0.7,
+    "recover_gpu_util": 0.8,
+}
+
+
+class _Trend:
+    """Least-squares slope over the last ``window`` (t, value) samples."""
+
+    __slots__ = ("window", "_t", "_v", "_head", "_count")
+
+    def __init__(self, window: int) -> None:
+        self.window = max(2, int(window))
+        self._t = array.array("d", [0.0]) * self.window
+        self._v = array.array("d", [0.0]) * self.window
+        self._head = 0
+        self._count = 0
+
+    def push(self, t_ms: float, value: float) -> None:
+        self._t[self._head] = t_ms
+        self._v[self._head] = value
+        self._head = (self._head + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+
+    def last(self) -> Optional[float]:
+        if not self._count:
+            return None
+        return self._v[(self._head - 1) % self.window]
+
+    def slope_per_ms(self) -> float:
+        n = self._count
+        if n < 2:
+            return 0.0
+        ts = self._t[:n] if n < self.window else self._t
+        vs = self._v[:n] if n < self.window else self._v
+        mean_t = sum(ts) / n
+        mean_v = sum(vs) / n
+        num = 0.0
+        den = 0.0
+        for t, v in zip(ts, vs):
+            dt = t - mean_t
+            num += dt * (v - mean_v)
+            den += dt * dt
+        return num / den if den > 0 else 0.0
+
+    def project(self, horizon_ms: float) -> Optional[float]:
+        last = self.last()
+        if last is None:
+            return None
+        return max(last, last + self.slope_per_ms() * horizon_ms)
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+
+class PredictiveDegradeController:
+    """Steps the degrade ladder down before SystemHealth trends reach a deadline miss.
+
+    ``observe`` fits short-horizon trends on ``p99_block_latency_ms`` and ``queue_depth``.
+    Pressure is the larger projected value relative to its limit; at >= 1 the controller raises
+    ``degrade_level`` one step (at most once per ``step_cooldown_ms``) ahead of decide(), which then
+    emits the REDUCE_FPS/REDUCE_RESOLUTION targets. While pressure stays above ``recover_pressure``,
+    or ``gpu_util`` is above ``recover_gpu_util`` (a step back up would overload), it holds
+    ``overall_ok_streak`` at zero, so recovery still goes through decide()'s
+    ``ok_consecutive_to_recover`` hysteresis once load has really eased.
+    """
+
+    def __init__(self, policy: Optional[Dict[str, float]] = None) -> None:
+        self.policy = dict(DEFAULT_PREDICTIVE_DEGRADE_POLICY)
+        if policy:
+            self.policy.update(policy)
+        window = int(self.policy["trend_window"])
+        self._latency = _Trend(window)
+        self._queue = _Trend(window)
+        self._gpu: Optional[float] = None
+        self.last_step_ms: Optional[int] = None
+        self.predictive_steps = 0
+
+    def observe(self, system: Optional[Dict[str, object]], now_ms: int) -> None:
+        system = system or {}
+        for trend, key in ((self._latency, "p99_block_latency_ms"), (self._queue, "queue_depth")):
+            value = system.get(key)
+            if isinstance(value, (int, float)):
+                trend.push(now_ms, float(value))
+        gpu = system.get("gpu_util")
+        self._gpu = float(gpu) if isinstance(gpu, (int, float)) else None
+
+    def pressure(self) -> Dict[str, float]:
+        horizon = self.policy["horizon_ms"]
+        out: Dict[str, float] = {}
+        for name, trend, limit in (
+            ("latency", self._latency, self.policy["block_deadline_ms"]),
+            ("queue", self._queue, self.policy["queue_depth_limit"]),
+        ):
+            projected = trend.project(horizon)
+            if projected is not None and limit > 0:
+                out[name] = projected / limit
+        out["max"] = max(out.values(), default=0.0)
+        return out
+
+    def adjust(self, state: Dict[str, int], now_ms: int) -> Tuple[Dict[str, int], Dict[str, object]]:
+        state = dict(state)
+        pressure = self.pressure()
+        stepped = False
+        cooled = self.last_step_ms is None or now_ms - self.last_step_ms >= self.policy["step_cooldown_ms"]
+        if pressure["max"] >= 1.0 and state["degrade_level"] < 3 and cooled:
+            state["degrade_level"] += 1
+            self.last_step_ms = now_ms
+            self.predictive_steps += 1
+            stepped = True
+        gpu_busy = self._gpu is not None and self._gpu >= self.policy["recover_gpu_util"]
+        if pressure["max"] >= self.policy["recover_pressure"] or (gpu_busy and state["degrade_level"] > 0):
+            state["overall_ok_streak"] = 0
+        return state, {"pressure": pressure, "stepped": stepped, "gpu_util": self._gpu}
+
+    def reset(self) -> None:
+        self._latency.clear()
+        self._queue.clear()
+        self._gpu = None
+        self.last_step_ms = None
+
+
+def decide_predictive(
+    predictor: PredictiveDegradeController,
+    caps: Dict[str, object],
+    lipsync: Optional[Dict[str, object]] = None,
+    drift: Optional[Dict[str, object]] = None,
+    playback: Optional[Dict[str, object]] = None,
+    system: Optional[Dict[str, object]] = None,
+    ctx: Optional[Dict[str, object]] = None,
+    policy: Optional[Dict[str, float]] = None,
+    state: Optional[Dict[str, int]] = None,
+    now_ms: Optional[int] = None,
+    options: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    """decide() with the degrade ladder pre-stepped from SystemHealth trends."""
+    now_ms = int(now_ms or time.time() * 1000)
+    predictor.observe(system, now_ms)
+    state, predictive = predictor.adjust(state or create_initial_controller_state(), now_ms)
+    result = decide(caps, lipsync, drift, playback, system, ctx, policy, state, now_ms, options)
+    result["debug"]["predictive"] = predictive
+    return result
+
+
+def simulate_load_trace(
+    load_trace: Sequence[Dict[str, float]],
+    predictor: Optional[PredictiveDegradeController] = None,
+    caps: Optional[Dict[str, object]] = None,
+    policy: Optional[Dict[str, float]] = None,
+    options: Optional[Dict[str, object]] = None,
+    block_ms: float = 200.0,
+    base_latency_ms: float = 120.0,
+) -> Dict[str, float]:
+    """Closed-loop render model for comparing reactive and predictive degrade ladders.
+
+    Each window ``{"t_ms", "load"}`` gives offered render demand at full quality relative to
+    capacity. Degrade level scales demand by frame rate and pixel count; unfinished work becomes
+    backlog, which sets queue depth and p99 block latency. Frames in windows whose latency exceeds
+    the predictor's ``block_deadline_ms`` count as late. Returns late/total frames, mean degrade
+    level and mean quality (rendered pixel rate relative to full quality).
+    """
+    options = options or {}
+    fps_targets = options.get("degrade_fps_targets") or [30, 24, 20, 15]
+    short_targets = options.get("degrade_short_side_targets") or [720, 640, 512, 384]
+    deadline_ms = (predictor.policy if predictor else DEFAULT_PREDICTIVE_DEGRADE_POLICY)["block_deadline_ms"]
+    state = create_initial_controller_state()
+    backlog_ms = 0.0
+    late = frames = level_sum = quality_sum = 0.0
+    prev_t: Optional[float] = None
+    for window in load_trace:
+        t_ms = float(window["t_ms"])
+        dt = t_ms - prev_t if prev_t is not None else block_ms
+        prev_t = t_ms
+        level = state["degrade_level"]
+        fps = fps_targets[min(level, len(fps_targets) - 1)]
+        short = short_targets[min(level, len(short_targets) - 1)]
+        cost = (fps / fps_targets[0]) * (short / short_targets[0]) ** 2
+        demand = window["load"] * cost
+        backlog_ms = max(0.0, backlog_ms + (demand - 1.0) * dt)
+        latency = base_latency_ms + backlog_ms
+        window_frames = fps * dt / 1000.0
+        frames += window_frames
+        if latency > deadline_ms:
+            late += window_frames
+        level_sum += level * dt
+        quality_sum += cost * dt
+        system = {
+            # Achieved fraction of the target rate, on the nominal full-quality scale decide() expects.
+            "render_fps": fps_targets[0] * min(1.0, 1.0 / demand) if demand > 0 else fps_targets[0],
+            "gpu_util": min(1.0, demand),
+            "queue_depth": backlog_ms / block_ms,
+            "p99_block_latency_ms": latency,
+        }
+        if predictor is not None:
+            result = decide_predictive(predictor, caps or {}, system=system, policy=policy, state=state, now_ms=int(t_ms), options=options)
+        else:
+            result = decide(caps or {}, system=system, policy=policy, state=state, now_ms=int(t_ms), options=options)
+        state = result["state"]
+    duration = sum(1 for _ in load_trace) and (prev_t - float(load_trace[0]["t_ms"]) + block_ms)
+    return {
+        "frames": frames,
+        "late_frames": late,
+        "late_fraction": late / frames if frames else 0.0,
+        "mean_degrade_level": level_sum / duration if duration else 0.0,
+        "mean_quality": quality_sum / duration if duration else 0.0,
+    }
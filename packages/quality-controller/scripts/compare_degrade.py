@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Compare the reactive and predictive degrade ladders on replayed load traces.
+
+Each trace file is JSONL, one window per line: {"t_ms": ..., "load": ...} where load is offered
+render demand at full quality relative to capacity.
+
+    python scripts/compare_degrade.py traces/load_*.jsonl --set horizon_ms=600
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from quality_controller import PredictiveDegradeController, simulate_load_trace  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("traces", nargs="+", type=Path)
+    parser.add_argument("--set", action="append", default=[], help="predictive policy override, e.g. horizon_ms=600")
+    args = parser.parse_args()
+
+    overrides = {}
+    for item in args.set:
+        name, _, raw = item.partition("=")
+        overrides[name] = json.loads(raw)
+
+    totals = {"reactive": [0.0, 0.0, 0.0], "predictive": [0.0, 0.0, 0.0]}
+    for path in args.traces:
+        with path.open() as handle:
+            trace = [json.loads(line) for line in handle if line.strip()]
+        for name, predictor in (("reactive", None), ("predictive", PredictiveDegradeController(overrides))):
+            result = simulate_load_trace(trace, predictor)
+            totals[name][0] += result["late_frames"]
+            totals[name][1] += result["frames"]
+            totals[name][2] += result["mean_quality"] / len(args.traces)
+
+    print("ladder\tlate_frames\tlate_fraction\tmean_quality")
+    for name, (late, frames, quality) in totals.items():
+        print(f"{name}\t{late:.0f}\t{late / frames if frames else 0.0:.4f}\t{quality:.3f}")
+
+
+if __name__ == "__main__":
+    main()
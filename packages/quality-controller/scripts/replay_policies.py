@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Sweep candidate quality policies over recorded signal traces.
+
+Each trace file is JSONL, one window per line: {"t_ms", "lipsync", "drift", "playback", "system", "ctx"}.
+
+    python scripts/replay_policies.py traces/*.jsonl \
+        --set lip_warn=0.5,0.55,0.6 --set cooldown_ms_heavy_action=1000,1500 \
+        --caps '{"supports_restart_stream": true}'
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from quality_controller import policy_grid, sweep_policies, trace_columns  # noqa: E402
+
+
+def load_trace(path: Path) -> dict:
+    with path.open() as handle:
+        return trace_columns([json.loads(line) for line in handle if line.strip()])
+
+
+def parse_axes(values: list) -> dict:
+    axes = {}
+    for item in values:
+        name, _, raw = item.partition("=")
+        axes[name] = [json.loads(v) for v in raw.split(",") if v]
+    return axes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("traces", nargs="+", type=Path)
+    parser.add_argument("--set", action="append", default=[], help="policy axis, e.g. lip_warn=0.5,0.55")
+    parser.add_argument("--caps", default="{}", help="provider caps JSON")
+    parser.add_argument("--options", default="{}", help="controller options JSON")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    traces = [load_trace(path) for path in args.traces]
+    axes = parse_axes(args.set)
+    grid = policy_grid(**axes)
+    started = time.perf_counter()
+    results = sweep_policies(traces, grid, json.loads(args.caps), json.loads(args.options), args.processes)
+    elapsed = time.perf_counter() - started
+
+    names = sorted(axes)
+    header = names + ["heavy/min", "degraded", "mean_level", "oscillations", "actions"]
+    print("\t".join(header))
+    for result in results:
+        total = result["total"]
+        row = [str(result["policy"][name]) for name in names] + [
+            f"{total['heavy_actions_per_min']:.2f}",
+            f"{total['degraded_fraction']:.3f}",
+            f"{total['mean_degrade_level']:.2f}",
+            str(total["oscillations"]),
+            json.dumps(total["action_counts"], sort_keys=True),
+        ]
+        print("\t".join(row))
+    decisions = sum(len(trace["t_ms"]) for trace in traces) * len(grid)
+    print(f"\n{decisions} decisions in {elapsed:.2f}s ({decisions / elapsed:,.0f}/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from .schema_validators import (
+    COMPILER_VERSION,
+    compile_package_schemas,
+    compile_validator,
+    generate_validator_source,
+    interpret_schema,
+    load_schema_validator,
+    package_schema_paths,
+)
+
+__all__ = [
+    "COMPILER_VERSION",
+    "compile_package_schemas",
+    "compile_validator",
+    "generate_validator_source",
+    "interpret_schema",
+    "load_schema_validator",
+    "package_schema_paths",
+]
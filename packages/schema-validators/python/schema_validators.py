@@ -0,0 +1,639 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Bump when generated code changes so stale cache files are not reused.
+COMPILER_VERSION = 1
+
+Validator = Callable[[Any], List[str]]
+
+_TYPE_NAMES = {
+    "object": "an object",
+    "array": "an array",
+    "string": "a string",
+    "integer": "an integer",
+    "number": "a number",
+    "boolean": "a boolean",
+    "null": "null",
+}
+
+_MEMORY_CACHE: Dict[str, Validator] = {}
+
+
+def _schema_types(schema: Dict[str, Any]) -> List[str]:
+    kind = schema.get("type")
+    if kind is None:
+        return []
+    return [kind] if isinstance(kind, str) else list(kind)
+
+
+def _fmt(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return f"{value:g}"
+    if isinstance(value, str):
+        return f"'{value}'"
+    return json.dumps(value, sort_keys=True)
+
+
+def _bounds_suffix(schema: Dict[str, Any]) -> str:
+    lo = schema.get("minimum")
+    hi = schema.get("maximum")
+    xlo = schema.get("exclusiveMinimum")
+    xhi = schema.get("exclusiveMaximum")
+    parts = []
+    if lo is not None and hi is not None:
+        return f" between {_fmt(lo)} and {_fmt(hi)}"
+    if lo is not None:
+        parts.append(f">= {_fmt(lo)}")
+    if xlo is not None:
+        parts.append(f"> {_fmt(xlo)}")
+    if hi is not None:
+        parts.append(f"<= {_fmt(hi)}")
+    if xhi is not None:
+        parts.append(f"< {_fmt(xhi)}")
+    return (" " + " and ".join(parts)) if parts else ""
+
+
+def _type_message(schema: Dict[str, Any]) -> str:
+    """``must be ...`` text for a failed type (and numeric bound) check."""
+    types = _schema_types(schema)
+    names = [_TYPE_NAMES.get(t, t) for t in types]
+    text = "must be " + " or ".join(names)
+    if any(t in ("number", "integer") for t in types):
+        text += _bounds_suffix(schema)
+    if types == ["string"] and schema.get("minLength") == 1:
+        text = "must be a non-empty string"
+    return text
+
+
+def _enum_message(values: Sequence[Any]) -> str:
+    if len(values) == 2:
+        return f"must be {_fmt(values[0])} or {_fmt(values[1])}"
+    return "must be one of " + ", ".join(_fmt(v) for v in values)
+
+
+def _items_message(schema: Dict[str, Any]) -> Optional[str]:
+    lo = schema.get("minItems")
+    hi = schema.get("maxItems")
+    if lo is not None and lo == hi:
+        return f"must have exactly {lo} items"
+    if lo == 1 and hi is None:
+        return "must be a non-empty array"
+    if lo is not None and hi is not None:
+        return f"must have between {lo} and {hi} items"
+    if lo is not None:
+        return f"must have at least {lo} items"
+    if hi is not None:
+        return f"must have at most {hi} items"
+    return None
+
+
+def _length_message(schema: Dict[str, Any]) -> Optional[str]:
+    lo = schema.get("minLength")
+    hi = schema.get("maxLength")
+    if lo == 1 and hi is None:
+        return "must be a non-empty string"
+    if lo is not None and hi is not None:
+        return f"must be {lo}-{hi} characters"
+    if lo is not None:
+        return f"must be at least {lo} characters"
+    if hi is not None:
+        return f"must be at most {hi} characters"
+    return None
+
+
+def _resolve_ref(root: Dict[str, Any], ref: str) -> Dict[str, Any]:
+    if not ref.startswith("#/"):
+        raise ValueError(f"unsupported $ref: {ref}")
+    node: Any = root
+    for part in ref[2:].split("/"):
+        node = node[part.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+# ---------------------------------------------------------------------------
+# Generic interpreter (reference implementation and benchmark baseline)
+
+
+def _type_ok(kind: str, value: Any) -> bool:
+    if kind == "object":
+        return isinstance(value, dict)
+    if kind == "array":
+        return isinstance(value, list)
+    if kind == "string":
+        return isinstance(value, str)
+    if kind == "integer":
+        return type(value) is int
+    if kind == "number":
+        return type(value) is int or (type(value) is float and math.isfinite(value))
+    if kind == "boolean":
+        return type(value) is bool
+    if kind == "null":
+        return value is None
+    return True
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) is int or type(value) is float
+
+
+def _bounds_ok(schema: Dict[str, Any], value: Any) -> bool:
+    if not _is_number(value):
+        return True
+    lo = schema.get("minimum")
+    hi = schema.get("maximum")
+    xlo = schema.get("exclusiveMinimum")
+    xhi = schema.get("exclusiveMaximum")
+    return (
+        (lo is None or value >= lo)
+        and (hi is None or value <= hi)
+        and (xlo is None or value > xlo)
+        and (xhi is None or value < xhi)
+    )
+
+
+def _interpret(root: Dict[str, Any], schema: Dict[str, Any], value: Any, path: str, errors: List[str]) -> None:
+    if "$ref" in schema:
+        _interpret(root, _resolve_ref(root, schema["$ref"]), value, path, errors)
+        return
+    types = _schema_types(schema)
+    if types and not any(_type_ok(t, value) for t in types):
+        errors.append(f"{path} {_type_message(schema)}")
+        return
+    if not _bounds_ok(schema, value):
+        errors.append(f"{path} {_type_message(schema) if types else 'must be' + _bounds_suffix(schema)}")
+    if "const" in schema and value != schema["const"]:
+        errors.append(f"{path} must be {_fmt(schema['const'])}")
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path} {_enum_message(schema['enum'])}")
+    for sub in schema.get("allOf") or ():
+        _interpret(root, sub, value, path, errors)
+    branches = schema.get("anyOf") or schema.get("oneOf")
+    if branches:
+        if all(_branch_errors(root, sub, value, path) for sub in branches):
+            errors.append(f"{path} must match one of the allowed schemas")
+    if isinstance(value, str):
+        message = _length_message(schema)
+        lo = schema.get("minLength")
+        hi = schema.get("maxLength")
+        if message and ((lo is not None and len(value) < lo) or (hi is not None and len(value) > hi)):
+            errors.append(f"{path} {message}")
+        pattern = schema.get("pattern")
+        if pattern is not None and not re.search(pattern, value):
+            errors.append(f"{path} must match {pattern}")
+    if isinstance(value, list):
+        message = _items_message(schema)
+        lo = schema.get("minItems")
+        hi = schema.get("maxItems")
+        if message and ((lo is not None and len(value) < lo) or (hi is not None and len(value) > hi)):
+            errors.append(f"{path} {message}")
+        items = schema.get("items")
+        if isinstance(items, dict):
+            for idx, item in enumerate(value):
+                _interpret(root, items, item, f"{path}[{idx}]", errors)
+    if isinstance(value, dict):
+        properties = schema.get("properties") or {}
+        prefix = "" if path == _ROOT_SENTINEL else f"{path}."
+        required = schema.get("required") or ()
+        for name in required:
+            if name not in properties and name not in value:
+                errors.append(f"{prefix}{name} is required")
+        for name, sub in properties.items():
+            if name in value:
+                _interpret(root, sub, value[name], f"{prefix}{name}", errors)
+            elif name in required:
+                errors.append(f"{prefix}{name} is required")
+        extra = schema.get("additionalProperties")
+        if extra is not None and extra is not True:
+            for name, item in value.items():
+                if name in properties:
+                    continue
+                if extra is False:
+                    errors.append(f"{prefix}{name} is not allowed")
+                else:
+                    _interpret(root, extra, item, f"{prefix}{name}", errors)
+
+
+def _branch_errors(root: Dict[str, Any], schema: Dict[str, Any], value: Any, path: str) -> List[str]:
+    errors: List[str] = []
+    _interpret(root, schema, value, path, errors)
+    return errors
+
+
+# Root path marker: errors on the root use the caller's root name, children use bare field names.
+_ROOT_SENTINEL = "\x00root"
+
+
+def interpret_schema(schema: Dict[str, Any], value: Any, root: str = "value") -> List[str]:
+    """Validate by walking the schema on every call; same messages as the compiled validators."""
+    errors: List[str] = []
+    _interpret(schema, schema, value, _ROOT_SENTINEL, errors)
+    return [e.replace(_ROOT_SENTINEL, root) for e in errors]
+
+
+# ---------------------------------------------------------------------------
+# Code generator
+
+
+def _lit(text: str) -> str:
+    """Escape constant text for use inside a generated f-string literal."""
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("{", "{{").replace("}", "}}").replace("\n", "\\n")
+
+
+# Path template used inside $ref functions, whose path arrives as a runtime argument.
+_REF_PATH = "{_p(path)}"
+
+
+class _Generator:
+    def __init__(self, schema: Dict[str, Any], root: str) -> None:
+        self.schema = schema
+        self.root = root
+        self.lines: List[str] = []
+        self.consts: List[str] = []
+        self.ref_funcs: Dict[str, str] = {}
+        self.pending_refs: List[str] = []
+        self.plain_paths: Dict[str, str] = {}
+        self.counter = 0
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def const(self, expr: str) -> str:
+        name = self.fresh("_C")
+        self.consts.append(f"{name} = {expr}")
+        return name
+
+    @staticmethod
+    def child(path: Optional[str], name_tpl: str) -> str:
+        if path is None:
+            return name_tpl
+        if path == _REF_PATH:
+            return f"{{_c(path)}}{name_tpl}"
+        return f"{path}.{name_tpl}"
+
+    def prop_path(self, path: Optional[str], name: str) -> str:
+        """Path template for property ``name``, remembering its unescaped text when fully constant."""
+        child = self.child(path, _lit(name))
+        parent = self.root if path is None else self.plain_paths.get(path)
+        if parent is not None:
+            self.plain_paths[child] = name if path is None else f"{parent}.{name}"
+        return child
+
+    def path_text(self, path: Optional[str]) -> str:
+        return _lit(self.root) if path is None else path
+
+    def error(self, out: List[str], indent: str, path: Optional[str], message: str) -> None:
+        plain_path = self.root if path is None else self.plain_paths.get(path)
+        if plain_path is None:
+            out.append(f'{indent}errors.append(f"{self.path_text(path)} {_lit(message)}")')
+        else:
+            out.append(f"{indent}errors.append({f'{plain_path} {message}'!r})")
+
+    def type_check(self, types: List[str], var: str) -> str:
+        checks = []
+        for kind in types:
+            if kind == "object":
+                checks.append(f"isinstance({var}, dict)")
+            elif kind == "array":
+                checks.append(f"isinstance({var}, list)")
+            elif kind == "string":
+                checks.append(f"isinstance({var}, str)")
+            elif kind == "integer":
+                checks.append(f"type({var}) is int")
+            elif kind == "number":
+                checks.append(f"(type({var}) is int or (type({var}) is float and _isfinite({var})))")
+            elif kind == "boolean":
+                checks.append(f"type({var}) is bool")
+            elif kind == "null":
+                checks.append(f"{var} is None")
+        return " or ".join(checks) if checks else "True"
+
+    def bounds_check(self, schema: Dict[str, Any], var: str) -> Optional[str]:
+        parts = []
+        if schema.get("minimum") is not None:
+            parts.append(f"{var} >= {schema['minimum']!r}")
+        if schema.get("maximum") is not None:
+            parts.append(f"{var} <= {schema['maximum']!r}")
+        if schema.get("exclusiveMinimum") is not None:
+            parts.append(f"{var} > {schema['exclusiveMinimum']!r}")
+        if schema.get("exclusiveMaximum") is not None:
+            parts.append(f"{var} < {schema['exclusiveMaximum']!r}")
+        return " and ".join(parts) if parts else None
+
+    def ref_func(self, ref: str) -> str:
+        if ref not in self.ref_funcs:
+            self.ref_funcs[ref] = f"_ref{len(self.ref_funcs)}"
+            self.pending_refs.append(ref)
+        return self.ref_funcs[ref]
+
+    def node(self, schema: Dict[str, Any], var: str, path: Optional[str], indent: str, out: List[str]) -> None:
+        if "$ref" in schema:
+            func = self.ref_func(schema["$ref"])
+            path_expr = f'f"{self.path_text(path)}"' if path is not None else repr(_ROOT_SENTINEL)
+            out.append(f"{indent}{func}({var}, {path_expr}, errors)")
+            return
+        types = _schema_types(schema)
+        body: List[str] = []
+        inner = indent + "    " if types else indent
+        bounds = self.bounds_check(schema, var)
+        if bounds:
+            if types and set(types) <= {"number", "integer"}:
+                body.append(f"{inner}if not ({bounds}):")
+                self.error(body, inner + "    ", path, _type_message(schema))
+            elif types:
+                body.append(f"{inner}if _is_number({var}) and not ({bounds}):")
+                self.error(body, inner + "    ", path, _type_message(schema))
+            else:
+                body.append(f"{inner}if _is_number({var}) and not ({bounds}):")
+                self.error(body, inner + "    ", path, "must be" + _bounds_suffix(schema))
+        if "const" in schema:
+            name = self.const(repr(schema["const"]))
+            body.append(f"{inner}if {var} != {name}:")
+            self.error(body, inner + "    ", path, f"must be {_fmt(schema['const'])}")
+        if "enum" in schema:
+            values = schema["enum"]
+            name = self.const(repr(tuple(values)))
+            body.append(f"{inner}if {var} not in {name}:")
+            self.error(body, inner + "    ", path, _enum_message(values))
+        for sub in schema.get("allOf") or ():
+            self.node(sub, var, path, inner, body)
+        branches = schema.get("anyOf") or schema.get("oneOf")
+        if branches:
+            funcs = [self.ref_func(self._inline_ref(sub)) for sub in branches]
+            checks = " and ".join(f"_fails({func}, {var})" for func in funcs)
+            body.append(f"{inner}if {checks}:")
+            self.error(body, inner + "    ", path, "must match one of the allowed schemas")
+        self.string_rules(schema, var, path, inner, body, guarded="string" in types and len(types) == 1)
+        self.array_rules(schema, var, path, inner, body, guarded="array" in types and len(types) == 1)
+        self.object_rules(schema, var, path, inner, body, guarded="object" in types and len(types) == 1)
+        if types:
+            out.append(f"{indent}if not ({self.type_check(types, var)}):")
+            self.error(out, indent + "    ", path, _type_message(schema))
+            if body:
+                out.append(f"{indent}else:")
+                out.extend(body)
+        else:
+            out.extend(body)
+
+    def _inline_ref(self, sub: Dict[str, Any]) -> str:
+        # anyOf/oneOf branches are compiled as standalone functions under synthetic refs.
+        key = "#inline/" + json.dumps(sub, sort_keys=True)
+        self.inline_schemas = getattr(self, "inline_schemas", {})
+        self.inline_schemas[key] = sub
+        return key
+
+    def string_rules(self, schema, var, path, indent, out, guarded) -> None:
+        message = _length_message(schema)
+        pattern = schema.get("pattern")
+        if not message and pattern is None:
+            return
+        body: List[str] = []
+        inner = indent if guarded else indent + "    "
+        lo = schema.get("minLength")
+        hi = schema.get("maxLength")
+        if message and (lo is not None or hi is not None):
+            conds = []
+            if lo is not None:
+                conds.append(f"len({var}) < {lo}")
+            if hi is not None:
+                conds.append(f"len({var}) > {hi}")
+            body.append(f"{inner}if {' or '.join(conds)}:")
+            self.error(body, inner + "    ", path, message)
+        if pattern is not None:
+            name = self.const(f"_re.compile({pattern!r})")
+            body.append(f"{inner}if not {name}.search({var}):")
+            self.error(body, inner + "    ", path, f"must match {pattern}")
+        if not guarded:
+            out.append(f"{indent}if isinstance({var}, str):")
+        out.extend(body)
+
+    def array_rules(self, schema, var, path, indent, out, guarded) -> None:
+        message = _items_message(schema)
+        items = schema.get("items")
+        if not message and not isinstance(items, dict):
+            return
+        body: List[str] = []
+        inner = indent if guarded else indent + "    "
+        if message:
+            conds = []
+            if schema.get("minItems") is not None:
+                conds.append(f"len({var}) < {schema['minItems']}")
+            if schema.get("maxItems") is not None:
+                conds.append(f"len({var}) > {schema['maxItems']}")
+            body.append(f"{inner}if {' or '.join(conds)}:")
+            self.error(body, inner + "    ", path, message)
+        if isinstance(items, dict) and items:
+            idx = self.fresh("i")
+            item = self.fresh("v")
+            body.append(f"{inner}for {idx}, {item} in enumerate({var}):")
+            child_path = (f"{_lit(self.root)}" if path is None else path) + f"[{{{idx}}}]"
+            self.node(items, item, child_path, inner + "    ", body)
+        if not guarded:
+            out.append(f"{indent}if isinstance({var}, list):")
+        out.extend(body)
+
+    def object_rules(self, schema, var, path, indent, out, guarded) -> None:
+        properties = schema.get("properties") or {}
+        required = schema.get("required") or []
+        extra = schema.get("additionalProperties")
+        if not properties and not required and (extra is None or extra is True):
+            return
+        body: List[str] = []
+        inner = indent if guarded else indent + "    "
+        for name in required:
+            if name not in properties:
+                body.append(f"{inner}if {name!r} not in {var}:")
+                self.error(body, inner + "    ", self.prop_path(path, name), "is required")
+        for name, sub in properties.items():
+            child_var = self.fresh("v")
+            body.append(f"{inner}if {name!r} in {var}:")
+            if sub:
+                body.append(f"{inner}    {child_var} = {var}[{name!r}]")
+                self.node(sub, child_var, self.prop_path(path, name), inner + "    ", body)
+            else:
+                body.append(f"{inner}    pass")
+            if name in required:
+                body.append(f"{inner}else:")
+                self.error(body, inner + "    ", self.prop_path(path, name), "is required")
+        if extra is not None and extra is not True:
+            key = self.fresh("k")
+            item = self.fresh("v")
+            known = self.const(f"frozenset({sorted(properties)!r})")
+            body.append(f"{inner}for {key}, {item} in {var}.items():")
+            body.append(f"{inner}    if {key} in {known}:")
+            body.append(f"{inner}        continue")
+            child_path = self.child(path, f"{{{key}}}")
+            if extra is False:
+                self.error(body, inner + "    ", child_path, "is not allowed")
+            else:
+                self.node(extra, item, child_path, inner + "    ", body)
+        if not guarded:
+            out.append(f"{indent}if isinstance({var}, dict):")
+        out.extend(body)
+
+    def generate(self, name: str) -> str:
+        main: List[str] = []
+        self.node(self.schema, "value", None, "    ", main)
+        funcs: List[str] = []
+        done = set()
+        while self.pending_refs:
+            ref = self.pending_refs.pop()
+            if ref in done:
+                continue
+            done.add(ref)
+            target = self.inline_schemas[ref] if ref.startswith("#inline/") else _resolve_ref(self.schema, ref)
+            body: List[str] = []
+            self.node(target, "value", _REF_PATH, "    ", body)
+            funcs.append(f"def {self.ref_funcs[ref]}(value, path, errors):")
+            funcs.extend(body or ["    pass"])
+            funcs.append("")
+            funcs.append("")
+        header = [
+            f"# Generated by schema_validators (compiler v{COMPILER_VERSION}); do not edit.",
+            "import re as _re",
+            "from math import isfinite as _isfinite",
+            "",
+            "",
+            "def _is_number(v):",
+            "    return type(v) is int or type(v) is float",
+            "",
+            "",
+            "def _p(path):",
+            f"    return {self.root!r} if path == {_ROOT_SENTINEL!r} else path",
+            "",
+            "",
+            "def _c(path):",
+            f"    return '' if path == {_ROOT_SENTINEL!r} else path + '.'",
+            "",
+            "",
+            "def _fails(func, value):",
+            "    errors = []",
+            f"    func(value, {_ROOT_SENTINEL!r}, errors)",
+            "    return bool(errors)",
+            "",
+            "",
+        ]
+        return "\n".join(
+            header
+            + self.consts
+            + ["", ""]
+            + funcs
+            + [f"def {name}(value):", "    errors = []"]
+            + (main or [])
+            + ["    return errors", ""]
+        )
+
+
+def generate_validator_source(schema: Dict[str, Any], root: str = "value", name: str = "validate") -> str:
+    """Python source for a module whose ``validate(value) -> List[str]`` checks ``schema``."""
+    return _Generator(schema, root).generate(name)
+
+
+def _default_cache_dir() -> Path:
+    configured = os.environ.get("SCHEMA_VALIDATOR_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "ai-sdk-schema-validators"
+
+
+def _owned_private(path: Path) -> bool:
+    """True when ``path`` belongs to this user and is not writable by group/others (POSIX)."""
+    if not hasattr(os, "getuid"):
+        return True
+    info = path.lstat()
+    return info.st_uid == os.getuid() and not info.st_mode & 0o022
+
+
+def _private_cache_dir(directory: Path) -> Optional[Path]:
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if directory.is_symlink() or not _owned_private(directory):
+            return None
+    except OSError:
+        return None
+    return directory
+
+
+def _schema_digest(schema: Dict[str, Any], root: str) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{COMPILER_VERSION}:{root}:{canonical}".encode("utf-8")).hexdigest()[:16]
+
+
+def _write_cache_file(directory: Path, path: Path, source: str) -> None:
+    try:
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(source)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the cache file is only a convenience; the validator runs from memory
+
+
+def compile_validator(
+    schema: Dict[str, Any],
+    root: str = "value",
+    cache_dir: Optional[Path] = None,
+    prefix: Optional[str] = None,
+) -> Validator:
+    """Compile ``schema`` to a validator, keeping the generated module on disk for inspection.
+
+    The cache file name carries a hash of the schema, root name and compiler version. The cache
+    directory is per user (``~/.cache`` unless ``SCHEMA_VALIDATOR_CACHE_DIR`` is set) and created
+    0700; a directory or file this user does not own, or that others can write, is never trusted.
+    An existing file is only reused when its contents equal the freshly generated source, and the
+    module is executed from that verified text, never re-read from disk.
+    """
+    digest = _schema_digest(schema, root)
+    cached = _MEMORY_CACHE.get(digest)
+    if cached is not None:
+        return cached
+    stem = re.sub(r"[^0-9A-Za-z_]", "_", prefix or str(schema.get("title") or "schema")).lower()
+    source = generate_validator_source(schema, root)
+    directory = _private_cache_dir(Path(cache_dir) if cache_dir is not None else _default_cache_dir())
+    filename = f"<schema-validator {stem}_{digest}>"
+    if directory is not None:
+        path = directory / f"{stem}_{digest}.py"
+        try:
+            trusted = not path.is_symlink() and _owned_private(path) and path.read_text("utf-8") == source
+        except OSError:
+            trusted = False
+        if not trusted:
+            _write_cache_file(directory, path, source)
+        filename = str(path)
+    module = types.ModuleType(f"_schema_validator_{stem}_{digest}")
+    module.__file__ = filename
+    exec(compile(source, filename, "exec"), module.__dict__)
+    validator: Validator = module.validate
+    _MEMORY_CACHE[digest] = validator
+    return validator
+
+
+def load_schema_validator(path: Path, root: str = "value", cache_dir: Optional[Path] = None) -> Validator:
+    path = Path(path)
+    schema = json.loads(path.read_text("utf-8"))
+    return compile_validator(schema, root, cache_dir, prefix=path.name.split(".")[0])
+
+
+def package_schema_paths(packages_dir: Optional[Path] = None) -> List[Path]:
+    base = Path(packages_dir) if packages_dir is not None else Path(__file__).resolve().parents[2]
+    return sorted(base.glob("*/schemas/*.schema.json"))
+
+
+def compile_package_schemas(packages_dir: Optional[Path] = None, cache_dir: Optional[Path] = None) -> Dict[str, Validator]:
+    """Compile every ``packages/*/schemas/*.schema.json``; keyed by schema file stem."""
+    return {
+        path.name.split(".")[0]: load_schema_validator(path, cache_dir=cache_dir)
+        for path in package_schema_paths(packages_dir)
+    }
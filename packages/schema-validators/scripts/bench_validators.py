@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Microbenchmark: compiled schema validators vs the generic interpreter vs hand validators.
+
+Reports the best of several repeats in microseconds per call for turn_plan and persona_pack
+documents (one valid, one with errors). Includes jsonschema when it is installed.
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+PACKAGES = Path(__file__).resolve().parents[2]
+for package in ("schema-validators", "planning-control", "persona-core"):
+    sys.path.insert(0, str(PACKAGES / package / "python"))
+
+from schema_validators import compile_validator, interpret_schema  # noqa: E402
+from planning_control import create_heuristic_turn_plan, load_turn_plan_schema, validate_turn_plan  # noqa: E402
+from persona_core import validate_persona_pack  # noqa: E402
+
+try:
+    import jsonschema
+except ImportError:  # pragma: no cover - optional baseline
+    jsonschema = None
+
+
+def sample_turn_plan() -> dict:
+    text = " ".join(f"Sentence number {i} has a few words in it." for i in range(12))
+    return create_heuristic_turn_plan(text)
+
+
+def sample_persona_pack() -> dict:
+    anchors = [
+        {"image_ref": f"s3://anchors/{i}.png", "metadata": {"expression_tag": "neutral", "crop_box": [0, 0, 512, 512], "best_for": ["default"]}}
+        for i in range(4)
+    ]
+    return {
+        "persona_id": "ava",
+        "version": "3",
+        "anchor_sets": {"A_SELFIE": anchors, "B_MIRROR": anchors},
+        "identity": {"face_embedding_refs": ["emb://ava/0"]},
+        "style": {"style_embedding_refs": []},
+        "behavior_policy": {"emotion_range": {"min_intensity": 0.1, "max_intensity": 0.9}},
+    }
+
+
+def broken(doc: dict) -> dict:
+    doc = json.loads(json.dumps(doc))
+    for key in list(doc)[:2]:
+        doc[key] = None
+    return doc
+
+
+def best_us(fn, doc, number: int, repeats: int) -> float:
+    return min(timeit.repeat(lambda: fn(doc), number=number, repeat=repeats)) / number * 1e6
+
+
+def bench(number: int = 5000, repeats: int = 5) -> None:
+    cases = [
+        ("turn_plan", load_turn_plan_schema(), PACKAGES / "planning-control" / "schemas" / "turn_plan.schema.json", sample_turn_plan(), validate_turn_plan),
+        ("persona_pack", None, PACKAGES / "persona-core" / "schemas" / "persona_pack.schema.json", sample_persona_pack(), validate_persona_pack),
+    ]
+    print(f"{'schema':<14}{'doc':<8}{'compiled':>10}{'interpreted':>13}{'hand':>9}{'jsonschema':>12}  (us/call)")
+    for name, schema, path, doc, hand in cases:
+        schema = schema or json.loads(path.read_text("utf-8"))
+        compiled = compile_validator(schema, prefix=name)
+        checker = jsonschema.Draft202012Validator(schema) if jsonschema else None
+        for label, sample in (("valid", doc), ("broken", broken(doc))):
+            row = [
+                best_us(compiled, sample, number, repeats),
+                best_us(lambda d: interpret_schema(schema, d), sample, number // 5, repeats),
+                best_us(hand, sample, number, repeats),
+            ]
+            third = f"{best_us(lambda d: list(checker.iter_errors(d)), sample, number // 20, repeats):>12.1f}" if checker else f"{'n/a':>12}"
+            print(f"{name:<14}{label:<8}{row[0]:>10.1f}{row[1]:>13.1f}{row[2]:>9.1f}{third}")
+
+
+if __name__ == "__main__":
+    bench()
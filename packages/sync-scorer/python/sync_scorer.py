@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Sequence
 
 
-def _mean(xs: List[float]) -> float:
-    return sum(xs) / len(xs) if xs else 0.0
+def _mean(xs: Sequence[float]) -> float:
+    return sum(xs) / len(xs) if len(xs) else 0.0
 
 
-def _variance(xs: List[float], mu: float) -> float:
-    if not xs:
+def _variance(xs: Sequence[float], mu: float) -> float:
+    if not len(xs):
         return 0.0
     return sum((x - mu) ** 2 for x in xs) / len(xs)
 
 
-def _pearson_correlation(a: List[float], b: List[float]) -> float:
+def _pearson_correlation(a: Sequence[float], b: Sequence[float]) -> float:
     if len(a) != len(b) or len(a) < 3:
         return 0.0
     mu_a = _mean(a)
@@ -30,7 +30,7 @@ def _pearson_correlation(a: List[float], b: List[float]) -> float:
     return max(-1.0, min(1.0, corr))
 
 
-def _aligned_overlap(a: List[float], b: List[float], shift_steps: int) -> tuple[List[float], List[float]]:
+def _aligned_overlap(a: Sequence[float], b: Sequence[float], shift_steps: int) -> tuple[Sequence[float], Sequence[float]]:
     n = min(len(a), len(b))
     if n == 0:
         return [], []
@@ -56,8 +56,8 @@ def _clamp01(value: float) -> float:
 
 def score_heuristic_window(
     window_id: str,
-    audio_envelope: List[float],
-    mouth_open: List[float],
+    audio_envelope: Sequence[float],
+    mouth_open: Sequence[float],
     step_ms: float,
     max_offset_ms: float = 200,
     offset_step_ms: float = 20,